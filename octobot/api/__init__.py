@@ -26,19 +26,39 @@ from octobot.api.backtesting import (
     is_independent_backtesting_finished,
     is_independent_backtesting_stopped,
     get_independent_backtesting_exchange_manager_ids,
+    get_independent_backtesting_traders_exchange_manager_ids,
+    get_independent_backtesting_data_file_exchange_manager_ids,
+    get_independent_backtesting_traders_profitability,
+    get_independent_backtesting_abort_reason,
     log_independent_backtesting_report,
     initialize_and_run_independent_backtesting,
     join_independent_backtesting,
     initialize_independent_backtesting_config,
     stop_independent_backtesting,
     get_independent_backtesting_report,
+    clear_backtesting_candles_cache,
+    clear_tentacles_index,
 )
 from octobot.api.strategy_optimizer import (
     create_strategy_optimizer,
     find_optimal_configuration,
+    estimate_optimizer_cost,
+    get_optimizer_cost_estimate_report,
+    run_optimizer_worker,
+    create_walk_forward_optimizer,
+    run_walk_forward_optimization,
+    get_walk_forward_report,
+    print_walk_forward_report,
+    load_optimizer_tentacles_parameters,
+    load_optimizer_constraints,
+    create_backtesting_abort_rules,
     print_optimizer_report,
     get_optimizer_report,
     get_optimizer_results,
+    add_optimizer_run_result_listener,
+    remove_optimizer_run_result_listener,
+    get_optimizer_last_run_update,
+    get_optimizer_results_stream,
     get_optimizer_overall_progress,
     is_optimizer_in_progress,
     is_optimizer_computing,
@@ -50,6 +70,9 @@ from octobot.api.strategy_optimizer import (
     get_optimizer_all_risks,
     get_optimizer_trading_mode,
     get_optimizer_is_properly_initialized,
+    get_optimizer_search_strategies,
+    clear_optimizer_results_cache,
+    get_optimizer_default_checkpoint_file,
 )
 
 __all__ = [
@@ -61,17 +84,37 @@ __all__ = [
     "is_independent_backtesting_finished",
     "is_independent_backtesting_stopped",
     "get_independent_backtesting_exchange_manager_ids",
+    "get_independent_backtesting_traders_exchange_manager_ids",
+    "get_independent_backtesting_data_file_exchange_manager_ids",
+    "get_independent_backtesting_traders_profitability",
+    "get_independent_backtesting_abort_reason",
     "log_independent_backtesting_report",
     "initialize_and_run_independent_backtesting",
     "join_independent_backtesting",
     "initialize_independent_backtesting_config",
     "stop_independent_backtesting",
     "get_independent_backtesting_report",
+    "clear_backtesting_candles_cache",
+    "clear_tentacles_index",
     "create_strategy_optimizer",
     "find_optimal_configuration",
+    "estimate_optimizer_cost",
+    "get_optimizer_cost_estimate_report",
+    "run_optimizer_worker",
+    "create_walk_forward_optimizer",
+    "run_walk_forward_optimization",
+    "get_walk_forward_report",
+    "print_walk_forward_report",
+    "load_optimizer_tentacles_parameters",
+    "load_optimizer_constraints",
+    "create_backtesting_abort_rules",
     "print_optimizer_report",
     "get_optimizer_report",
     "get_optimizer_results",
+    "add_optimizer_run_result_listener",
+    "remove_optimizer_run_result_listener",
+    "get_optimizer_last_run_update",
+    "get_optimizer_results_stream",
     "get_optimizer_overall_progress",
     "is_optimizer_in_progress",
     "is_optimizer_computing",
@@ -83,4 +126,7 @@ __all__ = [
     "get_optimizer_all_risks",
     "get_optimizer_trading_mode",
     "get_optimizer_is_properly_initialized",
+    "get_optimizer_search_strategies",
+    "clear_optimizer_results_cache",
+    "get_optimizer_default_checkpoint_file",
 ]
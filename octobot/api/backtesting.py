@@ -21,9 +21,26 @@ def create_independent_backtesting(config,
                                    tentacles_setup_config,
                                    data_files,
                                    data_file_path=constants.BACKTESTING_FILE_PATH,
-                                   run_on_common_part_only=True) -> backtesting.IndependentBacktesting:
+                                   run_on_common_part_only=True,
+                                   use_candles_cache=False,
+                                   evaluations_recording=None,
+                                   traders_settings=None,
+                                   start_timestamp=None,
+                                   end_timestamp=None,
+                                   backtesting_window=None,
+                                   abort_rules=None,
+                                   synthetic_market_path=None) -> backtesting.IndependentBacktesting:
+    if backtesting_window is None and (start_timestamp is not None or end_timestamp is not None):
+        backtesting_window = backtesting.BacktestingWindow(start_timestamp=start_timestamp,
+                                                           end_timestamp=end_timestamp)
     return backtesting.IndependentBacktesting(config, tentacles_setup_config, data_files,
-                                              data_file_path, run_on_common_part_only)
+                                              data_file_path, run_on_common_part_only,
+                                              use_candles_cache=use_candles_cache,
+                                              evaluations_recording=evaluations_recording,
+                                              traders_settings=traders_settings,
+                                              backtesting_window=backtesting_window,
+                                              abort_rules=abort_rules,
+                                              synthetic_market_path=synthetic_market_path)
 
 
 async def initialize_and_run_independent_backtesting(independent_backtesting, log_errors=True) -> None:
@@ -74,5 +91,32 @@ def get_independent_backtesting_exchange_manager_ids(independent_backtesting) ->
     return independent_backtesting.octobot_backtesting.exchange_manager_ids
 
 
+def get_independent_backtesting_traders_exchange_manager_ids(independent_backtesting) -> list:
+    return independent_backtesting.octobot_backtesting.exchange_manager_ids_by_trader
+
+
+def get_independent_backtesting_data_file_exchange_manager_ids(independent_backtesting, data_file) -> list:
+    return independent_backtesting.get_data_file_exchange_manager_ids(data_file)
+
+
+def get_independent_backtesting_traders_profitability(independent_backtesting) -> list:
+    return independent_backtesting.get_traders_profitability()
+
+
+def get_independent_backtesting_abort_reason(independent_backtesting) -> str:
+    return independent_backtesting.get_abort_reason()
+
+
 def log_independent_backtesting_report(independent_backtesting) -> None:
     independent_backtesting.log_report()
+
+
+def clear_tentacles_index() -> None:
+    """
+    Forgets the indexed tentacles classes: to call when tentacles are reloaded
+    """
+    backtesting.TENTACLES_INDEX.clear()
+
+
+def clear_backtesting_candles_cache() -> None:
+    backtesting.CANDLES_CACHE.clear()
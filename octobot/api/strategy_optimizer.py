@@ -13,15 +13,138 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
+import json
+import os
+
+import octobot.backtesting as octobot_backtesting
 import octobot.strategy_optimizer as optimizer
+import octobot.constants as constants
 
 
 def create_strategy_optimizer(config, tentacles_setup_config, strategy_name) -> optimizer.StrategyOptimizer:
     return optimizer.StrategyOptimizer(config, tentacles_setup_config, strategy_name)
 
 
-def find_optimal_configuration(strategy_optimizer, TAs=None, time_frames=None, risks=None) -> None:
-    strategy_optimizer.find_optimal_configuration(TAs=TAs, time_frames=time_frames, risks=risks)
+def find_optimal_configuration(strategy_optimizer, TAs=None, time_frames=None, risks=None,
+                               workers=constants.OPTIMIZER_DEFAULT_WORKERS,
+                               search_strategy=None, budget=None, use_results_cache=False,
+                               checkpoint_file=None, resume=False, replay_evaluations=False,
+                               coordinator_address=None, local_workers=0, racing=False,
+                               backtesting_window=None, tentacles_parameters=None, max_kept_results=None,
+                               constraints=None, abort_rules=None, pre_screening_ratio=None,
+                               batch_data_files=False, monte_carlo_paths=None, fork_server=False) -> None:
+    strategy_optimizer.find_optimal_configuration(TAs=TAs, time_frames=time_frames, risks=risks, workers=workers,
+                                                  search_strategy=search_strategy, budget=budget,
+                                                  use_results_cache=use_results_cache,
+                                                  checkpoint_file=checkpoint_file, resume=resume,
+                                                  replay_evaluations=replay_evaluations,
+                                                  coordinator_address=coordinator_address,
+                                                  local_workers=local_workers,
+                                                  racing=racing,
+                                                  backtesting_window=backtesting_window,
+                                                  tentacles_parameters=tentacles_parameters,
+                                                  max_kept_results=max_kept_results,
+                                                  constraints=constraints,
+                                                  abort_rules=abort_rules,
+                                                  pre_screening_ratio=pre_screening_ratio,
+                                                  batch_data_files=batch_data_files,
+                                                  monte_carlo_paths=monte_carlo_paths,
+                                                  fork_server=fork_server)
+
+
+def estimate_optimizer_cost(strategy_optimizer, TAs=None, time_frames=None, risks=None,
+                            workers=constants.OPTIMIZER_DEFAULT_WORKERS, search_strategy=None, budget=None,
+                            tentacles_parameters=None, constraints=None) -> optimizer.OptimizerCostEstimate:
+    return strategy_optimizer.estimate_cost(TAs=TAs, time_frames=time_frames, risks=risks, workers=workers,
+                                            search_strategy=search_strategy, budget=budget,
+                                            tentacles_parameters=tentacles_parameters, constraints=constraints)
+
+
+def get_optimizer_cost_estimate_report(cost_estimate) -> dict:
+    return cost_estimate.get_report()
+
+
+def create_walk_forward_optimizer(config, tentacles_setup_config, strategy_name,
+                                  windows_count=constants.OPTIMIZER_WALK_FORWARD_WINDOWS_COUNT,
+                                  start_timestamp=None, end_timestamp=None,
+                                  selected_configurations_count=None) -> optimizer.WalkForwardOptimizer:
+    """
+    :param start_timestamp: when given with end_timestamp, windows split this time range instead of each data file
+    :param selected_configurations_count: number of best configurations of each window tested on the next window
+    """
+    windows = optimizer.get_walk_forward_windows(windows_count, start_timestamp=start_timestamp,
+                                                 end_timestamp=end_timestamp)
+    if selected_configurations_count is None:
+        selected_configurations_count = constants.OPTIMIZER_WALK_FORWARD_SELECTED_CONFIGURATIONS_COUNT
+    return optimizer.WalkForwardOptimizer(config, tentacles_setup_config, strategy_name, windows=windows,
+                                          selected_configurations_count=selected_configurations_count)
+
+
+def run_walk_forward_optimization(walk_forward_optimizer, TAs=None, time_frames=None, risks=None,
+                                  workers=constants.OPTIMIZER_DEFAULT_WORKERS,
+                                  search_strategy=None, budget=None, use_results_cache=False,
+                                  replay_evaluations=False, racing=False, tentacles_parameters=None,
+                                  max_kept_results=None, constraints=None, abort_rules=None,
+                                  pre_screening_ratio=None, batch_data_files=False,
+                                  monte_carlo_paths=None) -> None:
+    walk_forward_optimizer.run(workers=workers, TAs=TAs, time_frames=time_frames, risks=risks,
+                               search_strategy=search_strategy, budget=budget, use_results_cache=use_results_cache,
+                               replay_evaluations=replay_evaluations, racing=racing,
+                               tentacles_parameters=tentacles_parameters, max_kept_results=max_kept_results,
+                               constraints=constraints, abort_rules=abort_rules,
+                               pre_screening_ratio=pre_screening_ratio, batch_data_files=batch_data_files,
+                               monte_carlo_paths=monte_carlo_paths)
+
+
+def get_walk_forward_report(walk_forward_optimizer) -> list:
+    return walk_forward_optimizer.get_report()
+
+
+def print_walk_forward_report(walk_forward_optimizer) -> None:
+    walk_forward_optimizer.print_report()
+
+
+def run_optimizer_worker(config, tentacles_setup_config, coordinator_address, slots=1, name=None) -> None:
+    """
+    Runs the jobs of the strategy optimizer coordinator at coordinator_address ("host:port") until it stops
+    """
+    host, port = optimizer.distributed.protocol.parse_address(coordinator_address)
+    optimizer.run_worker(host, port, config, tentacles_setup_config, slots=slots, name=name)
+
+
+def load_optimizer_tentacles_parameters(tentacles_parameters_file) -> dict:
+    """
+    :return: the {tentacle name: {parameter: values}} tentacles parameters to sweep from the given json file
+    """
+    with open(tentacles_parameters_file) as parameters_file:
+        return json.load(parameters_file)
+
+
+def create_backtesting_abort_rules(min_portfolio_ratio=None,
+                                   max_candles_without_order=None) -> octobot_backtesting.BacktestingAbortRules:
+    return octobot_backtesting.BacktestingAbortRules(min_portfolio_ratio=min_portfolio_ratio,
+                                                     max_candles_without_order=max_candles_without_order)
+
+
+def load_optimizer_constraints(constraints_file) -> optimizer.SearchSpaceConstraints:
+    """
+    :return: the SearchSpaceConstraints described in the given json file
+    """
+    with open(constraints_file) as constraints_json:
+        return optimizer.SearchSpaceConstraints.from_dict(json.load(constraints_json))
+
+
+def get_optimizer_default_checkpoint_file(strategy_name) -> str:
+    return os.path.join(constants.OPTIMIZER_CHECKPOINTS_FOLDER, f"{strategy_name}.checkpoint")
+
+
+def clear_optimizer_results_cache() -> None:
+    optimizer.OptimizerResultsCache().clear()
+
+
+def get_optimizer_search_strategies() -> list:
+    return optimizer.search_strategies.get_search_strategy_names()
 
 
 def print_optimizer_report(strategy_optimizer) -> None:
@@ -36,6 +159,46 @@ def get_optimizer_results(strategy_optimizer) -> list:
     return strategy_optimizer.run_results
 
 
+def add_optimizer_run_result_listener(strategy_optimizer, listener) -> None:
+    strategy_optimizer.add_run_result_listener(listener)
+
+
+def remove_optimizer_run_result_listener(strategy_optimizer, listener) -> None:
+    strategy_optimizer.remove_run_result_listener(listener)
+
+
+def get_optimizer_last_run_update(strategy_optimizer) -> dict:
+    return None if strategy_optimizer.last_run_update is None \
+        else strategy_optimizer.last_run_update.get_update_dict()
+
+
+def get_optimizer_results_stream(strategy_optimizer):
+    """
+    :return: an async iterator of the RunResultUpdate of each run produced from now on by the given optimizer,
+    it stops when the optimizer computation is over. The optimizer can run in another thread.
+    """
+    loop = asyncio.get_event_loop()
+    run_updates = asyncio.Queue()
+
+    def _on_run_result(run_update):
+        loop.call_soon_threadsafe(run_updates.put_nowait, run_update)
+
+    # register now to get every result of an optimizer started before the first iteration
+    strategy_optimizer.add_run_result_listener(_on_run_result)
+    return _iterate_run_updates(strategy_optimizer, run_updates, _on_run_result)
+
+
+async def _iterate_run_updates(strategy_optimizer, run_updates, listener):
+    try:
+        while True:
+            run_update = await run_updates.get()
+            if run_update is None:
+                return
+            yield run_update
+    finally:
+        strategy_optimizer.remove_run_result_listener(listener)
+
+
 def get_optimizer_overall_progress(strategy_optimizer) -> int:
     return strategy_optimizer.get_overall_progress()
 
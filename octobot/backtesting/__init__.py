@@ -14,9 +14,40 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+from octobot.backtesting import backtesting_window
+from octobot.backtesting import backtesting_abort_rules
+from octobot.backtesting import synthetic_market_path
+from octobot.backtesting import candles_cache
+from octobot.backtesting import tentacles_index
+from octobot.backtesting import configuration_overlay
+from octobot.backtesting import evaluations_recording
 from octobot.backtesting import abstract_backtesting_test
 from octobot.backtesting import independent_backtesting
 from octobot.backtesting import octobot_backtesting
+from octobot.backtesting.backtesting_window import (
+    BacktestingWindow,
+)
+from octobot.backtesting.backtesting_abort_rules import (
+    BacktestingAbortRules,
+)
+from octobot.backtesting.synthetic_market_path import (
+    SyntheticMarketPath,
+)
+from octobot.backtesting.candles_cache import (
+    CandlesCache,
+    CANDLES_CACHE,
+)
+from octobot.backtesting.tentacles_index import (
+    TentaclesIndex,
+    TENTACLES_INDEX,
+)
+from octobot.backtesting.configuration_overlay import (
+    ConfigurationOverlay,
+    set_shared_base_config,
+)
+from octobot.backtesting.evaluations_recording import (
+    EvaluationsRecording,
+)
 from octobot.backtesting.abstract_backtesting_test import (
     AbstractBacktestingTest,
 )
@@ -28,6 +59,16 @@ from octobot.backtesting.octobot_backtesting import (
 )
 
 __all__ = [
+    "BacktestingWindow",
+    "BacktestingAbortRules",
+    "SyntheticMarketPath",
+    "CandlesCache",
+    "CANDLES_CACHE",
+    "TentaclesIndex",
+    "TENTACLES_INDEX",
+    "ConfigurationOverlay",
+    "set_shared_base_config",
+    "EvaluationsRecording",
     "OctoBotBacktesting",
     "IndependentBacktesting",
     "AbstractBacktestingTest",
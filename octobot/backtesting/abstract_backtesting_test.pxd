@@ -16,7 +16,7 @@
 #  License along with this library.
 
 cdef class AbstractBacktestingTest:
-    cdef dict config
+    cdef object config
     cdef object tentacles_setup_config
     cdef object strategy_evaluator_class
     cdef object logger
@@ -24,7 +24,7 @@ cdef class AbstractBacktestingTest:
     cpdef void initialize_with_strategy(self,
                                         object strategy_evaluator_class,
                                         object tentacles_setup_config,
-                                        dict config)
+                                        object config)
 
-    cdef void _handle_results(self, object independent_backtesting, object profitability)
+    cdef void _handle_results(self, object independent_backtesting, object profitability, object data_file=*)
     cdef void _register_only_strategy(self, object strategy_evaluator_class)
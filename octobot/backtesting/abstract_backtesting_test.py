@@ -18,11 +18,11 @@ import abc
 import os.path as path
 
 import octobot_commons.logging as logging
-import octobot_commons.tentacles_management as tentacles_management
 
 import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_tentacles_manager.constants as tentacles_manager_constants
 
+import octobot.backtesting.tentacles_index as tentacles_index
 import octobot.constants as constants
 
 DEFAULT_SYMBOL = "ICX/BTC"
@@ -178,13 +178,20 @@ class AbstractBacktestingTest:
         raise NotImplementedError("test_up_then_down not implemented")
 
     @abc.abstractmethod
-    def _handle_results(self, independent_backtesting, profitability):
+    def _handle_results(self, independent_backtesting, profitability, data_file=None):
+        """
+        :param data_file: when given, only handle the results of this data file exchange
+        """
         raise NotImplementedError("_handle_results not implemented")
 
     @abc.abstractmethod
     async def _run_backtesting_with_current_config(self, data_file_to_use):
         raise NotImplementedError("_run_backtesting_with_current_config not implemented")
 
+    @abc.abstractmethod
+    async def _run_batched_backtesting_with_current_config(self, data_files_to_use):
+        raise NotImplementedError("_run_batched_backtesting_with_current_config not implemented")
+
     async def _run_and_handle_results(self, data_file, expected_profitability):
         independent_backtesting = None
         try:
@@ -194,6 +201,25 @@ class AbstractBacktestingTest:
             if independent_backtesting is not None:
                 await independent_backtesting.stop()
 
+    async def _run_and_handle_batched_results(self, data_files, expected_profitabilities):
+        """
+        Runs data_files in a single backtesting where each data file exchange has its own simulated exchange and
+        portfolio, then handles the results of each data file
+        :return: False when the backtesting could not start, results are not handled in this case
+        """
+        independent_backtesting = None
+        is_started = False
+        try:
+            independent_backtesting = await self._run_batched_backtesting_with_current_config(data_files)
+            is_started = independent_backtesting is not None and not independent_backtesting.stopped
+            if is_started:
+                for data_file, expected_profitability in zip(data_files, expected_profitabilities):
+                    self._handle_results(independent_backtesting, expected_profitability, data_file=data_file)
+        finally:
+            if independent_backtesting is not None:
+                await independent_backtesting.stop()
+        return is_started
+
     async def run_test_default_run(self, profitability):
         await self._run_and_handle_results(DATA_FILES[DEFAULT_SYMBOL], profitability)
 
@@ -232,15 +258,9 @@ class AbstractBacktestingTest:
 
     def _register_only_strategy(self, strategy_evaluator_class):
         try:
-            import tentacles.Evaluator as Evaluator
-            import octobot_evaluators.evaluators as evaluators
             tentacles_activation = tentacles_manager_api.get_tentacles_activation(self.tentacles_setup_config)
             for evaluator_name in tentacles_activation[tentacles_manager_constants.TENTACLES_EVALUATOR_PATH]:
-                if tentacles_management.get_class_from_string(
-                        evaluator_name,
-                        evaluators.StrategyEvaluator,
-                        Evaluator.Strategies,
-                        tentacles_management.evaluator_parent_inspection) is not None:
+                if tentacles_index.TENTACLES_INDEX.is_strategy(evaluator_name):
                     tentacles_activation[tentacles_manager_constants.TENTACLES_EVALUATOR_PATH][evaluator_name] = False
             tentacles_activation[tentacles_manager_constants.TENTACLES_EVALUATOR_PATH][
                 strategy_evaluator_class.get_name()] = True
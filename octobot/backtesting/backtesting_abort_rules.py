@@ -0,0 +1,61 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+MIN_PORTFOLIO_RATIO = "min_portfolio_ratio"
+MAX_CANDLES_WITHOUT_ORDER = "max_candles_without_order"
+
+
+class BacktestingAbortRules:
+    """
+    BacktestingAbortRules defines when a backtesting is not worth running until the end of its data:
+    - when its portfolio value drops below min_portfolio_ratio of its starting value
+    - when no order has been created after max_candles_without_order candles of its minimum time frame
+    Aborted backtestings stop at the current time and keep their partial results.
+    """
+
+    def __init__(self, min_portfolio_ratio=None, max_candles_without_order=None):
+        if min_portfolio_ratio is not None and not 0 <= min_portfolio_ratio < 1:
+            raise RuntimeError(f"Invalid minimum portfolio ratio: {min_portfolio_ratio}, expected a value in [0, 1[")
+        if max_candles_without_order is not None and max_candles_without_order < 1:
+            raise RuntimeError(f"Invalid maximum candles without order: {max_candles_without_order}")
+        self.min_portfolio_ratio = min_portfolio_ratio
+        self.max_candles_without_order = max_candles_without_order
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+    def to_dict(self):
+        return {
+            MIN_PORTFOLIO_RATIO: self.min_portfolio_ratio,
+            MAX_CANDLES_WITHOUT_ORDER: self.max_candles_without_order,
+        }
+
+    @classmethod
+    def from_dict(cls, rules_dict):
+        return cls(**rules_dict)
+
+    def get_abort_reason(self, candles_count, portfolio_ratio, orders_count):
+        """
+        :param candles_count: number of minimum time frame candles since the backtesting start
+        :param portfolio_ratio: current portfolio value divided by the starting portfolio value
+        :param orders_count: number of orders created since the backtesting start
+        :return: the description of the rule to abort the backtesting for or None when it should go on
+        """
+        if self.min_portfolio_ratio is not None and portfolio_ratio < self.min_portfolio_ratio:
+            return f"portfolio value below {self.min_portfolio_ratio * 100}% of its starting value"
+        if self.max_candles_without_order is not None and not orders_count \
+                and candles_count >= self.max_candles_without_order:
+            return f"no order after {candles_count} candles"
+        return None
@@ -0,0 +1,73 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+TIMESTAMP_INTERVAL_IMPORTER_METHOD = "get_data_timestamp_interval"
+
+
+class BacktestingWindow:
+    """
+    BacktestingWindow restricts a backtesting to a part of its data files time range without copying data.
+    The window is defined by a part of the data time range (from 0 to 1) and can be bounded by timestamps.
+    Data before the window start remain available to importers.
+    """
+
+    def __init__(self, start_ratio=0, end_ratio=1, start_timestamp=None, end_timestamp=None):
+        if not 0 <= start_ratio < end_ratio <= 1:
+            raise RuntimeError(f"Invalid backtesting window ratios: {start_ratio} and {end_ratio}")
+        self.start_ratio = start_ratio
+        self.end_ratio = end_ratio
+        self.start_timestamp = start_timestamp
+        self.end_timestamp = end_timestamp
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+    def to_dict(self):
+        return {
+            "start_ratio": self.start_ratio,
+            "end_ratio": self.end_ratio,
+            "start_timestamp": self.start_timestamp,
+            "end_timestamp": self.end_timestamp,
+        }
+
+    @classmethod
+    def from_dict(cls, window_dict):
+        return cls(**window_dict)
+
+    def get_time_range(self, minimum_timestamp, maximum_timestamp):
+        """
+        :return: the window start and end timestamps within the given data time range
+        """
+        duration = maximum_timestamp - minimum_timestamp
+        start_timestamp = minimum_timestamp + duration * self.start_ratio
+        end_timestamp = minimum_timestamp + duration * self.end_ratio
+        if self.start_timestamp is not None:
+            start_timestamp = max(start_timestamp, self.start_timestamp)
+        if self.end_timestamp is not None:
+            end_timestamp = min(end_timestamp, self.end_timestamp)
+        if start_timestamp >= end_timestamp:
+            raise RuntimeError(f"{self} is outside of data time range: [{minimum_timestamp}, {maximum_timestamp}]")
+        return start_timestamp, end_timestamp
+
+    def register_importer(self, importer):
+        """
+        Makes the importer data time range, used to set backtesting start and end times, match this window
+        """
+        get_data_timestamp_interval = getattr(importer, TIMESTAMP_INTERVAL_IMPORTER_METHOD)
+
+        async def get_window_timestamp_interval(*args, **kwargs):
+            return self.get_time_range(*(await get_data_timestamp_interval(*args, **kwargs)))
+
+        setattr(importer, TIMESTAMP_INTERVAL_IMPORTER_METHOD, get_window_timestamp_interval)
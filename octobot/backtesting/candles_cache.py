@@ -0,0 +1,142 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import inspect
+import os
+
+import octobot_commons.logging as logging
+
+import octobot_backtesting.data as backtesting_data
+
+import octobot.constants as constants
+
+CACHED_IMPORTER_METHODS = ("get_ohlcv", "get_ohlcv_from_timestamps")
+SYMBOL_ARGUMENT = "symbol"
+TIME_FRAME_ARGUMENT = "time_frame"
+
+
+class CandlesCache:
+    """
+    CandlesCache keeps decoded candles read from backtesting data files in memory to share them between
+    backtestings of the same process. Candles are grouped by (data file, symbol, time frame) and groups are
+    evicted in least recently used order when the memory budget is exceeded.
+    Cached candles are shared: they must not be modified.
+    """
+
+    def __init__(self, max_size=constants.BACKTESTING_CANDLES_CACHE_MAX_SIZE):
+        self.logger = logging.get_logger(self.__class__.__name__)
+        self.max_size = max_size
+        self.size = 0
+        self.hits_count = 0
+        self.misses_count = 0
+        # candles read from data files, cache hits excluded
+        self.read_candles_count = 0
+        self._groups = collections.OrderedDict()
+        self._groups_sizes = {}
+        self._file_descriptions = {}
+
+    def register_importer(self, importer):
+        """
+        Makes the importer read candles through this cache
+        """
+        data_file = _get_data_file_identifier(importer.file_path)
+        for method_name in CACHED_IMPORTER_METHODS:
+            method = getattr(importer, method_name, None)
+            if method is not None:
+                setattr(importer, method_name, self._get_cached_method(data_file, method))
+
+    async def get_file_description(self, data_file):
+        data_file_identifier = _get_data_file_identifier(data_file)
+        if data_file_identifier not in self._file_descriptions:
+            description = await backtesting_data.get_file_description(data_file)
+            if description is None:
+                # do not cache invalid files
+                return None
+            self._file_descriptions[data_file_identifier] = description
+        return self._file_descriptions[data_file_identifier]
+
+    def clear(self):
+        self._groups.clear()
+        self._groups_sizes.clear()
+        self._file_descriptions.clear()
+        self.size = 0
+
+    def _get_cached_method(self, data_file, method):
+        signature = inspect.signature(method)
+
+        async def cached_method(*args, **kwargs):
+            try:
+                arguments = signature.bind(*args, **kwargs)
+                arguments.apply_defaults()
+                group_key = (data_file,
+                             arguments.arguments.get(SYMBOL_ARGUMENT),
+                             arguments.arguments.get(TIME_FRAME_ARGUMENT))
+                call_key = (method.__name__, tuple(sorted(arguments.arguments.items())))
+                hash(call_key)
+            except TypeError:
+                # unexpected or unhashable arguments: can't be cached
+                return await method(*args, **kwargs)
+            group = self._get_group(group_key)
+            if call_key in group:
+                self.hits_count += 1
+                return group[call_key]
+            self.misses_count += 1
+            candles = await method(*args, **kwargs)
+            self.read_candles_count += _get_candles_count(candles)
+            self._add(group_key, call_key, candles)
+            return candles
+
+        return cached_method
+
+    def _get_group(self, group_key):
+        if group_key in self._groups:
+            self._groups.move_to_end(group_key)
+        else:
+            self._groups[group_key] = {}
+            self._groups_sizes[group_key] = 0
+        return self._groups[group_key]
+
+    def _add(self, group_key, call_key, candles):
+        candles_size = _get_estimated_size(candles)
+        self._groups[group_key][call_key] = candles
+        self._groups_sizes[group_key] += candles_size
+        self.size += candles_size
+        # keep at least the currently used group
+        while self.size > self.max_size and len(self._groups) > 1:
+            evicted_group_key, _ = self._groups.popitem(last=False)
+            self.size -= self._groups_sizes.pop(evicted_group_key)
+
+
+def _get_data_file_identifier(data_file):
+    try:
+        file_stat = os.stat(data_file)
+        return os.path.realpath(data_file), file_stat.st_mtime, file_stat.st_size
+    except OSError:
+        return data_file, None, None
+
+
+def _get_candles_count(candles):
+    try:
+        return len(candles)
+    except TypeError:
+        return 0
+
+
+def _get_estimated_size(candles):
+    return max(1, _get_candles_count(candles)) * constants.BACKTESTING_CANDLES_CACHE_ESTIMATED_CANDLE_SIZE
+
+
+CANDLES_CACHE = CandlesCache()
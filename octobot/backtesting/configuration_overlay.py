@@ -0,0 +1,90 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections.abc
+
+# base configuration available in every process using this module: overlays on top of it are pickled without it
+_SHARED_BASE_CONFIG = None
+
+
+def set_shared_base_config(base_config):
+    """
+    Overlays of base_config are only pickled with their overrides, base_config has to be shared with the processes
+    unpickling them before, None to pickle every overlay with its base configuration
+    """
+    global _SHARED_BASE_CONFIG
+    _SHARED_BASE_CONFIG = base_config
+
+
+def _create_shared_base_config_overlay(overrides):
+    if _SHARED_BASE_CONFIG is None:
+        raise RuntimeError("No shared base configuration in this process: set_shared_base_config has to be called "
+                           "before unpickling configuration overlays without base configuration")
+    return ConfigurationOverlay(_SHARED_BASE_CONFIG, overrides)
+
+
+class ConfigurationOverlay(collections.abc.Mapping):
+    """
+    ConfigurationOverlay is a read-only view of a configuration dict where some values are overridden.
+    Overrides are given by keys path, ex: {("trading", "risk"): 0.5}. The base configuration is shared and never
+    copied: values read from the overlay must not be modified.
+    """
+
+    def __init__(self, base_config, overrides=None):
+        self.base_config = base_config
+        self.overrides = dict(overrides or {})
+        self._values = {}
+        self._nested_overrides = {}
+        for keys_path, value in (overrides or {}).items():
+            if len(keys_path) == 1:
+                self._values[keys_path[0]] = value
+            else:
+                self._nested_overrides.setdefault(keys_path[0], {})[keys_path[1:]] = value
+        for key, nested_overrides in self._nested_overrides.items():
+            if key not in self._values:
+                self._values[key] = ConfigurationOverlay(self.base_config.get(key, {}), nested_overrides)
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            return self.base_config[key]
+
+    def __iter__(self):
+        yield from self._values
+        for key in self.base_config:
+            if key not in self._values:
+                yield key
+
+    def __len__(self):
+        return len(self._values) + sum(1 for key in self.base_config if key not in self._values)
+
+    def __reduce__(self):
+        if self.base_config is _SHARED_BASE_CONFIG:
+            # the base configuration is already shared with the unpickling process: only send the overrides
+            return _create_shared_base_config_overlay, (self.overrides,)
+        return ConfigurationOverlay, (self.base_config, self.overrides)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+    def to_dict(self):
+        """
+        :return: a dict of this overlay where overridden elements are new dicts and others are shared
+        """
+        config = dict(self.base_config)
+        for key, value in self._values.items():
+            config[key] = value.to_dict() if isinstance(value, ConfigurationOverlay) else value
+        return config
@@ -0,0 +1,169 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import pickle
+
+import async_channel.enums as channel_enums
+
+import octobot_commons.channels_name as channels_name
+import octobot_commons.logging as common_logging
+
+import octobot_evaluators.evaluators.channel as evaluator_channels
+
+import octobot_trading.api as trading_api
+import octobot_trading.exchange_channel as exchanges_channel
+
+RECORDING_VERSION = 1
+VERSION = "version"
+NOTES = "notes"
+EVALUATOR_NAME_INDEX = 1
+
+
+class EvaluationsRecording:
+    """
+    EvaluationsRecording stores the evaluation matrix stream of a backtesting run (every evaluation note published
+    on the matrix channel with its backtesting time) to be able to replay it in a later backtesting run on the
+    same data without creating any evaluator.
+    Replaying is only relevant when the replayed run uses the same evaluators, evaluators configuration,
+    time frames and data file as the recorded one: only the trading layer (risk, trading mode) can differ.
+    An incomplete recording can also replay the notes of some evaluators while recording the other evaluators notes.
+    """
+
+    def __init__(self):
+        self.logger = common_logging.get_logger(self.__class__.__name__)
+        self.notes = []
+        self.is_complete = False
+        self._exchange_manager = None
+        self._matrix_id = None
+        self._replayed_notes_count = 0
+        # evaluators which notes are replayed while recording
+        self.replayed_evaluators = []
+        self._replayed_notes = []
+
+    def is_replay(self):
+        return self.is_complete
+
+    def add_replayed_evaluator(self, evaluator_name, evaluator_recording):
+        """
+        Replays the notes of evaluator_name from evaluator_recording while recording the other evaluators notes
+        """
+        self.replayed_evaluators.append(evaluator_name)
+        # sorting is stable: notes of the same time keep their recorded order
+        self._replayed_notes = sorted(self._replayed_notes + evaluator_recording.notes, key=lambda note: note[0])
+
+    def get_evaluator_recording(self, evaluator_name):
+        """
+        :return: a recording of the notes of evaluator_name only
+        """
+        recording = EvaluationsRecording()
+        recording.notes = [note for note in self.notes if note[EVALUATOR_NAME_INDEX] == evaluator_name]
+        recording.is_complete = self.is_complete
+        return recording
+
+    async def start(self, matrix_id, exchange_manager_id):
+        """
+        Records the matrix channel notes when this recording is not complete, replays them otherwise.
+        Notes of replayed evaluators are replayed in both cases.
+        """
+        self._matrix_id = matrix_id
+        self._exchange_manager = trading_api.get_exchange_manager_from_exchange_id(exchange_manager_id)
+        if self.is_complete or self.replayed_evaluators:
+            self._replayed_notes_count = 0
+            await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.OHLCV_CHANNEL.value,
+                                             exchange_manager_id).new_consumer(
+                self.ohlcv_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.HIGH.value
+            )
+        if not self.is_complete:
+            self.notes = []
+            await evaluator_channels.get_chan(channels_name.OctoBotEvaluatorsChannelsName.MATRIX_CHANNEL.value,
+                                              matrix_id).new_consumer(
+                self.matrix_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.HIGH.value
+            )
+
+    def stop(self, completed):
+        if not self.is_complete:
+            self.is_complete = completed
+        self._exchange_manager = None
+
+    async def matrix_callback(self, matrix_id, evaluator_name, evaluator_type, eval_note, eval_note_type,
+                              exchange_name, cryptocurrency, symbol, time_frame):
+        self.add_note(trading_api.get_exchange_current_time(self._exchange_manager),
+                      evaluator_name, evaluator_type, eval_note, eval_note_type,
+                      exchange_name, cryptocurrency, symbol, time_frame)
+
+    async def ohlcv_callback(self, exchange, exchange_id, cryptocurrency, symbol, time_frame, candle):
+        producer = evaluator_channels.get_chan(channels_name.OctoBotEvaluatorsChannelsName.MATRIX_CHANNEL.value,
+                                               self._matrix_id).get_internal_producer()
+        for note in self.pop_notes_until(trading_api.get_exchange_current_time(self._exchange_manager)):
+            timestamp, evaluator_name, evaluator_type, eval_note, eval_note_type, \
+                exchange_name, cryptocurrency, symbol, time_frame = note
+            await producer.send_eval_note(matrix_id=self._matrix_id,
+                                          evaluator_name=evaluator_name,
+                                          evaluator_type=evaluator_type,
+                                          eval_note=eval_note,
+                                          eval_note_type=eval_note_type,
+                                          eval_time=timestamp,
+                                          exchange_name=exchange_name,
+                                          cryptocurrency=cryptocurrency,
+                                          symbol=symbol,
+                                          time_frame=time_frame)
+
+    def add_note(self, timestamp, evaluator_name, evaluator_type, eval_note, eval_note_type,
+                 exchange_name, cryptocurrency, symbol, time_frame):
+        self.notes.append((timestamp, evaluator_name, evaluator_type, eval_note, eval_note_type,
+                           exchange_name, cryptocurrency, symbol, time_frame))
+
+    def pop_notes_until(self, timestamp):
+        """
+        :return: the not yet replayed notes recorded up to the given timestamp
+        """
+        # while recording, only the notes of the replayed evaluators are replayed
+        replayed_notes = self._replayed_notes if self.replayed_evaluators and not self.is_complete else self.notes
+        # notes are recorded following the backtesting time: they are sorted by timestamp
+        last_index = self._replayed_notes_count
+        while last_index < len(replayed_notes) and replayed_notes[last_index][0] <= timestamp:
+            last_index += 1
+        notes = replayed_notes[self._replayed_notes_count:last_index]
+        self._replayed_notes_count = last_index
+        return notes
+
+    def save(self, recording_file):
+        if not self.is_complete:
+            raise RuntimeError("Only complete evaluations recordings can be saved")
+        os.makedirs(os.path.dirname(recording_file) or ".", exist_ok=True)
+        # write then rename to never expose partially written recordings to other processes
+        temp_path = f"{recording_file}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            pickle.dump({VERSION: RECORDING_VERSION, NOTES: self.notes}, file)
+        os.replace(temp_path, recording_file)
+
+    def load(self, recording_file):
+        """
+        :return: True when a complete recording has been loaded
+        """
+        try:
+            with open(recording_file, "rb") as file:
+                content = pickle.load(file)
+            if content[VERSION] != RECORDING_VERSION:
+                return False
+            self.notes = content[NOTES]
+            self.is_complete = True
+            return True
+        except FileNotFoundError:
+            return False
+        except (pickle.UnpicklingError, EOFError, KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring invalid evaluations recording {recording_file}: {e}")
+            return False
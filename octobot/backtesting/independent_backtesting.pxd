@@ -21,7 +21,7 @@ cimport octobot.backtesting.octobot_backtesting as octobot_backtesting
 cdef class IndependentBacktesting:
     cdef list forced_time_frames
 
-    cdef public dict octobot_origin_config
+    cdef public object octobot_origin_config
     cdef public dict backtesting_config
     cdef public object tentacles_setup_config
     cdef public list backtesting_files
@@ -30,10 +30,12 @@ cdef class IndependentBacktesting:
 
     cdef public str data_file_path
     cdef public dict symbols_to_create_exchange_classes
+    cdef public dict exchange_names_by_data_file
     cdef public double risk
     cdef public dict starting_portfolio
     cdef public dict fees_config
     cdef public bint stopped
+    cdef public bint use_candles_cache
 
     cdef public object post_backtesting_task
 
@@ -41,6 +43,8 @@ cdef class IndependentBacktesting:
 
     cpdef bint is_in_progress(self)
     cpdef double get_progress(self)
+    cpdef object get_abort_reason(self)
+    cpdef list get_data_file_exchange_manager_ids(self, str data_file)
     cpdef void log_report(self)
 
     cdef void _post_backtesting_start(self)
@@ -26,6 +26,7 @@ import octobot_commons.symbol_util as symbol_util
 import octobot_commons.time_frame_manager as time_frame_manager
 
 import octobot.backtesting as backtesting
+import octobot.backtesting.candles_cache as candles_cache
 import octobot_backtesting.api as backtesting_api
 import octobot_backtesting.constants as backtesting_constants
 import octobot_backtesting.enums as backtesting_enums
@@ -41,7 +42,13 @@ class IndependentBacktesting:
                  tentacles_setup_config,
                  backtesting_files,
                  data_file_path=backtesting_constants.BACKTESTING_FILE_PATH,
-                 run_on_common_part_only=True):
+                 run_on_common_part_only=True,
+                 use_candles_cache=False,
+                 evaluations_recording=None,
+                 traders_settings=None,
+                 backtesting_window=None,
+                 abort_rules=None,
+                 synthetic_market_path=None):
         self.octobot_origin_config = config
         self.tentacles_setup_config = tentacles_setup_config
         self.backtesting_config = {}
@@ -49,6 +56,7 @@ class IndependentBacktesting:
         self.logger = logging.get_logger(self.__class__.__name__)
         self.data_file_path = data_file_path
         self.symbols_to_create_exchange_classes = {}
+        self.exchange_names_by_data_file = {}
         self.risk = 0.1
         self.starting_portfolio = {}
         self.fees_config = {}
@@ -56,11 +64,18 @@ class IndependentBacktesting:
         self._init_default_config_values()
         self.stopped = False
         self.post_backtesting_task = None
+        self.use_candles_cache = use_candles_cache
         self.octobot_backtesting = backtesting.OctoBotBacktesting(self.backtesting_config,
                                                                   self.tentacles_setup_config,
                                                                   self.symbols_to_create_exchange_classes,
                                                                   self.backtesting_files,
-                                                                  run_on_common_part_only)
+                                                                  run_on_common_part_only,
+                                                                  use_candles_cache=use_candles_cache,
+                                                                  evaluations_recording=evaluations_recording,
+                                                                  traders_settings=traders_settings,
+                                                                  backtesting_window=backtesting_window,
+                                                                  abort_rules=abort_rules,
+                                                                  synthetic_market_path=synthetic_market_path)
 
     async def initialize_and_run(self, log_errors=True):
         try:
@@ -103,6 +118,26 @@ class IndependentBacktesting:
         else:
             return 0
 
+    def get_abort_reason(self):
+        """
+        :return: the description of the abort rule that stopped this backtesting before the end of its data, results
+        are partial in this case. None when the backtesting was not aborted
+        """
+        return self.octobot_backtesting.abort_reason
+
+    def get_data_file_exchange_manager_ids(self, data_file):
+        """
+        :return: the ids of the exchange managers simulating the exchange of the given data file
+        """
+        exchange_name = self.exchange_names_by_data_file.get(data_file)
+        return [
+            exchange_manager_id
+            for exchange_manager_id, exchange_manager in zip(
+                self.octobot_backtesting.exchange_manager_ids,
+                trading_api.get_exchange_managers_from_exchange_ids(self.octobot_backtesting.exchange_manager_ids))
+            if trading_api.get_exchange_name(exchange_manager) == exchange_name
+        ]
+
     def _post_backtesting_start(self):
         logging.reset_backtesting_errors()
         logging.set_error_publication_enabled(False)
@@ -135,10 +170,13 @@ class IndependentBacktesting:
 
     async def _register_available_data(self):
         for data_file in self.backtesting_files:
-            description = await backtesting_data.get_file_description(path.join(self.data_file_path, data_file))
+            data_file_path = path.join(self.data_file_path, data_file)
+            description = await candles_cache.CANDLES_CACHE.get_file_description(data_file_path) \
+                if self.use_candles_cache else await backtesting_data.get_file_description(data_file_path)
             if description is None:
                 raise RuntimeError(f"Impossible to start backtesting: missing or invalid data file: {data_file}")
             exchange_name = description[backtesting_enums.DataFormatKeys.EXCHANGE.value]
+            self.exchange_names_by_data_file[data_file] = exchange_name
             if exchange_name not in self.symbols_to_create_exchange_classes:
                 self.symbols_to_create_exchange_classes[exchange_name] = []
             for symbol in description[backtesting_enums.DataFormatKeys.SYMBOLS.value]:
@@ -173,6 +211,21 @@ class IndependentBacktesting:
         report = self._get_exchanges_report(reference_market, trading_mode)
         return report
 
+    def get_traders_profitability(self):
+        """
+        :return: a list with one {exchange_name: (profitability, market_average_profitability)} dict per trader
+        """
+        traders_profitability = []
+        for exchange_manager_ids in self.octobot_backtesting.exchange_manager_ids_by_trader:
+            trader_profitability = {}
+            for exchange_manager in trading_api.get_exchange_managers_from_exchange_ids(exchange_manager_ids):
+                _, profitability, _, market_average_profitability, _ = \
+                    trading_api.get_profitability_stats(exchange_manager)
+                trader_profitability[trading_api.get_exchange_name(exchange_manager)] = \
+                    (profitability, market_average_profitability)
+            traders_profitability.append(trader_profitability)
+        return traders_profitability
+
     def _get_exchanges_report(self, reference_market, trading_mode):
         SYMBOL_REPORT = "symbol_report"
         BOT_REPORT = "bot_report"
@@ -188,7 +241,8 @@ class IndependentBacktesting:
         market_average_profitabilities = {}
         starting_portfolios = {}
         end_portfolios = {}
-        for exchange_id in self.octobot_backtesting.exchange_manager_ids:
+        # report is indexed by exchange name: only use the first trader exchanges
+        for exchange_id in self.octobot_backtesting.exchange_manager_ids_by_trader[0]:
             exchange_manager = trading_api.get_exchange_manager_from_exchange_id(exchange_id)
             _, profitability, _, market_average_profitability, _ = trading_api.get_profitability_stats(exchange_manager)
             min_timeframe = time_frame_manager.find_min_time_frame(trading_api.get_watched_timeframes(exchange_manager))
@@ -32,8 +32,19 @@ cdef class OctoBotBacktesting:
     cdef public list backtesting_files
     cdef public object backtesting
     cdef public bint run_on_common_part_only
+    cdef public bint use_candles_cache
+    cdef public object evaluations_recording
+    cdef public object backtesting_window
+    cdef public object synthetic_market_path
+    cdef public list traders_settings
+    cdef public list exchange_manager_ids_by_trader
+    cdef public object abort_rules
+    cdef public object abort_reason
+    cdef str _abort_rules_time_frame
+    cdef object _abort_rules_candles_counts
 
     cpdef void memory_leak_checkup(self, list to_check_elements)
     cpdef void check_remaining_objects(self)
 
+cdef tuple _get_portfolio_ratio_and_orders_count(object exchange_manager)
 cdef str _get_remaining_object_error(object obj, int expected, tuple actual)
@@ -13,12 +13,19 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import collections
+import copy
 import uuid
 import gc
 import sys
 import asyncio
 
+import async_channel.enums as channel_enums
+
+import octobot_commons.channels_name as channels_name
+import octobot_commons.constants as common_constants
 import octobot_commons.logging as logging
+import octobot_commons.time_frame_manager as time_frame_manager
 
 import octobot_backtesting.api as backtesting_api
 import octobot_backtesting.importers as importers
@@ -27,11 +34,16 @@ import octobot_evaluators.api as evaluator_api
 
 import octobot_services.api as service_api
 
+import octobot_tentacles_manager.api as tentacles_manager_api
+import octobot_tentacles_manager.constants as tentacles_manager_constants
+
 import octobot_trading.exchanges as exchanges
+import octobot_trading.exchange_channel as exchanges_channel
 import octobot_trading.exchange_data as exchange_data
 import octobot_trading.api as trading_api
 
 import octobot.logger as logger
+import octobot.backtesting.candles_cache as candles_cache
 
 
 class OctoBotBacktesting:
@@ -40,7 +52,13 @@ class OctoBotBacktesting:
                  tentacles_setup_config,
                  symbols_to_create_exchange_classes,
                  backtesting_files,
-                 run_on_common_part_only):
+                 run_on_common_part_only,
+                 use_candles_cache=False,
+                 evaluations_recording=None,
+                 traders_settings=None,
+                 backtesting_window=None,
+                 abort_rules=None,
+                 synthetic_market_path=None):
         self.logger = logging.get_logger(self.__class__.__name__)
         self.backtesting_config = backtesting_config
         self.tentacles_setup_config = tentacles_setup_config
@@ -53,14 +71,31 @@ class OctoBotBacktesting:
         self.backtesting_files = backtesting_files
         self.backtesting = None
         self.run_on_common_part_only = run_on_common_part_only
+        self.use_candles_cache = use_candles_cache
+        self.evaluations_recording = evaluations_recording
+        self.backtesting_window = backtesting_window
+        self.synthetic_market_path = synthetic_market_path
+        # each trader settings dict can override the risk, starting portfolio and fees of the backtesting config
+        self.traders_settings = traders_settings or [{}]
+        self.exchange_manager_ids_by_trader = [[] for _ in self.traders_settings]
+        self.abort_rules = abort_rules
+        # description of the abort rule that stopped this backtesting before the end of its data
+        self.abort_reason = None
+        self._abort_rules_time_frame = None
+        self._abort_rules_candles_counts = collections.Counter()
 
     async def initialize_and_run(self):
         self.logger.info(f"Starting on {self.backtesting_files} with {self.symbols_to_create_exchange_classes}")
         await self._init_evaluators()
         await self._init_service_feeds()
         await self._init_exchanges()
-        await self._create_evaluators()
+        if self.evaluations_recording is None:
+            await self._create_evaluators()
+        else:
+            await self._start_evaluations_recording()
         await self._create_service_feeds()
+        if self.abort_rules is not None:
+            await self._start_abort_rules()
         await backtesting_api.start_backtesting(self.backtesting)
         if logger.BOT_CHANNEL_LOGGER is not None:
             await self.start_loggers()
@@ -75,6 +110,8 @@ class OctoBotBacktesting:
         self.logger.info(f"Stopping for {self.backtesting_files} with {self.symbols_to_create_exchange_classes}")
         try:
             await backtesting_api.stop_backtesting(self.backtesting)
+            if self.evaluations_recording is not None:
+                self.evaluations_recording.stop(False)
             exchange_managers = []
             try:
                 for exchange_manager in trading_api.get_exchange_managers_from_exchange_ids(self.exchange_manager_ids):
@@ -108,6 +145,8 @@ class OctoBotBacktesting:
                 # (references to coroutine and caller objects are kept while in async loop)
                 asyncio.get_event_loop().call_soon(self.memory_leak_checkup, to_reference_check)
             self.backtesting = None
+            # stopped evaluators are not used anymore: let them be released with their exchange managers
+            self.evaluators = []
 
     def memory_leak_checkup(self, to_check_elements):
         self.logger.debug(f"Memory leak checking {[e.__class__.__name__ for e in to_check_elements]}")
@@ -171,10 +210,12 @@ class OctoBotBacktesting:
         self.service_feeds = [service_feed_factory.create_service_feed(feed)
                               for feed in service_feed_factory.get_available_service_feeds(True)]
 
-    async def _create_evaluators(self):
-        for exchange_id in self.exchange_manager_ids:
+    async def _create_evaluators(self, relevant_evaluators=common_constants.CONFIG_WILDCARD):
+        # evaluators are shared by every trader: only create them for the first trader exchanges
+        for exchange_id in self.exchange_manager_ids_by_trader[0]:
             exchange_configuration = trading_api.get_exchange_configuration_from_exchange_id(exchange_id)
-            self.evaluators = await evaluator_api.create_all_type_evaluators(
+            # keep the evaluators of each exchange to stop them all
+            self.evaluators += await evaluator_api.create_all_type_evaluators(
                 self.tentacles_setup_config,
                 matrix_id=self.matrix_id,
                 exchange_name=exchange_configuration.exchange_name,
@@ -182,7 +223,51 @@ class OctoBotBacktesting:
                 symbols_by_crypto_currencies=exchange_configuration.symbols_by_crypto_currencies,
                 symbols=exchange_configuration.symbols,
                 time_frames=exchange_configuration.time_frames_without_real_time,
-                real_time_time_frames=exchange_configuration.real_time_time_frames)
+                real_time_time_frames=exchange_configuration.real_time_time_frames,
+                relevant_evaluators=relevant_evaluators)
+
+    async def _start_evaluations_recording(self):
+        # replayed evaluations are pushed without any evaluator: only create evaluators when recording
+        if not self.evaluations_recording.is_replay():
+            await self._create_evaluators(self._get_not_replayed_evaluators())
+        # evaluations are timestamped using the first exchange time: every exchange shares the backtesting time
+        await self.evaluations_recording.start(self.matrix_id, self.exchange_manager_ids[0])
+
+    def _get_not_replayed_evaluators(self):
+        if not self.evaluations_recording.replayed_evaluators:
+            return common_constants.CONFIG_WILDCARD
+        return [
+            evaluator_name
+            for evaluator_name in tentacles_manager_api.get_tentacles_activation(self.tentacles_setup_config)[
+                tentacles_manager_constants.TENTACLES_EVALUATOR_PATH]
+            if evaluator_name not in self.evaluations_recording.replayed_evaluators
+        ]
+
+    async def _start_abort_rules(self):
+        # every exchange shares the backtesting time: count candles using the first one
+        exchange_manager = trading_api.get_exchange_manager_from_exchange_id(self.exchange_manager_ids[0])
+        self._abort_rules_time_frame = time_frame_manager.find_min_time_frame(
+            trading_api.get_watched_timeframes(exchange_manager)).value
+        await exchanges_channel.get_chan(channels_name.OctoBotTradingChannelsName.OHLCV_CHANNEL.value,
+                                         self.exchange_manager_ids[0]).new_consumer(
+            self.abort_rules_ohlcv_callback, priority_level=channel_enums.ChannelConsumerPriorityLevels.LOW.value
+        )
+
+    async def abort_rules_ohlcv_callback(self, exchange, exchange_id, cryptocurrency, symbol, time_frame, candle):
+        if self.abort_reason is not None or getattr(time_frame, "value", time_frame) != self._abort_rules_time_frame:
+            return
+        self._abort_rules_candles_counts[symbol] += 1
+        candles_count = max(self._abort_rules_candles_counts.values())
+        abort_reasons = [
+            self.abort_rules.get_abort_reason(candles_count, *_get_portfolio_ratio_and_orders_count(exchange_manager))
+            for exchange_manager in trading_api.get_exchange_managers_from_exchange_ids(self.exchange_manager_ids)
+        ]
+        # the backtesting is shared by every exchange: only abort it when none of them is worth running
+        if abort_reasons and all(abort_reasons):
+            self.abort_reason = abort_reasons[0]
+            self.logger.debug(f"Aborting backtesting on {self.backtesting_files}: {self.abort_reason}")
+            # end the backtesting at the current time: the time updater stops after this iteration
+            self.backtesting.time_manager.finishing_timestamp = self.backtesting.time_manager.current_timestamp
 
     async def _create_service_feeds(self):
         for feed in self.service_feeds:
@@ -195,6 +280,15 @@ class OctoBotBacktesting:
                                                                         exchange_ids=self.exchange_manager_ids,
                                                                         matrix_id=self.matrix_id,
                                                                         data_files=self.backtesting_files)
+        if self.use_candles_cache:
+            for importer in backtesting_api.get_importers(self.backtesting):
+                candles_cache.CANDLES_CACHE.register_importer(importer)
+        if self.backtesting_window is not None:
+            for importer in backtesting_api.get_importers(self.backtesting):
+                self.backtesting_window.register_importer(importer)
+        if self.synthetic_market_path is not None:
+            for importer in backtesting_api.get_importers(self.backtesting):
+                self.synthetic_market_path.register_importer(importer)
         # modify_backtesting_channels before creating exchanges as they require the current backtesting time to
         # initialize
         await backtesting_api.adapt_backtesting_channels(self.backtesting,
@@ -203,18 +297,37 @@ class OctoBotBacktesting:
                                                          run_on_common_part_only=self.run_on_common_part_only)
 
         for exchange_class_string in self.symbols_to_create_exchange_classes.keys():
-            exchange_builder = trading_api.create_exchange_builder(self.backtesting_config, exchange_class_string) \
-                .has_matrix(self.matrix_id) \
-                .use_tentacles_setup_config(self.tentacles_setup_config) \
-                .set_bot_id(self.bot_id) \
-                .is_simulated() \
-                .is_rest_only() \
-                .is_backtesting(self.backtesting)
-            try:
-                await exchange_builder.build()
-            finally:
-                # always save exchange manager ids and backtesting instances
-                self.exchange_manager_ids.append(trading_api.get_exchange_manager_id(exchange_builder.exchange_manager))
+            # every trader is attached to the same backtesting and evaluation matrix
+            for trader_index, trader_settings in enumerate(self.traders_settings):
+                exchange_builder = trading_api.create_exchange_builder(self._get_trader_config(trader_settings),
+                                                                       exchange_class_string) \
+                    .has_matrix(self.matrix_id) \
+                    .use_tentacles_setup_config(self.tentacles_setup_config) \
+                    .set_bot_id(self.bot_id) \
+                    .is_simulated() \
+                    .is_rest_only() \
+                    .is_backtesting(self.backtesting)
+                try:
+                    await exchange_builder.build()
+                finally:
+                    # always save exchange manager ids and backtesting instances
+                    exchange_manager_id = trading_api.get_exchange_manager_id(exchange_builder.exchange_manager)
+                    self.exchange_manager_ids.append(exchange_manager_id)
+                    self.exchange_manager_ids_by_trader[trader_index].append(exchange_manager_id)
+
+    def _get_trader_config(self, trader_settings):
+        if not trader_settings:
+            return self.backtesting_config
+        config = copy.copy(self.backtesting_config)
+        config[common_constants.CONFIG_TRADING] = copy.copy(config[common_constants.CONFIG_TRADING])
+        config[common_constants.CONFIG_SIMULATOR] = copy.copy(config[common_constants.CONFIG_SIMULATOR])
+        if common_constants.CONFIG_TRADER_RISK in trader_settings:
+            config[common_constants.CONFIG_TRADING][common_constants.CONFIG_TRADER_RISK] = \
+                trader_settings[common_constants.CONFIG_TRADER_RISK]
+        for simulator_key in (common_constants.CONFIG_STARTING_PORTFOLIO, common_constants.CONFIG_SIMULATOR_FEES):
+            if simulator_key in trader_settings:
+                config[common_constants.CONFIG_SIMULATOR][simulator_key] = trader_settings[simulator_key]
+        return config
 
     async def start_loggers(self):
         await self.start_exchange_loggers()
@@ -225,6 +338,12 @@ class OctoBotBacktesting:
             await logger.init_exchange_chan_logger(exchange_manager_id)
 
 
+def _get_portfolio_ratio_and_orders_count(exchange_manager):
+    _, profitability_percent, _, _, _ = trading_api.get_profitability_stats(exchange_manager)
+    return 1 + profitability_percent / 100, \
+        len(trading_api.get_trade_history(exchange_manager)) + len(trading_api.get_open_orders(exchange_manager))
+
+
 def _get_remaining_object_error(obj, expected, actual):
     error = f"too many remaining {obj.__name__} instances: expected: {expected} actual {actual[0]}"
     for i in range(len(actual[1])):
@@ -0,0 +1,184 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import inspect
+import os
+import zlib
+
+import numpy
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+import octobot_commons.time_frame_manager as time_frame_manager
+
+import octobot_backtesting.api as backtesting_api
+
+import octobot.constants as constants
+
+SYNTHETIC_IMPORTER_METHODS = ("get_ohlcv", "get_ohlcv_from_timestamps")
+SYMBOL_ARGUMENT = "symbol"
+TIME_FRAME_ARGUMENT = "time_frame"
+TIME_INDEX = commons_enums.PriceIndexes.IND_PRICE_TIME.value
+CLOSE_INDEX = commons_enums.PriceIndexes.IND_PRICE_CLOSE.value
+PRICE_INDEXES = [
+    commons_enums.PriceIndexes.IND_PRICE_OPEN.value,
+    commons_enums.PriceIndexes.IND_PRICE_HIGH.value,
+    commons_enums.PriceIndexes.IND_PRICE_LOW.value,
+    CLOSE_INDEX,
+]
+
+# {(data file, symbol, paths count, block size, seed): (close times, price factors of every path)}
+_PRICE_FACTORS = collections.OrderedDict()
+
+
+class SyntheticMarketPath:
+    """
+    SyntheticMarketPath makes backtesting importers return the candles of one of paths_count synthetic market paths
+    generated by block bootstrap of the data file returns. The paths of a data file symbol are generated together
+    from its shortest time frame closes and kept in memory: data files are never copied.
+    Candles of every time frame are scaled by the synthetic to historical price ratio at their close time.
+    """
+
+    def __init__(self, index, paths_count, block_size=constants.BACKTESTING_SYNTHETIC_PATHS_BLOCK_SIZE, seed=0):
+        if not 0 <= index < paths_count:
+            raise RuntimeError(f"Invalid synthetic market path index: {index}, expected a value in "
+                               f"[0, {paths_count}[")
+        if block_size < 1:
+            raise RuntimeError(f"Invalid synthetic market path block size: {block_size}")
+        self.index = index
+        self.paths_count = paths_count
+        self.block_size = block_size
+        self.seed = seed
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+    def to_dict(self):
+        return {
+            "index": self.index,
+            "paths_count": self.paths_count,
+            "block_size": self.block_size,
+            "seed": self.seed,
+        }
+
+    @classmethod
+    def from_dict(cls, path_dict):
+        return cls(**path_dict)
+
+    def register_importer(self, importer):
+        """
+        Makes the importer return the candles of this synthetic path
+        """
+        # historical closes are read using the importer methods registered before this path
+        get_ohlcv = importer.get_ohlcv
+        for method_name in SYNTHETIC_IMPORTER_METHODS:
+            method = getattr(importer, method_name, None)
+            if method is not None:
+                setattr(importer, method_name, self._get_synthetic_method(
+                    importer, get_ohlcv, method, inspect.signature(getattr(type(importer), method_name))))
+
+    def _get_synthetic_method(self, importer, get_ohlcv, method, signature):
+        async def synthetic_method(*args, **kwargs):
+            ohlcvs = await method(*args, **kwargs)
+            arguments = signature.bind(importer, *args, **kwargs)
+            arguments.apply_defaults()
+            symbol = arguments.arguments.get(SYMBOL_ARGUMENT)
+            if symbol is None or not ohlcvs:
+                return ohlcvs
+            close_times, price_factors = await self._get_price_factors(importer, get_ohlcv, symbol)
+            if not len(close_times):
+                return ohlcvs
+            return get_scaled_ohlcvs(ohlcvs, arguments.arguments.get(TIME_FRAME_ARGUMENT),
+                                     close_times, price_factors[self.index])
+
+        return synthetic_method
+
+    async def _get_price_factors(self, importer, get_ohlcv, symbol):
+        # data files are identified by name to generate the same paths on every process and machine
+        data_file = os.path.basename(importer.file_path)
+        key = (data_file, symbol, self.paths_count, self.block_size, self.seed)
+        if key in _PRICE_FACTORS:
+            _PRICE_FACTORS.move_to_end(key)
+            return _PRICE_FACTORS[key]
+        time_frame = time_frame_manager.find_min_time_frame(backtesting_api.get_available_time_frames(importer))
+        close_times, closes = get_close_prices(
+            await get_ohlcv(exchange_name=importer.exchange_name, symbol=symbol, time_frame=time_frame), time_frame)
+        random_generator = numpy.random.default_rng([self.seed, zlib.crc32(f"{data_file}{symbol}".encode())])
+        price_factors = get_bootstrapped_prices(closes, self.paths_count, self.block_size, random_generator) / closes
+        _PRICE_FACTORS[key] = close_times, price_factors
+        _release_price_factors()
+        return close_times, price_factors
+
+
+def get_bootstrapped_prices(prices, paths_count, block_size, random_generator):
+    """
+    :return: a (paths_count, len(prices)) array of price paths starting at prices[0] made of blocks of block_size
+    successive log returns of prices drawn with replacement, blocks wrap around the end of prices
+    """
+    returns = numpy.diff(numpy.log(prices))
+    if not len(returns):
+        return numpy.tile(prices, (paths_count, 1))
+    blocks_count = -(-len(returns) // block_size)
+    starts = random_generator.integers(0, len(returns), size=(paths_count, blocks_count))
+    indexes = (starts[:, :, None] + numpy.arange(block_size)).reshape(paths_count, -1)[:, :len(returns)] \
+        % len(returns)
+    log_prices = numpy.cumsum(numpy.concatenate((numpy.full((paths_count, 1), numpy.log(prices[0])),
+                                                 returns[indexes]), axis=1), axis=1)
+    return numpy.exp(log_prices)
+
+
+def get_scaled_ohlcvs(ohlcvs, time_frame, close_times, price_factors):
+    """
+    :return: copies of the ohlcvs data file rows where candles prices are multiplied by the price factor at their
+    close time, candles closing before the first close time are unchanged
+    """
+    candles = [ohlcv[-1] for ohlcv in ohlcvs]
+    candles_close_times = numpy.array([candle[TIME_INDEX] for candle in candles], dtype=numpy.float64) + \
+        commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+    factor_indexes = numpy.searchsorted(close_times, candles_close_times, side="right") - 1
+    candles_factors = numpy.where(factor_indexes >= 0, price_factors[numpy.maximum(factor_indexes, 0)], 1)
+    scaled_prices = (numpy.array([[candle[price_index] for price_index in PRICE_INDEXES] for candle in candles],
+                                 dtype=numpy.float64) * candles_factors[:, None]).tolist()
+    scaled_ohlcvs = []
+    # rows can be shared with the candles cache: never modify them
+    for ohlcv, candle, prices in zip(ohlcvs, candles, scaled_prices):
+        scaled_candle = list(candle)
+        for price_index, price in zip(PRICE_INDEXES, prices):
+            scaled_candle[price_index] = price
+        scaled_ohlcvs.append(list(ohlcv[:-1]) + [scaled_candle])
+    return scaled_ohlcvs
+
+
+def get_close_prices(ohlcvs, time_frame):
+    """
+    :return: the sorted close times and close prices of the candles of the given data file rows
+    """
+    candles = numpy.array([ohlcv[-1] for ohlcv in ohlcvs], dtype=numpy.float64).reshape(len(ohlcvs), -1)
+    candles = candles[numpy.argsort(candles[:, TIME_INDEX], kind="stable")] if len(candles) else candles
+    time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+    return candles[:, TIME_INDEX] + time_frame_seconds, candles[:, CLOSE_INDEX]
+
+
+def clear_price_factors():
+    _PRICE_FACTORS.clear()
+
+
+def _release_price_factors():
+    # evict least recently used paths, always keep the last generated ones
+    size = sum(close_times.nbytes + price_factors.nbytes for close_times, price_factors in _PRICE_FACTORS.values())
+    while size > constants.BACKTESTING_SYNTHETIC_PATHS_CACHE_MAX_SIZE and len(_PRICE_FACTORS) > 1:
+        _, (close_times, price_factors) = _PRICE_FACTORS.popitem(last=False)
+        size -= close_times.nbytes + price_factors.nbytes
@@ -0,0 +1,82 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import inspect
+
+import octobot_commons.tentacles_management as tentacles_management
+
+STRATEGY = "strategy"
+TA = "TA"
+SOCIAL = "social"
+REAL_TIME = "real_time"
+
+
+class TentaclesIndex:
+    """
+    TentaclesIndex maps installed evaluator tentacles names to their class for each evaluator type. Tentacles modules
+    are only inspected once, when the index is first used: clear it when tentacles are reloaded.
+    """
+
+    def __init__(self):
+        self._classes_by_type = None
+
+    def get_class(self, tentacle_name, tentacle_type):
+        """
+        :return: the class of the tentacle_type evaluator named tentacle_name or None when it is not installed
+        """
+        return self._get_classes_by_type()[tentacle_type].get(tentacle_name)
+
+    def get_type(self, tentacle_name):
+        """
+        :return: the evaluator type of the tentacle named tentacle_name or None when it is not an installed evaluator
+        """
+        for tentacle_type, classes in self._get_classes_by_type().items():
+            if tentacle_name in classes:
+                return tentacle_type
+        return None
+
+    def is_strategy(self, tentacle_name):
+        return self.get_class(tentacle_name, STRATEGY) is not None
+
+    def clear(self):
+        self._classes_by_type = None
+
+    def _get_classes_by_type(self):
+        if self._classes_by_type is None:
+            self._classes_by_type = _get_evaluators_classes_by_type()
+        return self._classes_by_type
+
+
+def _get_evaluators_classes_by_type():
+    # Lazy import of tentacles to let tentacles manager handle imports
+    import tentacles.Evaluator as tentacles_Evaluator
+    import octobot_evaluators.evaluators as evaluators
+    return {
+        tentacle_type: {
+            # same selection as tentacles_management.get_class_from_string
+            name: element
+            for name, element in inspect.getmembers(module)
+            if hasattr(element, "__bases__") and tentacles_management.evaluator_parent_inspection(element, parent)
+        }
+        for tentacle_type, parent, module in (
+            (STRATEGY, evaluators.StrategyEvaluator, tentacles_Evaluator.Strategies),
+            (TA, evaluators.TAEvaluator, tentacles_Evaluator.TA),
+            (SOCIAL, evaluators.SocialEvaluator, tentacles_Evaluator.Social),
+            (REAL_TIME, evaluators.RealTimeEvaluator, tentacles_Evaluator.RealTime),
+        )
+    }
+
+
+TENTACLES_INDEX = TentaclesIndex()
@@ -32,6 +32,7 @@ import octobot_tentacles_manager.constants as tentacles_manager_constants
 import octobot
 import octobot.octobot as octobot_class
 import octobot.commands as commands
+import octobot.api.strategy_optimizer as strategy_optimizer_api
 import octobot.configuration_manager as configuration_manager
 import octobot.octobot_backtesting_factory as octobot_backtesting
 import octobot.constants as constants
@@ -171,7 +172,33 @@ def start_octobot(args):
         bot.community_auth.clear_cache()
 
         if args.strategy_optimizer:
-            commands.start_strategy_optimizer(config, args.strategy_optimizer)
+            commands.start_strategy_optimizer(config, args.strategy_optimizer,
+                                              workers=args.optimizer_workers,
+                                              search_strategy=args.optimizer_search_strategy,
+                                              budget=args.optimizer_budget,
+                                              use_results_cache=args.optimizer_cache,
+                                              resume=args.resume,
+                                              replay_evaluations=args.optimizer_replay_evaluations,
+                                              coordinator_address=args.optimizer_coordinator,
+                                              local_workers=args.optimizer_local_workers,
+                                              racing=args.optimizer_racing,
+                                              walk_forward_windows=args.optimizer_walk_forward,
+                                              tentacles_parameters_file=args.optimizer_tentacles_parameters,
+                                              max_kept_results=args.optimizer_max_kept_results,
+                                              constraints_file=args.optimizer_constraints,
+                                              estimate_only=args.optimizer_estimate,
+                                              abort_min_portfolio_ratio=args.optimizer_abort_portfolio_ratio,
+                                              abort_max_inactive_candles=args.optimizer_abort_inactive_candles,
+                                              pre_screening_ratio=args.optimizer_pre_screening,
+                                              batch_data_files=args.optimizer_batch_data_files,
+                                              monte_carlo_paths=args.optimizer_monte_carlo,
+                                              fork_server=args.optimizer_fork_server,
+                                              checkpoint_file=args.optimizer_checkpoint)
+            return
+
+        if args.optimizer_worker:
+            commands.start_strategy_optimizer_worker(config, args.optimizer_worker,
+                                                     slots=args.optimizer_worker_slots)
             return
 
         # In those cases load OctoBot
@@ -255,6 +282,106 @@ def octobot_parser(parser):
                                                            'test. Example: -o TechnicalAnalysisStrategyEvaluator'
                                                            ' Warning: this process may take a long time.',
                         nargs='+')
+    parser.add_argument('-ow', '--optimizer-workers', type=int, default=constants.OPTIMIZER_DEFAULT_WORKERS,
+                        help='Number of processes to use to run strategy optimizer backtestings in parallel '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-oss', '--optimizer-search-strategy', type=str,
+                        choices=strategy_optimizer_api.get_optimizer_search_strategies(),
+                        help='Strategy optimizer search strategy: how to select the configurations to test. '
+                             'Default is ExhaustiveSearchStrategy: test every configuration '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-obu', '--optimizer-budget', type=int,
+                        help='Maximum number of configurations to test using the strategy optimizer '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-oc', '--optimizer-cache', help='Reuse cached strategy optimizer results from previous '
+                                                         'runs using the same configuration and data files and '
+                                                         'cache new ones '
+                                                         '(should be provided with -o or --strategy_optimizer).',
+                        action='store_true')
+    parser.add_argument('-owf', '--optimizer-walk-forward', type=int, default=0, metavar='WINDOWS',
+                        help='Split strategy optimizer data files into this number of successive windows, optimize '
+                             'configurations on each window and test them on the next one. Windows are optimized '
+                             'concurrently using --optimizer-workers processes, coordinator, resume, checkpoint '
+                             'and fork server options are not supported '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-otp', '--optimizer-tentacles-parameters', type=str, metavar='FILE',
+                        help='Json file of the tentacles parameters values to test with the strategy optimizer: '
+                             '{"TentacleName": {"parameter": [value1, value2] or {"min": 10, "max": 20, "step": 2}}} '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-okr', '--optimizer-max-kept-results', type=int, metavar='K',
+                        help='Bound the strategy optimizer memory usage by only keeping the K best full results, '
+                             'other results are only kept as rankings data, and print the peak memory usage '
+                             'regularly (should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-osc', '--optimizer-constraints', type=str, metavar='FILE',
+                        help='Json file of the strategy optimizer search space constraints: {"min_evaluators": 1, '
+                             '"max_evaluators": 3, "required_time_frames": ["1h"], "forbidden_time_frames": ["1m"], '
+                             '"exclusive_evaluators": [["RSIMomentumEvaluator", "RSIWeightMomentumEvaluator"]]} '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-oe', '--optimizer-estimate', help='Only print the estimated duration of the strategy '
+                                                            'optimizer search measured on a calibration backtesting '
+                                                            '(should be provided with -o or --strategy_optimizer).',
+                        action='store_true')
+    parser.add_argument('-oap', '--optimizer-abort-portfolio-ratio', type=float, metavar='RATIO',
+                        help='Stop strategy optimizer backtestings when their portfolio value drops below this ratio '
+                             'of its starting value, ex: 0.5, aborted backtestings keep their partial results '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-oai', '--optimizer-abort-inactive-candles', type=int, metavar='CANDLES',
+                        help='Stop strategy optimizer backtestings that did not create any order after this number '
+                             'of candles of their shortest time frame, aborted backtestings keep their partial '
+                             'results (should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-ops', '--optimizer-pre-screening', type=float, metavar='RATIO',
+                        help='Approximate the score of the strategy optimizer configurations using a fast vectorized '
+                             'backtester and only fully run this ratio of the best ones, ex: 0.2. Configurations '
+                             'using evaluators that can\'t be approximated are always run '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-obd', '--optimizer-batch-data-files',
+                        help='Run the scenarios data files of each strategy optimizer test suite together in '
+                             'multi-exchange backtestings instead of one backtesting per data file '
+                             '(should be provided with -o or --strategy_optimizer).',
+                        action='store_true')
+    parser.add_argument('-omc', '--optimizer-monte-carlo', type=int, metavar='PATHS',
+                        help='Also run the best strategy optimizer configurations on PATHS synthetic market paths '
+                             'generated by block bootstrap of the data files returns and report their scores '
+                             'distribution (should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-ofs', '--optimizer-fork-server',
+                        help='Run strategy optimizer test suites in processes forked from a process that already '
+                             'imported tentacles and loaded data files instead of spawned worker processes, '
+                             'evaluators are still initialized by each test suite, unavailable on Windows '
+                             '(should be provided with -o or --strategy_optimizer and --optimizer-workers).',
+                        action='store_true')
+    parser.add_argument('--resume', help='Resume the strategy optimizer from its last checkpoint instead of '
+                                         'starting from the first configuration, the session is checkpointed '
+                                         'to be resumed again '
+                                         '(should be provided with -o or --strategy_optimizer).',
+                        action='store_true')
+    parser.add_argument('-ock', '--optimizer-checkpoint', type=str, metavar='FILE',
+                        help='Checkpoint the strategy optimizer session into FILE, used instead of the default '
+                             'checkpoint file with --resume. Sessions are only checkpointed when this option or '
+                             '--resume is provided (should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-ore', '--optimizer-replay-evaluations',
+                        help='Record evaluators notes on each data file and replay them in the following strategy '
+                             'optimizer runs that only differ by their risk or trading mode settings instead of '
+                             'computing evaluators again '
+                             '(should be provided with -o or --strategy_optimizer).',
+                        action='store_true')
+    parser.add_argument('-ora', '--optimizer-racing',
+                        help='Run strategy optimizer test suites scenarios by rounds and stop testing the '
+                             'configurations that are statistically dominated by the best one after each round '
+                             '(should be provided with -o or --strategy_optimizer).',
+                        action='store_true')
+    parser.add_argument('-oco', '--optimizer-coordinator', type=str, metavar='HOST:PORT',
+                        help='Listen on HOST:PORT and run strategy optimizer backtestings in the workers connecting '
+                             'to it instead of local processes. Workers are started with --optimizer-worker '
+                             '(should be provided with -o or --strategy_optimizer).')
+    parser.add_argument('-olw', '--optimizer-local-workers', type=int, default=0,
+                        help='Number of local workers to start in addition to remote ones '
+                             '(should be provided with --optimizer-coordinator).')
+    parser.add_argument('-owk', '--optimizer-worker', type=str, metavar='HOST:PORT',
+                        help='Start OctoBot as a strategy optimizer worker running the backtestings of the '
+                             'coordinator at HOST:PORT using this installation configuration and data files.')
+    parser.add_argument('-ows', '--optimizer-worker-slots', type=int, default=constants.OPTIMIZER_DEFAULT_WORKERS,
+                        help='Number of backtestings a strategy optimizer worker runs in parallel '
+                             '(should be provided with --optimizer-worker).')
     parser.set_defaults(func=start_octobot)
 
     # add sub commands
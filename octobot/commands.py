@@ -29,6 +29,7 @@ import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_tentacles_manager.cli as tentacles_manager_cli
 
 import octobot
+import octobot.api.backtesting as backtesting_api
 import octobot.api.strategy_optimizer as strategy_optimizer_api
 import octobot.logger as octobot_logger
 import octobot.constants as constants
@@ -67,16 +68,84 @@ def exchange_keys_encrypter(catch=False):
             raise e
 
 
-def start_strategy_optimizer(config, commands):
+def start_strategy_optimizer(config, commands, workers=constants.OPTIMIZER_DEFAULT_WORKERS,
+                             search_strategy=None, budget=None, use_results_cache=False, resume=False,
+                             replay_evaluations=False, coordinator_address=None, local_workers=0, racing=False,
+                             walk_forward_windows=0, tentacles_parameters_file=None, max_kept_results=None,
+                             constraints_file=None, estimate_only=False, abort_min_portfolio_ratio=None,
+                             abort_max_inactive_candles=None, pre_screening_ratio=None, batch_data_files=False,
+                             monte_carlo_paths=None, fork_server=False, checkpoint_file=None):
+    if walk_forward_windows and not estimate_only and (coordinator_address is not None or local_workers or resume
+                                                       or checkpoint_file is not None or fork_server):
+        # each walk forward step runs its own optimizer in its own process
+        raise RuntimeError("Walk forward optimizations can't be used with optimizer coordinator, local workers, "
+                           "resume, checkpoint or fork server options")
     tentacles_setup_config = tentacles_manager_api.get_tentacles_setup_config(config.get_tentacles_config_path())
+    tentacles_parameters = None if tentacles_parameters_file is None \
+        else strategy_optimizer_api.load_optimizer_tentacles_parameters(tentacles_parameters_file)
+    constraints = None if constraints_file is None \
+        else strategy_optimizer_api.load_optimizer_constraints(constraints_file)
+    abort_rules = None if abort_min_portfolio_ratio is None and abort_max_inactive_candles is None \
+        else strategy_optimizer_api.create_backtesting_abort_rules(min_portfolio_ratio=abort_min_portfolio_ratio,
+                                                                   max_candles_without_order=abort_max_inactive_candles)
+    if walk_forward_windows and not estimate_only:
+        walk_forward_optimizer = strategy_optimizer_api.create_walk_forward_optimizer(
+            config.config, tentacles_setup_config, commands[0], windows_count=walk_forward_windows)
+        strategy_optimizer_api.run_walk_forward_optimization(walk_forward_optimizer, workers=workers,
+                                                             search_strategy=search_strategy, budget=budget,
+                                                             use_results_cache=use_results_cache,
+                                                             replay_evaluations=replay_evaluations,
+                                                             racing=racing,
+                                                             tentacles_parameters=tentacles_parameters,
+                                                             max_kept_results=max_kept_results,
+                                                             constraints=constraints,
+                                                             abort_rules=abort_rules,
+                                                             pre_screening_ratio=pre_screening_ratio,
+                                                             batch_data_files=batch_data_files,
+                                                             monte_carlo_paths=monte_carlo_paths)
+        strategy_optimizer_api.print_walk_forward_report(walk_forward_optimizer)
+        return
     optimizer = strategy_optimizer_api.create_strategy_optimizer(config.config, tentacles_setup_config, commands[0])
     if strategy_optimizer_api.get_optimizer_is_properly_initialized(optimizer):
-        strategy_optimizer_api.find_optimal_configuration(optimizer)
+        if estimate_only:
+            cost_estimate = strategy_optimizer_api.estimate_optimizer_cost(optimizer, workers=workers,
+                                                                           search_strategy=search_strategy,
+                                                                           budget=budget,
+                                                                           tentacles_parameters=tentacles_parameters,
+                                                                           constraints=constraints)
+            logging.get_logger(COMMANDS_LOGGER_NAME).info(f"Strategy optimizer estimated cost: {cost_estimate}")
+            return
+        if checkpoint_file is None and resume:
+            checkpoint_file = strategy_optimizer_api.get_optimizer_default_checkpoint_file(commands[0])
+        strategy_optimizer_api.find_optimal_configuration(optimizer, workers=workers,
+                                                          search_strategy=search_strategy, budget=budget,
+                                                          use_results_cache=use_results_cache,
+                                                          checkpoint_file=checkpoint_file,
+                                                          resume=resume,
+                                                          replay_evaluations=replay_evaluations,
+                                                          coordinator_address=coordinator_address,
+                                                          local_workers=local_workers,
+                                                          racing=racing,
+                                                          tentacles_parameters=tentacles_parameters,
+                                                          max_kept_results=max_kept_results,
+                                                          constraints=constraints,
+                                                          abort_rules=abort_rules,
+                                                          pre_screening_ratio=pre_screening_ratio,
+                                                          batch_data_files=batch_data_files,
+                                                          monte_carlo_paths=monte_carlo_paths,
+                                                          fork_server=fork_server)
         strategy_optimizer_api.print_optimizer_report(optimizer)
 
 
+def start_strategy_optimizer_worker(config, coordinator_address, slots=constants.OPTIMIZER_DEFAULT_WORKERS):
+    tentacles_setup_config = tentacles_manager_api.get_tentacles_setup_config(config.get_tentacles_config_path())
+    strategy_optimizer_api.run_optimizer_worker(config.config, tentacles_setup_config, coordinator_address,
+                                                slots=slots)
+
+
 def run_tentacles_installation():
     asyncio.run(_install_all_tentacles())
+    backtesting_api.clear_tentacles_index()
 
 
 async def _install_all_tentacles():
@@ -114,6 +183,7 @@ async def start_bot(bot, logger, catch=False):
     try:
         # load tentacles details
         tentacles_manager_api.reload_tentacle_info()
+        backtesting_api.clear_tentacles_index()
         # ensure tentacles config exists or create a new one
         await tentacles_manager_api.ensure_setup_configuration(bot_install_dir=constants.OCTOBOT_FOLDER)
 
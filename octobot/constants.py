@@ -97,6 +97,39 @@ LOG_FILE = f"{LOGS_FOLDER}/{PROJECT_NAME}.log"
 # Optimizer
 OPTIMIZER_FORCE_ASYNCIO_DEBUG_OPTION = False
 OPTIMIZER_DATA_FILES_FOLDER = f"{OCTOBOT_FOLDER}/strategy_optimizer/optimizer_data_files"
+OPTIMIZER_DEFAULT_WORKERS = 1
+OPTIMIZER_PENDING_RUNS_PER_WORKER = 2
+OPTIMIZER_RESULTS_CACHE_FOLDER = f"{commons_constants.USER_FOLDER}/optimizer_results_cache"
+OPTIMIZER_RESULTS_CACHE_MAX_SIZE = 64 * 1024 * 1024
+OPTIMIZER_RESULTS_CACHE_READ_CHUNK_SIZE = 1024 * 1024
+OPTIMIZER_CHECKPOINTS_FOLDER = f"{commons_constants.USER_FOLDER}/optimizer_checkpoints"
+OPTIMIZER_CHECKPOINT_SAVE_INTERVAL = 60
+OPTIMIZER_RESULTS_TABLE_INITIAL_CAPACITY = 1024
+OPTIMIZER_EVALUATIONS_RECORDINGS_FOLDER = f"{commons_constants.USER_FOLDER}/optimizer_evaluations_recordings"
+OPTIMIZER_TENTACLES_SETTINGS_FOLDER = f"{commons_constants.USER_FOLDER}/optimizer_tentacles_settings"
+OPTIMIZER_DISTRIBUTED_HEARTBEAT_INTERVAL = 5
+OPTIMIZER_DISTRIBUTED_HEARTBEAT_TIMEOUT = 30
+OPTIMIZER_DISTRIBUTED_MAX_JOB_ATTEMPTS = 3
+OPTIMIZER_DISTRIBUTED_MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+OPTIMIZER_DISTRIBUTED_CONNECTION_ATTEMPTS = 10
+OPTIMIZER_DISTRIBUTED_CONNECTION_RETRY_DELAY = 3
+OPTIMIZER_RACING_CONFIDENCE = 0.95
+OPTIMIZER_RACING_MIN_ROUNDS = 2
+OPTIMIZER_REPORT_SIZE = 100
+OPTIMIZER_WALK_FORWARD_WINDOWS_COUNT = 4
+OPTIMIZER_WALK_FORWARD_SELECTED_CONFIGURATIONS_COUNT = 5
+OPTIMIZER_MEMORY_REPORT_INTERVAL = 100
+OPTIMIZER_BOUNDED_MEMORY_MAX_ERRORS = 100
+OPTIMIZER_PRE_SCREENING_BATCH_SIZE = 1000
+OPTIMIZER_PRE_SCREENING_NOTE_THRESHOLD = 0.3
+OPTIMIZER_PRE_SCREENING_DEFAULT_FEES = 0.1
+OPTIMIZER_MONTE_CARLO_CONFIGURATIONS_COUNT = 5
+OPTIMIZER_MONTE_CARLO_PERCENTILES = (5, 25, 50, 75, 95)
+
+BACKTESTING_CANDLES_CACHE_MAX_SIZE = 512 * 1024 * 1024
+BACKTESTING_CANDLES_CACHE_ESTIMATED_CANDLE_SIZE = 512
+BACKTESTING_SYNTHETIC_PATHS_BLOCK_SIZE = 24
+BACKTESTING_SYNTHETIC_PATHS_CACHE_MAX_SIZE = 512 * 1024 * 1024
 
 # Channel
 OCTOBOT_CHANNEL = "OctoBot"
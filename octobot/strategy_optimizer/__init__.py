@@ -15,23 +15,153 @@
 #  License along with this library.
 
 from octobot.strategy_optimizer import test_suite_result
+from octobot.strategy_optimizer import run_result_update
+from octobot.strategy_optimizer import search_space_constraints
+from octobot.strategy_optimizer import configuration_generator
+from octobot.strategy_optimizer import optimizer_results_cache
+from octobot.strategy_optimizer import optimizer_results_table
+from octobot.strategy_optimizer import optimizer_checkpoint
+from octobot.strategy_optimizer import configurations_race
+from octobot.strategy_optimizer import monte_carlo_simulator
+from octobot.strategy_optimizer import search_strategies
 from octobot.strategy_optimizer import strategy_optimizer
 from octobot.strategy_optimizer import strategy_test_suite
+from octobot.strategy_optimizer import tentacles_settings
+from octobot.strategy_optimizer import test_suite_runner
+from octobot.strategy_optimizer import fork_server
+from octobot.strategy_optimizer import cost_estimator
+from octobot.strategy_optimizer import pre_screening_backtester
+from octobot.strategy_optimizer import walk_forward_optimizer
+from octobot.strategy_optimizer import distributed
 
 from octobot.strategy_optimizer.test_suite_result import (
     TestSuiteResult,
     TestSuiteResultSummary,
 )
+from octobot.strategy_optimizer.run_result_update import (
+    RunResultUpdate,
+)
+from octobot.strategy_optimizer.search_space_constraints import (
+    SearchSpaceConstraints,
+)
+from octobot.strategy_optimizer.configuration_generator import (
+    NO_TENTACLES_SETTINGS,
+    RunConfiguration,
+    get_subsets_count,
+    iterate_subsets,
+    get_run_configurations_count,
+    iterate_run_configurations,
+    get_parameter_values,
+    get_tentacles_settings,
+    get_tentacles_settings_config,
+    get_tentacles_settings_from_config,
+)
+from octobot.strategy_optimizer.optimizer_results_cache import (
+    OptimizerResultsCache,
+)
+from octobot.strategy_optimizer.optimizer_results_table import (
+    OptimizerResultsTable,
+)
+from octobot.strategy_optimizer.optimizer_checkpoint import (
+    OptimizerCheckpoint,
+)
+from octobot.strategy_optimizer.configurations_race import (
+    ConfigurationsRace,
+)
+from octobot.strategy_optimizer.monte_carlo_simulator import (
+    MonteCarloSimulator,
+    get_distribution_string,
+)
 from octobot.strategy_optimizer.strategy_optimizer import (
     StrategyOptimizer,
 )
 from octobot.strategy_optimizer.strategy_test_suite import (
     StrategyTestSuite,
 )
+from octobot.strategy_optimizer.tentacles_settings import (
+    get_tentacles_settings_setup_config,
+)
+from octobot.strategy_optimizer.test_suite_runner import (
+    init_worker_process,
+    init_forked_process,
+    get_event_loop,
+    close_event_loop,
+    get_peak_memory,
+    run_test_suite,
+)
+from octobot.strategy_optimizer.fork_server import (
+    ForkServer,
+)
+from octobot.strategy_optimizer.cost_estimator import (
+    OptimizerCostEstimate,
+    estimate_cost,
+    get_scenarios_data_files,
+)
+from octobot.strategy_optimizer.pre_screening_backtester import (
+    PreScreeningBacktester,
+    SIGNAL_FUNCTIONS,
+)
+from octobot.strategy_optimizer.walk_forward_optimizer import (
+    WalkForwardOptimizer,
+    get_walk_forward_windows,
+    run_walk_forward_step,
+    optimize_window,
+    backtest_window_configurations,
+    get_sorted_window_results,
+)
+from octobot.strategy_optimizer.distributed import (
+    OptimizerCoordinator,
+    OptimizerWorker,
+    run_worker,
+    start_local_workers,
+    stop_local_workers,
+)
 
 __all__ = [
     "TestSuiteResult",
     "TestSuiteResultSummary",
+    "RunResultUpdate",
+    "SearchSpaceConstraints",
+    "NO_TENTACLES_SETTINGS",
+    "RunConfiguration",
+    "get_subsets_count",
+    "iterate_subsets",
+    "get_run_configurations_count",
+    "iterate_run_configurations",
+    "get_parameter_values",
+    "get_tentacles_settings",
+    "get_tentacles_settings_config",
+    "get_tentacles_settings_from_config",
+    "OptimizerResultsCache",
+    "OptimizerResultsTable",
+    "OptimizerCheckpoint",
+    "ConfigurationsRace",
+    "MonteCarloSimulator",
+    "get_distribution_string",
     "StrategyOptimizer",
     "StrategyTestSuite",
+    "get_tentacles_settings_setup_config",
+    "init_worker_process",
+    "init_forked_process",
+    "get_event_loop",
+    "close_event_loop",
+    "get_peak_memory",
+    "run_test_suite",
+    "ForkServer",
+    "OptimizerCostEstimate",
+    "estimate_cost",
+    "get_scenarios_data_files",
+    "PreScreeningBacktester",
+    "SIGNAL_FUNCTIONS",
+    "WalkForwardOptimizer",
+    "get_walk_forward_windows",
+    "run_walk_forward_step",
+    "optimize_window",
+    "backtest_window_configurations",
+    "get_sorted_window_results",
+    "OptimizerCoordinator",
+    "OptimizerWorker",
+    "run_worker",
+    "start_local_workers",
+    "stop_local_workers",
 ]
@@ -0,0 +1,163 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import itertools
+import math
+
+RANGE_MIN = "min"
+RANGE_MAX = "max"
+RANGE_STEP = "step"
+NO_TENTACLES_SETTINGS = ()
+
+
+class RunConfiguration:
+    """
+    RunConfiguration is a single optimizer run: a risk, the activated evaluators and time frames and the
+    tentacles settings, a tuple of ((tentacle name, parameter), value) pairs sorted by tentacle and parameter
+    """
+
+    def __init__(self, risk, evaluators, time_frames, tentacles_settings=NO_TENTACLES_SETTINGS):
+        self.risk = risk
+        self.evaluators = tuple(evaluators)
+        self.time_frames = tuple(time_frames)
+        self.tentacles_settings = tuple(tentacles_settings)
+        self._key = (self.risk, frozenset(self.evaluators), frozenset(self.time_frames), self.tentacles_settings)
+
+    def get_evaluators_config(self, strategy_name):
+        evaluators_config = {evaluator: True for evaluator in self.evaluators}
+        evaluators_config[strategy_name] = True
+        return evaluators_config
+
+    def get_time_frames_config(self):
+        return sorted(time_frame.value for time_frame in self.time_frames)
+
+    def get_tentacles_settings_config(self):
+        return get_tentacles_settings_config(self.tentacles_settings)
+
+    def __eq__(self, other):
+        return isinstance(other, RunConfiguration) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __repr__(self):
+        tentacles_settings = f", tentacles_settings={self.get_tentacles_settings_config()}" \
+            if self.tentacles_settings else ""
+        return f"{self.__class__.__name__}(risk={self.risk}, evaluators={list(self.evaluators)}, " \
+               f"time_frames={self.get_time_frames_config()}{tentacles_settings})"
+
+
+def get_unique_elements(elements):
+    # keep the given order
+    return list(dict.fromkeys(elements))
+
+
+def get_subsets_count(elements):
+    return 2 ** len(get_unique_elements(elements)) - 1
+
+
+def iterate_subsets(elements):
+    """
+    Lazily yields each non-empty subset of elements exactly once, by increasing subset size
+    """
+    unique_elements = get_unique_elements(elements)
+    for subset_size in range(1, len(unique_elements) + 1):
+        yield from itertools.combinations(unique_elements, subset_size)
+
+
+def get_parameter_values(parameter_values):
+    """
+    :param parameter_values: a list of values or a {"min": x, "max": y, "step": z} range including its bounds
+    """
+    if not isinstance(parameter_values, dict):
+        return get_unique_elements(parameter_values)
+    minimum = parameter_values[RANGE_MIN]
+    step = parameter_values[RANGE_STEP]
+    if step <= 0:
+        raise RuntimeError(f"Invalid parameter range step: {step}")
+    # tolerate floating point errors on the range bounds
+    values_count = math.floor((parameter_values[RANGE_MAX] - minimum) / step + 1e-9) + 1
+    return [_get_rounded_value(minimum + index * step) for index in range(values_count)]
+
+
+def get_tentacles_settings(tentacles_parameters):
+    """
+    :param tentacles_parameters: the values of each swept parameter: {tentacle name: {parameter: values}}
+    where values are a list of values or a {"min": x, "max": y, "step": z} range
+    :return: each tentacles settings grid point, neighbouring grid points only differ by their last parameters
+    """
+    if not tentacles_parameters:
+        return [NO_TENTACLES_SETTINGS]
+    parameters = sorted((tentacle, parameter)
+                        for tentacle, tentacle_parameters in tentacles_parameters.items()
+                        for parameter in tentacle_parameters)
+    parameters_values = [get_parameter_values(tentacles_parameters[tentacle][parameter])
+                         for tentacle, parameter in parameters]
+    return [tuple(zip(parameters, values)) for values in itertools.product(*parameters_values)]
+
+
+def get_tentacles_settings_config(tentacles_settings):
+    """
+    :return: the {tentacle name: {parameter: value}} configuration update of the given tentacles settings
+    """
+    tentacles_settings_config = {}
+    for (tentacle, parameter), value in tentacles_settings:
+        tentacles_settings_config.setdefault(tentacle, {})[parameter] = value
+    return tentacles_settings_config
+
+
+def get_tentacles_settings_from_config(tentacles_settings_config):
+    return tuple(sorted(((tentacle, parameter), value)
+                        for tentacle, tentacle_config in tentacles_settings_config.items()
+                        for parameter, value in tentacle_config.items()))
+
+
+def get_run_configurations_count(risks, evaluators, time_frames, tentacles_settings=None, constraints=None):
+    """
+    :param constraints: SearchSpaceConstraints restricting the search space
+    """
+    if constraints is None:
+        subsets_count = get_subsets_count(evaluators) * get_subsets_count(time_frames)
+    else:
+        subsets_count = constraints.get_evaluators_subsets_count(evaluators) * \
+            constraints.get_time_frames_subsets_count(time_frames)
+    return len(get_unique_elements(risks)) * subsets_count * len(_get_tentacles_settings_or_default(tentacles_settings))
+
+
+def iterate_run_configurations(risks, evaluators, time_frames, tentacles_settings=None, constraints=None):
+    """
+    Lazily yields every RunConfiguration of the given search space exactly once, configurations only differing
+    by their tentacles settings are consecutive and are followed by the ones only differing by their risk
+    :param constraints: SearchSpaceConstraints restricting the search space
+    """
+    tentacles_settings = _get_tentacles_settings_or_default(tentacles_settings)
+    unique_risks = get_unique_elements(risks)
+    time_frames_subsets = list(iterate_subsets(time_frames) if constraints is None
+                               else constraints.iterate_time_frames_subsets(time_frames))
+    for evaluators_subset in (iterate_subsets(evaluators) if constraints is None
+                              else constraints.iterate_evaluators_subsets(evaluators)):
+        for time_frames_subset in time_frames_subsets:
+            for risk in unique_risks:
+                for settings in tentacles_settings:
+                    yield RunConfiguration(risk, evaluators_subset, time_frames_subset, settings)
+
+
+def _get_tentacles_settings_or_default(tentacles_settings):
+    return get_unique_elements(tentacles_settings) if tentacles_settings else [NO_TENTACLES_SETTINGS]
+
+
+def _get_rounded_value(value):
+    # avoid values like 0.30000000000000004 in float ranges
+    return round(value, 10) if isinstance(value, float) else value
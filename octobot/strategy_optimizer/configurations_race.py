@@ -0,0 +1,138 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import math
+import statistics
+
+import numpy
+
+import octobot_commons.time_frame_manager as time_frame_manager
+
+import octobot.constants as constants
+import octobot.strategy_optimizer as strategy_optimizer
+
+
+class ConfigurationsRace:
+    """
+    ConfigurationsRace runs configurations scenario by scenario and eliminates the ones that are statistically
+    dominated by the best one after each round using the Friedman test and its post-hoc comparisons (F-Race).
+    Configurations are only compared to the ones having the same minimum time frame: they run on the same data.
+    """
+
+    def __init__(self, run_configurations, confidence=constants.OPTIMIZER_RACING_CONFIDENCE,
+                 min_rounds=constants.OPTIMIZER_RACING_MIN_ROUNDS):
+        self.alive_run_configurations = list(run_configurations)
+        self.confidence = confidence
+        self.min_rounds = min_rounds
+        self.rounds_count = 0
+        self.start_times = {}
+        self._results = {run_config: [] for run_config in self.alive_run_configurations}
+        self._errors = {run_config: set() for run_config in self.alive_run_configurations}
+
+    def add_result(self, run_config, test_suite_result, errors):
+        self._results[run_config].append(test_suite_result)
+        self._errors[run_config].update(errors)
+
+    def end_round(self):
+        """
+        :return: the run configurations eliminated after this round
+        """
+        self.rounds_count += 1
+        if self.rounds_count < self.min_rounds:
+            return []
+        run_configs_by_time_frame = {}
+        for run_config in self.alive_run_configurations:
+            run_configs_by_time_frame.setdefault(time_frame_manager.find_min_time_frame(run_config.time_frames),
+                                                 []).append(run_config)
+        eliminated_run_configs = set()
+        for run_configs in run_configs_by_time_frame.values():
+            scores = numpy.array([[result.get_average_score() for result in self._results[run_config]]
+                                  for run_config in run_configs]).T
+            eliminated_run_configs.update(run_configs[index]
+                                          for index in get_dominated_indexes(scores, self.confidence))
+        self.alive_run_configurations = [run_config
+                                         for run_config in self.alive_run_configurations
+                                         if run_config not in eliminated_run_configs]
+        return [run_config for run_config in self._results if run_config in eliminated_run_configs]
+
+    def get_result(self, run_config):
+        """
+        :return: the TestSuiteResult of the scenarios run using run_config and the encountered errors descriptions
+        """
+        results = self._results[run_config]
+        test_suite_result = strategy_optimizer.TestSuiteResult(
+            [profitability for result in results for profitability in result.run_profitabilities],
+            [trades_count for result in results for trades_count in result.trades_counts],
+            results[0].risk,
+            results[0].time_frames,
+            results[0].evaluators,
+            results[0].strategy,
+            tentacles_settings=results[0].tentacles_settings,
+            data_files=[data_file for result in results for data_file in result.data_files]
+        )
+        test_suite_result.overhead_time = sum(result.overhead_time for result in results)
+        test_suite_result.aborted_runs_count = sum(result.aborted_runs_count for result in results)
+        return test_suite_result, self._errors[run_config]
+
+
+def get_dominated_indexes(scores, confidence):
+    """
+    :param scores: a (rounds, configurations) array of scores, the higher the better
+    :return: the indexes of the configurations that are worse than the best one with the given confidence
+    """
+    blocks_count, configurations_count = scores.shape
+    if blocks_count < 2 or configurations_count < 2:
+        return []
+    # rank 1 is the best configuration of a round
+    ranks = numpy.array([_get_ranks(-round_scores) for round_scores in scores])
+    ranks_sums = ranks.sum(axis=0)
+    ranks_variance = (ranks ** 2).sum() - blocks_count * configurations_count * (configurations_count + 1) ** 2 / 4
+    if ranks_variance <= 0:
+        # every configuration got the same score on each round
+        return []
+    statistic = (configurations_count - 1) * \
+        ((ranks_sums - blocks_count * (configurations_count + 1) / 2) ** 2).sum() / ranks_variance
+    if statistic <= _get_chi2_quantile(confidence, configurations_count - 1):
+        return []
+    degrees_of_freedom = (blocks_count - 1) * (configurations_count - 1)
+    critical_difference = _get_t_quantile(1 - (1 - confidence) / 2, degrees_of_freedom) * math.sqrt(
+        max(2 * blocks_count * (1 - statistic / (blocks_count * (configurations_count - 1))) * ranks_variance, 0)
+        / degrees_of_freedom
+    )
+    return [int(index) for index in numpy.flatnonzero(ranks_sums - ranks_sums.min() > critical_difference)]
+
+
+def _get_ranks(values):
+    # equal values get the average of their ranks
+    ranks = numpy.empty(len(values))
+    ranks[numpy.argsort(values, kind="stable")] = numpy.arange(1, len(values) + 1)
+    _, groups = numpy.unique(values, return_inverse=True)
+    groups = groups.reshape(-1)
+    return (numpy.bincount(groups, weights=ranks) / numpy.bincount(groups))[groups]
+
+
+def _get_chi2_quantile(probability, degrees_of_freedom):
+    # Wilson-Hilferty approximation
+    normal_quantile = statistics.NormalDist().inv_cdf(probability)
+    factor = 2 / (9 * degrees_of_freedom)
+    return degrees_of_freedom * (1 - factor + normal_quantile * math.sqrt(factor)) ** 3
+
+
+def _get_t_quantile(probability, degrees_of_freedom):
+    # Cornish-Fisher expansion around the normal quantile
+    z = statistics.NormalDist().inv_cdf(probability)
+    return z + (z ** 3 + z) / (4 * degrees_of_freedom) \
+        + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * degrees_of_freedom ** 2) \
+        + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * degrees_of_freedom ** 3)
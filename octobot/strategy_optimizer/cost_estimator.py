@@ -0,0 +1,148 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import math
+import os
+import time
+
+import octobot_commons.logging as logging
+
+import octobot.backtesting as backtesting
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.strategy_test_suite as strategy_test_suite
+
+
+class OptimizerCostEstimate:
+    """
+    OptimizerCostEstimate predicts the duration of a strategy optimizer search from a calibration backtesting: the
+    calibration candles per second rate is scaled to the size of the data files of the whole test suite.
+    Runs skipped thanks to racing or to the results cache are counted: the estimate is an upper bound in this case.
+    """
+
+    def __init__(self, runs_count, workers, calibration_time, calibration_candles_count, calibration_data_size,
+                 data_size, errors=None):
+        self.runs_count = runs_count
+        self.workers = max(1, workers)
+        self.calibration_time = calibration_time
+        self.calibration_candles_count = calibration_candles_count
+        self.calibration_data_size = calibration_data_size
+        self.data_size = data_size
+        self.errors = set() if errors is None else errors
+
+    def get_candles_per_second(self):
+        return self.calibration_candles_count / self.calibration_time if self.calibration_time else 0
+
+    def get_candles_count(self):
+        """
+        :return: the estimated number of candles read by a test suite run
+        """
+        if not self.calibration_data_size:
+            return 0
+        return int(self.calibration_candles_count * self.data_size / self.calibration_data_size)
+
+    def get_run_time(self):
+        """
+        :return: the estimated duration of a test suite run in seconds
+        """
+        candles_per_second = self.get_candles_per_second()
+        return self.get_candles_count() / candles_per_second if candles_per_second else 0
+
+    def get_total_time(self):
+        """
+        :return: the estimated duration of every test suite run in seconds using the given workers
+        """
+        return math.ceil(self.runs_count / self.workers) * self.get_run_time()
+
+    def get_report(self):
+        return {
+            "runs_count": self.runs_count,
+            "workers": self.workers,
+            "candles_per_second": self.get_candles_per_second(),
+            "candles_per_run": self.get_candles_count(),
+            "run_time": self.get_run_time(),
+            "total_time": self.get_total_time(),
+        }
+
+    def __str__(self):
+        return f"{self.runs_count} runs of about {self.get_candles_count()} candles at " \
+               f"{self.get_candles_per_second():.0f} candles/s: {self.get_run_time():.1f}s per run, " \
+               f"{_get_duration_description(self.get_total_time())} using {self.workers} worker(s)"
+
+
+def estimate_cost(config, tentacles_setup_config, strategy_class, evaluators, runs_count, workers,
+                  tentacles_activation=None, tentacles_settings=None, backtesting_window=None):
+    """
+    Runs the test suite scenario using the least data with the given configuration to measure the backtesting
+    candles per second rate
+    :return: the OptimizerCostEstimate of runs_count test suite runs
+    """
+    scenarios_data_sizes = [sum(_get_file_size(data_file) for data_file in data_files)
+                            for data_files in get_scenarios_data_files()]
+    if not scenarios_data_sizes:
+        raise RuntimeError("No test suite scenario to run")
+    calibration_scenario = min(range(len(scenarios_data_sizes)), key=scenarios_data_sizes.__getitem__)
+    # read candles from data files to measure the whole backtesting
+    backtesting.CANDLES_CACHE.clear()
+    read_candles_count = backtesting.CANDLES_CACHE.read_candles_count
+    start_time = time.time()
+    _, errors = strategy_optimizer.run_test_suite(config, tentacles_setup_config, strategy_class, evaluators,
+                                                  tentacles_activation=tentacles_activation,
+                                                  scenarios=[calibration_scenario],
+                                                  backtesting_window=backtesting_window,
+                                                  tentacles_settings=tentacles_settings)
+    estimate = OptimizerCostEstimate(runs_count, workers, time.time() - start_time,
+                                     backtesting.CANDLES_CACHE.read_candles_count - read_candles_count,
+                                     scenarios_data_sizes[calibration_scenario], sum(scenarios_data_sizes),
+                                     errors=errors)
+    if errors:
+        logging.get_logger(OptimizerCostEstimate.__name__).warning(
+            f"Errors during calibration run, the cost estimate might be inaccurate: {errors}")
+    return estimate
+
+
+def get_scenarios_data_files():
+    """
+    :return: the data files of each test suite scenario, no backtesting is run
+    """
+    test_suite = _DataFilesCollector()
+    loop = strategy_optimizer.get_event_loop()
+    scenarios_data_files = []
+    for scenario in test_suite.get_scenarios():
+        test_suite.data_files = []
+        loop.run_until_complete(scenario(test_suite))
+        scenarios_data_files.append(test_suite.data_files)
+    return scenarios_data_files
+
+
+class _DataFilesCollector(strategy_test_suite.StrategyTestSuite):
+    def __init__(self):
+        super().__init__()
+        self.data_files = []
+
+    async def _run_and_handle_results(self, data_file, expected_profitability):
+        self.data_files.append(data_file)
+
+
+def _get_file_size(data_file):
+    try:
+        return os.path.getsize(data_file)
+    except OSError:
+        return 0
+
+
+def _get_duration_description(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s"
@@ -0,0 +1,37 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+from octobot.strategy_optimizer.distributed import protocol
+from octobot.strategy_optimizer.distributed import optimizer_coordinator
+from octobot.strategy_optimizer.distributed import optimizer_worker
+
+from octobot.strategy_optimizer.distributed.optimizer_coordinator import (
+    OptimizerCoordinator,
+)
+from octobot.strategy_optimizer.distributed.optimizer_worker import (
+    OptimizerWorker,
+    run_worker,
+    start_local_workers,
+    stop_local_workers,
+)
+
+__all__ = [
+    "OptimizerCoordinator",
+    "OptimizerWorker",
+    "run_worker",
+    "start_local_workers",
+    "stop_local_workers",
+]
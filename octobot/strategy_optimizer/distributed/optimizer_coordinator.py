@@ -0,0 +1,230 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import collections
+import concurrent.futures
+import itertools
+import threading
+
+import octobot_commons.logging as common_logging
+
+import octobot.constants as constants
+import octobot.strategy_optimizer.distributed.protocol as protocol
+
+
+class OptimizerCoordinator:
+    """
+    OptimizerCoordinator hands out strategy optimizer jobs to the OptimizerWorker connected to its TCP server.
+    Jobs of workers that are disconnected or stop sending heartbeats are given to other workers.
+    The TCP server runs in its own thread: jobs can be submitted from any thread.
+    """
+
+    def __init__(self, host, port, strategy_name, use_results_cache=False, replay_evaluations=False,
+                 heartbeat_timeout=constants.OPTIMIZER_DISTRIBUTED_HEARTBEAT_TIMEOUT,
+                 max_job_attempts=constants.OPTIMIZER_DISTRIBUTED_MAX_JOB_ATTEMPTS):
+        self.logger = common_logging.get_logger(self.__class__.__name__)
+        self.host = host
+        # use 0 to bind any available port
+        self.port = port
+        self.strategy_name = strategy_name
+        self.use_results_cache = use_results_cache
+        self.replay_evaluations = replay_evaluations
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_job_attempts = max_job_attempts
+        self.workers = []
+        self.slots_count = 0
+        self._setup = None
+        self._jobs_queue = collections.deque()
+        self._job_ids = itertools.count()
+        self._jobs = {}
+        # worker connections writer by handler task
+        self._connections = {}
+        self._is_stopping = False
+        self._loop = None
+        self._thread = None
+        self._server = None
+
+    def start(self):
+        self._setup = {
+            protocol.STRATEGY: self.strategy_name,
+            protocol.DATA_FILES: protocol.get_data_files_hashes(),
+            protocol.USE_RESULTS_CACHE: self.use_results_cache,
+            protocol.REPLAY_EVALUATIONS: self.replay_evaluations,
+        }
+        self._is_stopping = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self._start_server(), self._loop).result()
+        except Exception:
+            self._close_loop()
+            raise
+        self.logger.info(f"Waiting for optimizer workers on {self.host}:{self.port}.")
+
+    def stop(self):
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        finally:
+            self._close_loop()
+
+    def submit_job(self, descriptor):
+        """
+        :param descriptor: the job descriptor as returned by protocol.get_job_descriptor
+        :return: a concurrent.futures.Future of the job TestSuiteResult and errors set
+        """
+        future = concurrent.futures.Future()
+        self._loop.call_soon_threadsafe(self._add_job, descriptor, future)
+        return future
+
+    async def _start_server(self):
+        self._server = await asyncio.start_server(self._handle_worker, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _stop(self):
+        self._is_stopping = True
+        self._server.close()
+        for worker in self.workers:
+            protocol.write_message(worker.writer, protocol.STOP)
+        # closed connections stop their handler
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        for job in self._jobs.values():
+            job.future.cancel()
+        self._jobs = {}
+        self._jobs_queue.clear()
+
+    def _close_loop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def _add_job(self, descriptor, future):
+        job = _Job(next(self._job_ids), descriptor, future)
+        self._jobs[job.job_id] = job
+        self._jobs_queue.append(job)
+        self._dispatch_jobs()
+
+    def _dispatch_jobs(self):
+        for worker in self.workers:
+            while self._jobs_queue and len(worker.jobs) < worker.slots:
+                job = self._jobs_queue.popleft()
+                job.attempts += 1
+                worker.jobs[job.job_id] = job
+                protocol.write_message(worker.writer, protocol.JOB, job_id=job.job_id, descriptor=job.descriptor)
+
+    async def _handle_worker(self, reader, writer):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        worker = None
+        name = writer.get_extra_info("peername")
+        try:
+            hello = await self._read_message(reader, protocol.HELLO)
+            name = hello.get(protocol.NAME, name)
+            await protocol.send_message(writer, protocol.SETUP, **self._setup)
+            answer = await self._read_message(reader, protocol.READY, protocol.REJECT)
+            if answer[protocol.TYPE] == protocol.REJECT:
+                self.logger.error(f"Optimizer worker {name} rejected this optimizer: {answer.get(protocol.REASON)}")
+                return
+            worker = _WorkerConnection(name, max(int(hello.get(protocol.SLOTS, 1)), 1), writer)
+            self._add_worker(worker)
+            while True:
+                # any message is a sign of life: heartbeats only have to be sent when nothing else is
+                message = await self._read_message(reader, protocol.RESULT, protocol.HEARTBEAT)
+                if message[protocol.TYPE] == protocol.RESULT:
+                    self._on_job_result(worker, message)
+        except asyncio.TimeoutError:
+            self.logger.error(f"Optimizer worker {name} stopped answering.")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            if not self._is_stopping:
+                self.logger.error(f"Lost connection with optimizer worker {name}.")
+        except RuntimeError as e:
+            self.logger.error(f"Invalid message from optimizer worker {name}: {e}")
+        finally:
+            if worker is not None:
+                self._remove_worker(worker)
+            writer.close()
+            self._connections.pop(task)
+
+    async def _read_message(self, reader, *expected_types):
+        message = await asyncio.wait_for(protocol.read_message(reader), self.heartbeat_timeout)
+        if message[protocol.TYPE] not in expected_types:
+            raise RuntimeError(f"unexpected {message[protocol.TYPE]} message")
+        return message
+
+    def _add_worker(self, worker):
+        self.workers.append(worker)
+        self.slots_count += worker.slots
+        self.logger.info(f"Optimizer worker {worker.name} connected with {worker.slots} slot(s).")
+        self._dispatch_jobs()
+
+    def _remove_worker(self, worker):
+        self.workers.remove(worker)
+        self.slots_count -= worker.slots
+        if self._is_stopping:
+            return
+        if worker.jobs:
+            self.logger.warning(f"Re-queueing {len(worker.jobs)} job(s) of optimizer worker {worker.name}.")
+        # lost jobs are the oldest ones: run them first
+        for job in reversed(list(worker.jobs.values())):
+            if job.attempts >= self.max_job_attempts:
+                self._jobs.pop(job.job_id)
+                job.future.set_exception(RuntimeError(f"Optimizer job {job.descriptor} failed: "
+                                                      f"{job.attempts} worker(s) were lost while running it"))
+            else:
+                self._jobs_queue.appendleft(job)
+        worker.jobs = {}
+        self._dispatch_jobs()
+
+    def _on_job_result(self, worker, message):
+        job = worker.jobs.pop(message.get(protocol.JOB_ID), None)
+        if job is None:
+            self.logger.warning(f"Ignored result of unknown job from optimizer worker {worker.name}.")
+            return
+        self._jobs.pop(job.job_id)
+        if not job.future.cancelled():
+            if message.get(protocol.ERROR) is None:
+                try:
+                    job.future.set_result(protocol.deserialize_test_suite_result(message[protocol.RESULT]))
+                except (KeyError, TypeError) as e:
+                    job.future.set_exception(RuntimeError(f"Invalid job result from optimizer worker "
+                                                          f"{worker.name}: {e}"))
+            else:
+                job.future.set_exception(RuntimeError(f"Optimizer job {job.descriptor} failed on worker "
+                                                      f"{worker.name}: {message[protocol.ERROR]}"))
+        self._dispatch_jobs()
+
+
+class _WorkerConnection:
+    def __init__(self, name, slots, writer):
+        self.name = name
+        self.slots = slots
+        self.writer = writer
+        self.jobs = {}
+
+
+class _Job:
+    def __init__(self, job_id, descriptor, future):
+        self.job_id = job_id
+        self.descriptor = descriptor
+        self.future = future
+        self.attempts = 0
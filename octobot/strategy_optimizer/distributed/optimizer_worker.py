@@ -0,0 +1,235 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import multiprocessing
+import os
+import socket
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.logging as common_logging
+
+import octobot_evaluators.constants as evaluator_constants
+
+import octobot.backtesting as octobot_backtesting
+import octobot.constants as constants
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.distributed.protocol as protocol
+
+
+class OptimizerWorker:
+    """
+    OptimizerWorker runs the jobs of an OptimizerCoordinator using its local configuration and data files
+    """
+
+    def __init__(self, config, tentacles_setup_config, name=None, slots=1,
+                 heartbeat_interval=constants.OPTIMIZER_DISTRIBUTED_HEARTBEAT_INTERVAL):
+        self.logger = common_logging.get_logger(self.__class__.__name__)
+        self.config = config
+        self.tentacles_setup_config = tentacles_setup_config
+        self.name = f"{socket.gethostname()}-{os.getpid()}" if name is None else name
+        self.slots = slots
+        self.heartbeat_interval = heartbeat_interval
+        self.strategy_class = None
+        self.results_cache = None
+        self.evaluations_recordings_folder = None
+        self.completed_jobs_count = 0
+        self._executor = None
+        self._send_lock = None
+
+    async def run(self, host, port):
+        """
+        Runs the coordinator jobs until it stops or the connection is lost
+        """
+        reader, writer = await self._connect(host, port)
+        # heartbeats and results are sent concurrently
+        self._send_lock = asyncio.Lock()
+        tasks = set()
+        try:
+            await protocol.send_message(writer, protocol.HELLO, name=self.name, slots=self.slots)
+            reject_reason = self._apply_setup(await protocol.read_message(reader))
+            if reject_reason is not None:
+                self.logger.error(f"Can't run optimizer jobs: {reject_reason}")
+                await protocol.send_message(writer, protocol.REJECT, reason=reject_reason)
+                return
+            await protocol.send_message(writer, protocol.READY)
+            self.logger.info(f"Running {self.strategy_class.get_name()} optimizer jobs from {host}:{port}.")
+            self._executor = self._create_executor()
+            tasks.add(asyncio.create_task(self._send_heartbeats(writer)))
+            while True:
+                message = await protocol.read_message(reader)
+                if message[protocol.TYPE] == protocol.STOP:
+                    break
+                if message[protocol.TYPE] == protocol.JOB:
+                    task = asyncio.create_task(self._run_job(writer, message[protocol.JOB_ID],
+                                                             message[protocol.DESCRIPTOR]))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            self.logger.error(f"Lost connection with optimizer coordinator at {host}:{port}.")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+            self._shutdown_executor()
+            self.logger.info(f"Stopped after {self.completed_jobs_count} optimizer job(s).")
+
+    async def _connect(self, host, port):
+        attempt = 1
+        while True:
+            try:
+                return await asyncio.open_connection(host, port)
+            except OSError as e:
+                if attempt >= constants.OPTIMIZER_DISTRIBUTED_CONNECTION_ATTEMPTS:
+                    raise
+                self.logger.warning(f"Can't connect to optimizer coordinator at {host}:{port} ({e}), retrying in "
+                                    f"{constants.OPTIMIZER_DISTRIBUTED_CONNECTION_RETRY_DELAY} seconds.")
+                attempt += 1
+                await asyncio.sleep(constants.OPTIMIZER_DISTRIBUTED_CONNECTION_RETRY_DELAY)
+
+    def _apply_setup(self, setup):
+        """
+        :return: the reason why the given setup can't be used or None
+        """
+        if setup[protocol.TYPE] != protocol.SETUP:
+            return f"unexpected {setup[protocol.TYPE]} message"
+        self.strategy_class = octobot_backtesting.TENTACLES_INDEX.get_class(
+            setup[protocol.STRATEGY], octobot_backtesting.tentacles_index.STRATEGY)
+        if self.strategy_class is None:
+            return f"{setup[protocol.STRATEGY]} strategy is not installed"
+        local_data_files = protocol.get_data_files_hashes()
+        for data_file, data_file_hash in setup[protocol.DATA_FILES].items():
+            if data_file not in local_data_files:
+                return f"missing {data_file} data file"
+            if local_data_files[data_file] != data_file_hash:
+                return f"{data_file} data file is different from the coordinator one"
+        self.results_cache = strategy_optimizer.OptimizerResultsCache() \
+            if setup[protocol.USE_RESULTS_CACHE] else None
+        self.evaluations_recordings_folder = constants.OPTIMIZER_EVALUATIONS_RECORDINGS_FOLDER \
+            if setup[protocol.REPLAY_EVALUATIONS] else None
+        return None
+
+    def _create_executor(self):
+        if self.slots > 1:
+            # jobs configuration overlays are sent to the processes without their shared base configuration
+            octobot_backtesting.set_shared_base_config(self.config)
+            return concurrent.futures.ProcessPoolExecutor(max_workers=self.slots,
+                                                          mp_context=multiprocessing.get_context("spawn"),
+                                                          initializer=strategy_optimizer.init_worker_process,
+                                                          initargs=(logging.ERROR, self.config))
+        # run test suites out of the connection event loop to keep sending heartbeats
+        return concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.__class__.__name__)
+
+    def _shutdown_executor(self):
+        if self._executor is None:
+            return
+        if isinstance(self._executor, concurrent.futures.ThreadPoolExecutor):
+            self._executor.submit(strategy_optimizer.close_event_loop)
+        else:
+            octobot_backtesting.set_shared_base_config(None)
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    async def _send_heartbeats(self, writer):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self._send_message(writer, protocol.HEARTBEAT)
+
+    async def _send_message(self, writer, message_type, **content):
+        async with self._send_lock:
+            await protocol.send_message(writer, message_type, **content)
+
+    async def _run_job(self, writer, job_id, descriptor):
+        try:
+            config = octobot_backtesting.ConfigurationOverlay(self.config, {
+                (commons_constants.CONFIG_TRADING, commons_constants.CONFIG_TRADER_RISK): descriptor[protocol.RISK],
+                (evaluator_constants.CONFIG_FORCED_TIME_FRAME,): descriptor[protocol.TIME_FRAMES],
+            })
+            backtesting_window = descriptor.get(protocol.BACKTESTING_WINDOW)
+            abort_rules = descriptor.get(protocol.ABORT_RULES)
+            synthetic_market_path = descriptor.get(protocol.SYNTHETIC_MARKET_PATH)
+            test_suite_result, errors = await asyncio.get_event_loop().run_in_executor(
+                self._executor,
+                functools.partial(strategy_optimizer.run_test_suite,
+                                  config,
+                                  self.tentacles_setup_config,
+                                  self.strategy_class,
+                                  descriptor[protocol.EVALUATORS],
+                                  results_cache=self.results_cache,
+                                  evaluations_recordings_folder=self.evaluations_recordings_folder,
+                                  tentacles_activation=descriptor[protocol.TENTACLES_ACTIVATION],
+                                  tentacles_settings=descriptor.get(protocol.TENTACLES_SETTINGS),
+                                  scenarios=descriptor.get(protocol.SCENARIOS),
+                                  release_memory=descriptor.get(protocol.RELEASE_MEMORY, False),
+                                  skipped_data_files=descriptor.get(protocol.SKIPPED_DATA_FILES),
+                                  batch_data_files=descriptor.get(protocol.BATCH_DATA_FILES, False),
+                                  backtesting_window=None if backtesting_window is None
+                                  else octobot_backtesting.BacktestingWindow.from_dict(backtesting_window),
+                                  abort_rules=None if abort_rules is None
+                                  else octobot_backtesting.BacktestingAbortRules.from_dict(abort_rules),
+                                  synthetic_market_path=None if synthetic_market_path is None
+                                  else octobot_backtesting.SyntheticMarketPath.from_dict(synthetic_market_path))
+            )
+            content = {protocol.RESULT: protocol.serialize_test_suite_result(test_suite_result, errors)}
+        except Exception as e:
+            self.logger.exception(e, True, f"Error when running optimizer job {descriptor}: {e}")
+            content = {protocol.ERROR: str(e) or e.__class__.__name__}
+        await self._send_message(writer, protocol.RESULT, job_id=job_id, **content)
+        self.completed_jobs_count += 1
+
+
+def run_worker(host, port, config, tentacles_setup_config, slots=1, name=None):
+    """
+    Runs an OptimizerWorker in the current thread until its coordinator stops
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(OptimizerWorker(config, tentacles_setup_config, name=name, slots=slots).run(host, port))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def start_local_workers(host, port, config, tentacles_setup_config, count):
+    """
+    Starts count OptimizerWorker processes on this host: a stand-in for remote workers
+    :return: the started processes
+    """
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_run_local_worker, args=(host, port, config, tentacles_setup_config, f"local-{index}"),
+                        name=f"{OptimizerWorker.__name__}-{index}", daemon=True)
+        for index in range(count)
+    ]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def stop_local_workers(processes, timeout=constants.OPTIMIZER_DISTRIBUTED_HEARTBEAT_TIMEOUT):
+    for process in processes:
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+
+
+def _run_local_worker(host, port, config, tentacles_setup_config, name):
+    common_logging.set_global_logger_level(logging.ERROR)
+    run_worker(host, port, config, tentacles_setup_config, name=name)
@@ -0,0 +1,178 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import os
+import struct
+
+import octobot.backtesting.abstract_backtesting_test as abstract_backtesting_test
+import octobot.constants as constants
+import octobot.strategy_optimizer as strategy_optimizer
+
+# messages types
+HELLO = "hello"
+SETUP = "setup"
+READY = "ready"
+REJECT = "reject"
+JOB = "job"
+RESULT = "result"
+HEARTBEAT = "heartbeat"
+STOP = "stop"
+
+# messages keys
+TYPE = "type"
+NAME = "name"
+SLOTS = "slots"
+REASON = "reason"
+STRATEGY = "strategy"
+DATA_FILES = "data_files"
+USE_RESULTS_CACHE = "use_results_cache"
+REPLAY_EVALUATIONS = "replay_evaluations"
+JOB_ID = "job_id"
+DESCRIPTOR = "descriptor"
+ERROR = "error"
+ERRORS = "errors"
+
+# job descriptors keys
+EVALUATORS = "evaluators"
+TIME_FRAMES = "time_frames"
+RISK = "risk"
+TENTACLES_ACTIVATION = "tentacles_activation"
+SCENARIOS = "scenarios"
+RELEASE_MEMORY = "release_memory"
+SKIPPED_DATA_FILES = "skipped_data_files"
+BACKTESTING_WINDOW = "backtesting_window"
+ABORT_RULES = "abort_rules"
+BATCH_DATA_FILES = "batch_data_files"
+SYNTHETIC_MARKET_PATH = "synthetic_market_path"
+TENTACLES_SETTINGS = "tentacles_settings"
+
+# test suite results keys
+RUN_PROFITABILITIES = "run_profitabilities"
+TRADES_COUNTS = "trades_counts"
+OVERHEAD_TIME = "overhead_time"
+PEAK_MEMORY = "peak_memory"
+ABORTED_RUNS_COUNT = "aborted_runs_count"
+
+# messages are sent as a 4 bytes big endian size followed by the utf-8 encoded json message
+_HEADER = struct.Struct("!I")
+
+
+async def send_message(writer, message_type, **content):
+    write_message(writer, message_type, **content)
+    await writer.drain()
+
+
+def write_message(writer, message_type, **content):
+    """
+    Writes a message without waiting for it to be sent
+    """
+    content[TYPE] = message_type
+    payload = json.dumps(content).encode()
+    writer.write(_HEADER.pack(len(payload)) + payload)
+
+
+async def read_message(reader):
+    """
+    :return: the next message from reader, raises asyncio.IncompleteReadError when the connection is closed
+    """
+    size, = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if size > constants.OPTIMIZER_DISTRIBUTED_MAX_MESSAGE_SIZE:
+        raise RuntimeError(f"Invalid optimizer message size: {size} bytes")
+    message = json.loads((await reader.readexactly(size)).decode())
+    if not isinstance(message, dict) or TYPE not in message:
+        raise RuntimeError(f"Invalid optimizer message: {message}")
+    return message
+
+
+def get_job_descriptor(run_config, activated_evaluators, tentacles_activation, scenarios=None,
+                       backtesting_window=None, release_memory=False, skipped_data_files=None, abort_rules=None,
+                       batch_data_files=False, synthetic_market_path=None):
+    return {
+        EVALUATORS: list(activated_evaluators),
+        TIME_FRAMES: run_config.get_time_frames_config(),
+        RISK: run_config.risk,
+        TENTACLES_ACTIVATION: tentacles_activation,
+        TENTACLES_SETTINGS: run_config.get_tentacles_settings_config(),
+        SCENARIOS: scenarios,
+        BACKTESTING_WINDOW: None if backtesting_window is None else backtesting_window.to_dict(),
+        RELEASE_MEMORY: release_memory,
+        SKIPPED_DATA_FILES: skipped_data_files,
+        ABORT_RULES: None if abort_rules is None else abort_rules.to_dict(),
+        BATCH_DATA_FILES: batch_data_files,
+        SYNTHETIC_MARKET_PATH: None if synthetic_market_path is None else synthetic_market_path.to_dict(),
+    }
+
+
+def serialize_test_suite_result(test_suite_result, errors):
+    return {
+        RUN_PROFITABILITIES: test_suite_result.run_profitabilities,
+        TRADES_COUNTS: test_suite_result.trades_counts,
+        RISK: test_suite_result.risk,
+        TIME_FRAMES: [getattr(time_frame, "value", time_frame) for time_frame in test_suite_result.time_frames],
+        EVALUATORS: test_suite_result.evaluators,
+        STRATEGY: test_suite_result.strategy,
+        TENTACLES_SETTINGS: test_suite_result.tentacles_settings,
+        OVERHEAD_TIME: test_suite_result.overhead_time,
+        PEAK_MEMORY: test_suite_result.peak_memory,
+        DATA_FILES: test_suite_result.data_files,
+        ABORTED_RUNS_COUNT: test_suite_result.aborted_runs_count,
+        ERRORS: sorted(errors),
+    }
+
+
+def deserialize_test_suite_result(result):
+    """
+    :return: the TestSuiteResult and the set of errors descriptions of the given serialized result
+    """
+    test_suite_result = strategy_optimizer.TestSuiteResult(
+        [tuple(profitabilities) for profitabilities in result[RUN_PROFITABILITIES]],
+        result[TRADES_COUNTS],
+        result[RISK],
+        result[TIME_FRAMES],
+        result[EVALUATORS],
+        result[STRATEGY],
+        tentacles_settings=result.get(TENTACLES_SETTINGS),
+        data_files=result.get(DATA_FILES)
+    )
+    test_suite_result.overhead_time = result[OVERHEAD_TIME]
+    test_suite_result.peak_memory = result.get(PEAK_MEMORY, 0)
+    test_suite_result.aborted_runs_count = result.get(ABORTED_RUNS_COUNT, 0)
+    return test_suite_result, set(result[ERRORS])
+
+
+def get_data_files_hashes():
+    """
+    :return: the hash of each available test suite data file by file name: data files folders can be different
+    on each host
+    """
+    data_files = set(abstract_backtesting_test.DATA_FILES.values()) | \
+        set(abstract_backtesting_test.EXTENDED_DATA_FILES.values())
+    return {
+        os.path.basename(data_file): strategy_optimizer.optimizer_results_cache.get_data_file_hash(data_file)
+        for data_file in data_files
+        if os.path.isfile(data_file)
+    }
+
+
+def parse_address(address):
+    """
+    :param address: a "host:port" address
+    :return: the host and the port of the given address
+    """
+    host, separator, port = address.rpartition(":")
+    if not separator or not port.isdigit():
+        raise RuntimeError(f"Invalid optimizer address: {address}, expected format is host:port")
+    return host, int(port)
@@ -0,0 +1,145 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import concurrent.futures
+import multiprocessing
+import multiprocessing.connection
+import time
+
+FORK_START_METHOD = "fork"
+
+
+class ForkServer:
+    """
+    ForkServer runs each submitted call in a process forked from the current one: forked processes inherit the
+    imported modules and loaded data of the current process copy-on-write instead of loading them again. Any state
+    built by the submitted call itself, such as initialized evaluators, is built again in each forked process.
+    Calls are started and their results collected while waiting for a result: no thread is started in the current
+    process, it is always safe to fork.
+    """
+
+    def __init__(self, max_workers, initializer=None):
+        if FORK_START_METHOD not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Fork server is not available on this platform: processes can't be forked")
+        if max_workers < 1:
+            raise RuntimeError(f"Invalid fork server workers count: {max_workers}")
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self._context = multiprocessing.get_context(FORK_START_METHOD)
+        self._queued_calls = collections.deque()
+        # {result connection: (process, future)}
+        self._running_calls = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def submit(self, function, *args, **kwargs):
+        """
+        :return: a future of the result of function(*args, **kwargs) called in a forked process
+        """
+        future = _ForkedCallFuture(self)
+        self._queued_calls.append((future, function, args, kwargs))
+        self._start_queued_calls()
+        return future
+
+    def wait(self, future, timeout=None):
+        """
+        Collects the finished calls results and starts the queued calls until future is done
+        :param timeout: when set, raises concurrent.futures.TimeoutError if future is not done after timeout seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not future.done():
+            if not self._running_calls:
+                raise RuntimeError(f"{future} has not been submitted to this fork server")
+            remaining_time = None if deadline is None else max(deadline - time.monotonic(), 0)
+            ready_connections = multiprocessing.connection.wait(list(self._running_calls), timeout=remaining_time)
+            if not ready_connections and remaining_time is not None and deadline <= time.monotonic():
+                raise concurrent.futures.TimeoutError()
+            for connection in ready_connections:
+                self._collect_result(connection)
+            self._start_queued_calls()
+
+    def shutdown(self):
+        for future, _, _, _ in self._queued_calls:
+            future.cancel()
+        self._queued_calls.clear()
+        for connection, (process, future) in self._running_calls.items():
+            process.terminate()
+            process.join()
+            connection.close()
+            future.cancel()
+        self._running_calls.clear()
+
+    def _start_queued_calls(self):
+        while self._queued_calls and len(self._running_calls) < self.max_workers:
+            future, function, args, kwargs = self._queued_calls.popleft()
+            reader, writer = self._context.Pipe(duplex=False)
+            process = self._context.Process(target=_run_forked_call,
+                                            args=(writer, self.initializer, function, args, kwargs),
+                                            daemon=True)
+            process.start()
+            # only the forked process writes: close this end to detect its exit
+            writer.close()
+            self._running_calls[reader] = (process, future)
+
+    def _collect_result(self, connection):
+        process, future = self._running_calls.pop(connection)
+        try:
+            is_error, result = connection.recv()
+        except EOFError:
+            is_error, result = True, RuntimeError(f"Forked process exited without result "
+                                                  f"(exit code: {process.exitcode})")
+        finally:
+            connection.close()
+            # read the result before joining: large results would block the forked process otherwise
+            process.join()
+        if is_error:
+            future.set_exception(result)
+        else:
+            future.set_result(result)
+
+
+class _ForkedCallFuture(concurrent.futures.Future):
+    def __init__(self, fork_server):
+        super().__init__()
+        self._fork_server = fork_server
+
+    def result(self, timeout=None):
+        self._fork_server.wait(self, timeout=timeout)
+        return super().result()
+
+    def exception(self, timeout=None):
+        self._fork_server.wait(self, timeout=timeout)
+        return super().exception()
+
+
+def _run_forked_call(connection, initializer, function, args, kwargs):
+    try:
+        if initializer is not None:
+            initializer()
+        result = False, function(*args, **kwargs)
+    except Exception as e:
+        result = True, e
+    try:
+        connection.send(result)
+    except Exception as e:
+        # unpicklable result
+        connection.send((True, RuntimeError(f"Impossible to send forked call result: {e}")))
+    finally:
+        connection.close()
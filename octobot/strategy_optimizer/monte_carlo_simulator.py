@@ -0,0 +1,74 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy
+
+import octobot.backtesting as octobot_backtesting
+import octobot.constants as constants
+
+MEAN = "mean"
+STD = "std"
+PERCENTILES = "percentiles"
+PATHS_COUNT = "paths_count"
+
+
+class MonteCarloSimulator:
+    """
+    MonteCarloSimulator collects the scores of configurations run on each of paths_count synthetic market paths to
+    report their scores distribution instead of their score on the historical data files only
+    """
+
+    def __init__(self, paths_count, block_size=constants.BACKTESTING_SYNTHETIC_PATHS_BLOCK_SIZE, seed=0,
+                 percentiles=constants.OPTIMIZER_MONTE_CARLO_PERCENTILES):
+        if paths_count < 1:
+            raise RuntimeError(f"Invalid Monte Carlo paths count: {paths_count}")
+        self.paths_count = paths_count
+        self.block_size = block_size
+        self.seed = seed
+        self.percentiles = list(percentiles)
+        self._scores = {}
+
+    def get_market_path(self, index):
+        return octobot_backtesting.SyntheticMarketPath(index, self.paths_count, block_size=self.block_size,
+                                                       seed=self.seed)
+
+    def add_result(self, run_config, test_suite_result):
+        self._scores.setdefault(run_config, []).append(test_suite_result.get_average_score())
+
+    def get_scores_distribution(self, run_config):
+        """
+        :return: the mean, standard deviation and percentiles of the scores of run_config on the synthetic paths
+        """
+        scores = numpy.array(self._scores[run_config], dtype=numpy.float64)
+        return {
+            PATHS_COUNT: len(scores),
+            MEAN: float(scores.mean()),
+            STD: float(scores.std()),
+            PERCENTILES: dict(zip(self.percentiles, numpy.percentile(scores, self.percentiles).tolist())),
+        }
+
+    def get_report(self):
+        """
+        :return: the (run configuration, scores distribution) of each configuration from the best mean score to the
+        worst one
+        """
+        return sorted(((run_config, self.get_scores_distribution(run_config)) for run_config in self._scores),
+                      key=lambda result: result[1][MEAN], reverse=True)
+
+
+def get_distribution_string(distribution):
+    percentiles = ", ".join(f"p{percentile}: {score:f}" for percentile, score in distribution[PERCENTILES].items())
+    return f"mean score: {distribution[MEAN]:f} std: {distribution[STD]:f} {percentiles} " \
+           f"on {distribution[PATHS_COUNT]} paths"
@@ -0,0 +1,109 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import pickle
+import time
+
+import octobot.constants as constants
+
+VERSION = "version"
+STRATEGY = "strategy"
+SEARCH_SPACE = "search_space"
+SEARCH_STRATEGY = "search_strategy"
+RUN_ID = "run_id"
+RUN_CONFIGURATIONS = "run_configurations"
+RUN_RESULTS = "run_results"
+RESULTS_TABLE = "results_table"
+RESULT_ROWS = "result_rows"
+ERRORS = "errors"
+
+
+class OptimizerCheckpoint:
+    """
+    OptimizerCheckpoint periodically saves the strategy optimizer progress into a local file
+    to be able to resume it later
+    """
+
+    def __init__(self, checkpoint_file, save_interval=constants.OPTIMIZER_CHECKPOINT_SAVE_INTERVAL):
+        self.checkpoint_file = checkpoint_file
+        self.save_interval = save_interval
+        self.last_save_time = time.time()
+
+    def exists(self):
+        return os.path.isfile(self.checkpoint_file)
+
+    def save_if_necessary(self, optimizer):
+        if time.time() - self.last_save_time >= self.save_interval:
+            self.save(optimizer)
+
+    def save(self, optimizer):
+        checkpoint = {
+            VERSION: constants.LONG_VERSION,
+            STRATEGY: optimizer.strategy_class.get_name(),
+            SEARCH_SPACE: _get_search_space(optimizer),
+            SEARCH_STRATEGY: optimizer.search_strategy.get_name(),
+            RUN_ID: optimizer.run_id,
+            RUN_CONFIGURATIONS: optimizer.run_configurations,
+            RUN_RESULTS: optimizer.run_results,
+            # bounded memory sessions only keep some full results: rows are required to restore the other ones
+            RESULTS_TABLE: optimizer.results_table,
+            RESULT_ROWS: optimizer.result_rows,
+            ERRORS: optimizer.errors,
+        }
+        checkpoint_folder = os.path.dirname(self.checkpoint_file)
+        if checkpoint_folder:
+            os.makedirs(checkpoint_folder, exist_ok=True)
+        # write then rename to always keep a complete checkpoint file
+        temp_file = f"{self.checkpoint_file}.tmp"
+        with open(temp_file, "wb") as file:
+            pickle.dump(checkpoint, file)
+        os.replace(temp_file, self.checkpoint_file)
+        self.last_save_time = time.time()
+
+    def load(self, optimizer):
+        """
+        Restores the optimizer progress from the checkpoint file
+        :return: the number of restored runs
+        """
+        with open(self.checkpoint_file, "rb") as file:
+            checkpoint = pickle.load(file)
+        for key, expected_value in ((STRATEGY, optimizer.strategy_class.get_name()),
+                                    (SEARCH_SPACE, _get_search_space(optimizer)),
+                                    (SEARCH_STRATEGY, optimizer.search_strategy.get_name())):
+            if checkpoint[key] != expected_value:
+                raise RuntimeError(f"Impossible to resume from {self.checkpoint_file}: checkpoint {key} "
+                                   f"({checkpoint[key]}) is different from the current one ({expected_value})")
+        optimizer.run_id = checkpoint[RUN_ID]
+        optimizer.errors = checkpoint[ERRORS]
+        if RESULTS_TABLE in checkpoint:
+            optimizer.restore_results_table(checkpoint[RESULTS_TABLE], checkpoint[RESULT_ROWS],
+                                            checkpoint[RUN_CONFIGURATIONS], checkpoint[RUN_RESULTS])
+            return len(checkpoint[RESULTS_TABLE])
+        for run_config, run_result in zip(checkpoint[RUN_CONFIGURATIONS], checkpoint[RUN_RESULTS]):
+            optimizer.restore_run_result(run_config, run_result)
+        return len(checkpoint[RUN_RESULTS])
+
+
+def _get_search_space(optimizer):
+    return {
+        "risks": list(optimizer.risks),
+        "evaluators": list(optimizer.all_TAs),
+        "time_frames": [time_frame.value for time_frame in optimizer.all_time_frames],
+        "tentacles_settings": list(optimizer.tentacles_settings),
+        "constraints": None if optimizer.constraints is None else optimizer.constraints.to_dict(),
+        # total_nb_runs changes during pre-screened sessions: use the search strategy runs count
+        "max_runs_count": optimizer.search_strategy.max_runs_count
+    }
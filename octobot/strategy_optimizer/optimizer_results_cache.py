@@ -0,0 +1,157 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import hashlib
+import json
+import os
+
+import octobot_commons.logging as common_logging
+
+import octobot.constants as constants
+
+PROFITABILITY_RESULT = "profitability_result"
+TRADES_COUNT = "trades_count"
+
+
+class OptimizerResultsCache:
+    """
+    OptimizerResultsCache is an on-disk cache of the strategy optimizer scenarios results.
+    Results are addressed by a fingerprint of the run configuration and the content of the scenario data file.
+    """
+
+    def __init__(self, cache_folder=constants.OPTIMIZER_RESULTS_CACHE_FOLDER,
+                 max_size=constants.OPTIMIZER_RESULTS_CACHE_MAX_SIZE):
+        self.logger = common_logging.get_logger(self.__class__.__name__)
+        self.cache_folder = cache_folder
+        self.max_size = max_size
+        self.hits_count = 0
+        self.misses_count = 0
+        self._size = None
+
+    @staticmethod
+    def get_run_fingerprint(**run_description):
+        return _get_hash(json.dumps(run_description, sort_keys=True, default=str).encode())
+
+    @staticmethod
+    def get_scenario_key(run_fingerprint, data_file):
+        return _get_hash(f"{run_fingerprint}{get_data_file_hash(data_file)}".encode())
+
+    def get(self, key):
+        """
+        :return: the cached (profitability_result, trades_count) tuple or None
+        """
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path) as entry_file:
+                entry = json.load(entry_file)
+            # update modification time to evict least recently used entries first
+            os.utime(entry_path)
+            self.hits_count += 1
+            return tuple(entry[PROFITABILITY_RESULT]), entry[TRADES_COUNT]
+        except FileNotFoundError:
+            self.misses_count += 1
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"Ignoring invalid optimizer results cache entry {entry_path}: {e}")
+            self.misses_count += 1
+            return None
+
+    def set(self, key, profitability_result, trades_count):
+        entry_path = self._get_entry_path(key)
+        size = self.get_size()
+        if os.path.isfile(entry_path):
+            size -= os.path.getsize(entry_path)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # write then rename to never expose partially written entries to other processes
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as entry_file:
+            json.dump({PROFITABILITY_RESULT: list(profitability_result), TRADES_COUNT: trades_count}, entry_file)
+        os.replace(temp_path, entry_path)
+        self._size = size + os.path.getsize(entry_path)
+        if self._size > self.max_size:
+            self.evict()
+
+    def get_size(self):
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._get_entries())
+        return self._size
+
+    def evict(self):
+        # entries can be written or evicted by other processes: use the actual cache content
+        entries = sorted(self._get_entries())
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in entries:
+            if self._size <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+
+    def clear(self):
+        for _, _, entry_path in self._get_entries():
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+        self._size = 0
+
+    def _get_entry_path(self, key):
+        # split entries into sub folders to keep folders small
+        return os.path.join(self.cache_folder, key[:2], f"{key}.json")
+
+    def _get_entries(self):
+        entries = []
+        if os.path.isdir(self.cache_folder):
+            for sub_folder in os.scandir(self.cache_folder):
+                if sub_folder.is_dir():
+                    for entry in os.scandir(sub_folder.path):
+                        if entry.name.endswith(".json"):
+                            try:
+                                entry_stat = entry.stat()
+                                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+                            except FileNotFoundError:
+                                pass
+        return entries
+
+
+_DATA_FILE_HASHES = {}
+
+
+def get_data_file_hash(data_file):
+    file_stat = os.stat(data_file)
+    identifier = (data_file, file_stat.st_mtime, file_stat.st_size)
+    if identifier not in _DATA_FILE_HASHES:
+        file_hash = hashlib.sha256()
+        with open(data_file, "rb") as file:
+            for chunk in iter(lambda: file.read(constants.OPTIMIZER_RESULTS_CACHE_READ_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+        _DATA_FILE_HASHES[identifier] = file_hash.hexdigest()
+    return _DATA_FILE_HASHES[identifier]
+
+
+def get_data_file_identifier(data_file):
+    """
+    :return: the hash of the given data file or its path when it can't be read
+    """
+    try:
+        return get_data_file_hash(data_file)
+    except OSError:
+        return data_file
+
+
+def _get_hash(content):
+    return hashlib.sha256(content).hexdigest()
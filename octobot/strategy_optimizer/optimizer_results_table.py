@@ -0,0 +1,275 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy
+
+import octobot.constants as constants
+import octobot.strategy_optimizer.configuration_generator as configuration_generator
+
+NO_TIME_FRAME = -1
+
+
+class OptimizerResultsTable:
+    """
+    OptimizerResultsTable stores the strategy optimizer results in columns: one row per run result
+    with its score, trades, risk, tentacles settings id, data files set id, completeness and bit encoded evaluators
+    and time frames sets. Rows are stored in registration order.
+    Rankings are updated when rows are added instead of being sorted again each time they are read.
+    """
+
+    def __init__(self, evaluators, time_frames, initial_capacity=constants.OPTIMIZER_RESULTS_TABLE_INITIAL_CAPACITY):
+        self.evaluators = list(evaluators)
+        self.time_frames = list(time_frames)
+        self._evaluator_indexes = {evaluator: index for index, evaluator in enumerate(self.evaluators)}
+        self._time_frame_indexes = {time_frame.value: index for index, time_frame in enumerate(self.time_frames)}
+        self._tentacles_settings_ids = {}
+        self._tentacles_settings_by_id = []
+        self._data_files_ids = {}
+        self._data_files_by_id = []
+        self._size = 0
+        self._scores = numpy.empty(initial_capacity, dtype=numpy.float64)
+        self._risks = numpy.empty(initial_capacity, dtype=numpy.float64)
+        self._trades_sums = numpy.empty(initial_capacity, dtype=numpy.float64)
+        self._trades_counts = numpy.empty(initial_capacity, dtype=numpy.float64)
+        self._min_time_frames = numpy.empty(initial_capacity, dtype=numpy.int16)
+        self._tentacles_settings = numpy.empty(initial_capacity, dtype=numpy.int32)
+        self._data_files = numpy.empty(initial_capacity, dtype=numpy.int32)
+        # incomplete results did not run every scenario: their score can't be compared to complete ones
+        self._complete = numpy.empty(initial_capacity, dtype=numpy.bool_)
+        # bit sets packed in bytes: 1 bit per evaluator / time frame
+        self._evaluators = numpy.empty((initial_capacity, _get_packed_size(self.evaluators)), dtype=numpy.uint8)
+        self._time_frames = numpy.empty((initial_capacity, _get_packed_size(self.time_frames)), dtype=numpy.uint8)
+        # configuration (evaluators, risk and tentacles settings) id of each row
+        self._configuration_ids = {}
+        self._configurations = numpy.empty(initial_capacity, dtype=numpy.int32)
+        self._is_ranking_outdated = False
+        self._init_ranking()
+
+    def __len__(self):
+        return self._size
+
+    def add(self, run_result, is_complete=True):
+        """
+        :param is_complete: False when run_result only ran a part of the test suite scenarios
+        :return: the index of the added row
+        """
+        if self._size == len(self._scores):
+            self._grow()
+        index = self._size
+        self._scores[index] = run_result.get_average_score()
+        self._risks[index] = run_result.risk
+        self._trades_sums[index] = sum(run_result.trades_counts)
+        self._trades_counts[index] = len(run_result.trades_counts)
+        self._min_time_frames[index] = NO_TIME_FRAME if run_result.min_time_frame is None \
+            else self._time_frame_indexes.get(run_result.min_time_frame.value, NO_TIME_FRAME)
+        self._tentacles_settings[index] = _get_value_id(
+            configuration_generator.get_tentacles_settings_from_config(run_result.tentacles_settings),
+            self._tentacles_settings_ids, self._tentacles_settings_by_id)
+        self._data_files[index] = _get_value_id(frozenset(run_result.data_files),
+                                                self._data_files_ids, self._data_files_by_id)
+        self._complete[index] = is_complete
+        self._evaluators[index] = self._get_bit_set(run_result.get_evaluators_without_strategy(),
+                                                    self._evaluator_indexes)
+        self._time_frames[index] = self._get_bit_set(
+            [getattr(time_frame, "value", time_frame) for time_frame in run_result.time_frames],
+            self._time_frame_indexes
+        )
+        self._configurations[index] = _get_value_id(
+            (self._evaluators[index].tobytes(), float(self._risks[index]), int(self._tentacles_settings[index])),
+            self._configuration_ids, None
+        )
+        self._size += 1
+        if self._is_ranking_outdated:
+            self._update_ranking()
+        else:
+            self._rank_row(index)
+        return index
+
+    def update(self, index, run_result):
+        """
+        Adds the results of run_result, which ran the configuration of the given row on other data files, to this row:
+        its score becomes the average score of every data file without running the previous ones again
+        """
+        added_results_count = len(run_result.trades_counts)
+        if added_results_count:
+            results_count = self._trades_counts[index]
+            self._scores[index] = (self._scores[index] * results_count +
+                                   run_result.get_average_score() * added_results_count) / \
+                (results_count + added_results_count)
+            self._trades_sums[index] += sum(run_result.trades_counts)
+            self._trades_counts[index] += added_results_count
+        self._data_files[index] = _get_value_id(self.get_data_files(index).union(run_result.data_files),
+                                                self._data_files_ids, self._data_files_by_id)
+        # rankings are updated when next read
+        self._is_ranking_outdated = True
+
+    def get_score(self, index):
+        return float(self._scores[index])
+
+    def get_data_files(self, index):
+        """
+        :return: the frozenset of the identifiers of the data files run by the configuration of the given row
+        """
+        return self._data_files_by_id[self._data_files[index]]
+
+    def get_run_configuration(self, index):
+        """
+        :return: the RunConfiguration of the given row rebuilt from its columns: the row result doesn't have to be kept
+        """
+        return configuration_generator.RunConfiguration(
+            float(self._risks[index]),
+            self._get_bit_set_elements(self._evaluators[index], self.evaluators),
+            self._get_bit_set_elements(self._time_frames[index], self.time_frames),
+            self._tentacles_settings_by_id[self._tentacles_settings[index]]
+        )
+
+    def get_sorted_indexes(self, time_frame):
+        """
+        :return: the indexes of the rows having time_frame as minimum time frame from the best score to the worst,
+        complete results first, equal scores are kept in registration order
+        """
+        if self._is_ranking_outdated:
+            self._update_ranking()
+        return self._sorted_rows[self.time_frames.index(time_frame)].copy()
+
+    def get_ranking(self):
+        """
+        Ranks results configurations (evaluators, risk and tentacles settings) by the sum of their ranks in each
+        time frame
+        :return: the representative row index, the ranks sum and the average trades count of each configuration
+        from the best one to the worst one
+        """
+        if self._is_ranking_outdated:
+            self._update_ranking()
+        configurations = numpy.flatnonzero(self._first_time_frames[:len(self._configuration_ids)]
+                                           < len(self.time_frames))
+        # position of the representative row of each configuration in the time frames rankings
+        time_frames_offsets = numpy.cumsum([0] + [len(sorted_rows) for sorted_rows in self._sorted_rows])
+        first_positions = time_frames_offsets[self._first_time_frames[configurations]] + \
+            self._first_ranks[configurations]
+        ranks_sums = self._ranks_sums[configurations]
+        trades_counts = self._configuration_trades_counts[configurations]
+        average_trades = numpy.divide(self._configuration_trades_sums[configurations], trades_counts,
+                                      out=numpy.zeros(len(configurations)), where=trades_counts > 0)
+        # sort by ranks sum then by first appearance to keep the ranking of equal ranks sums stable
+        order = numpy.lexsort((first_positions, ranks_sums))
+        return self._first_rows[configurations][order], ranks_sums[order], average_trades[order]
+
+    def _init_ranking(self):
+        # rows of each time frame from the best to the worst and their count of complete results
+        self._sorted_rows = [numpy.empty(0, dtype=numpy.int64) for _ in self.time_frames]
+        self._complete_counts = [0] * len(self.time_frames)
+        # configurations aggregates: ranks sum, trades and first (best time frame, best rank) row
+        configurations_capacity = max(len(self._configuration_ids), 1)
+        self._ranks_sums = numpy.zeros(configurations_capacity, dtype=numpy.float64)
+        self._configuration_trades_sums = numpy.zeros(configurations_capacity, dtype=numpy.float64)
+        self._configuration_trades_counts = numpy.zeros(configurations_capacity, dtype=numpy.float64)
+        self._first_time_frames = numpy.full(configurations_capacity, len(self.time_frames), dtype=numpy.int64)
+        self._first_ranks = numpy.zeros(configurations_capacity, dtype=numpy.int64)
+        self._first_rows = numpy.zeros(configurations_capacity, dtype=numpy.int64)
+
+    def _update_ranking(self):
+        self._init_ranking()
+        for index in range(self._size):
+            self._rank_row(index)
+        self._is_ranking_outdated = False
+
+    def _rank_row(self, index):
+        time_frame_index = int(self._min_time_frames[index])
+        if time_frame_index == NO_TIME_FRAME:
+            return
+        if len(self._configuration_ids) > len(self._ranks_sums):
+            self._grow_configurations()
+        sorted_rows = self._sorted_rows[time_frame_index]
+        complete_count = self._complete_counts[time_frame_index]
+        group_start, group_end = (0, complete_count) if self._complete[index] else (complete_count, len(sorted_rows))
+        # equal scores are ranked in registration order: the added row is the last registered one
+        rank = group_start + int(numpy.searchsorted(-self._scores[sorted_rows[group_start:group_end]],
+                                                    -self._scores[index], side="right"))
+        # every row ranked after the added one loses a rank
+        self._ranks_sums += numpy.bincount(self._configurations[sorted_rows[rank:]], minlength=len(self._ranks_sums))
+        self._first_ranks[(self._first_time_frames == time_frame_index) & (self._first_ranks >= rank)] += 1
+        self._sorted_rows[time_frame_index] = numpy.insert(sorted_rows, rank, index)
+        if self._complete[index]:
+            self._complete_counts[time_frame_index] += 1
+        configuration = self._configurations[index]
+        self._ranks_sums[configuration] += rank
+        self._configuration_trades_sums[configuration] += self._trades_sums[index]
+        self._configuration_trades_counts[configuration] += self._trades_counts[index]
+        if (time_frame_index, rank) < (self._first_time_frames[configuration], self._first_ranks[configuration]):
+            self._first_time_frames[configuration] = time_frame_index
+            self._first_ranks[configuration] = rank
+            self._first_rows[configuration] = index
+
+    def _grow_configurations(self):
+        capacity = len(self._ranks_sums) * 2
+        previous_capacity = len(self._ranks_sums)
+        self._ranks_sums = _resized(self._ranks_sums, capacity)
+        self._configuration_trades_sums = _resized(self._configuration_trades_sums, capacity)
+        self._configuration_trades_counts = _resized(self._configuration_trades_counts, capacity)
+        self._first_time_frames = _resized(self._first_time_frames, capacity)
+        self._first_ranks = _resized(self._first_ranks, capacity)
+        self._first_rows = _resized(self._first_rows, capacity)
+        self._ranks_sums[previous_capacity:] = 0
+        self._configuration_trades_sums[previous_capacity:] = 0
+        self._configuration_trades_counts[previous_capacity:] = 0
+        self._first_time_frames[previous_capacity:] = len(self.time_frames)
+        self._first_ranks[previous_capacity:] = 0
+        self._first_rows[previous_capacity:] = 0
+
+    def _grow(self):
+        capacity = max(len(self._scores) * 2, 1)
+        self._scores = _resized(self._scores, capacity)
+        self._risks = _resized(self._risks, capacity)
+        self._trades_sums = _resized(self._trades_sums, capacity)
+        self._trades_counts = _resized(self._trades_counts, capacity)
+        self._min_time_frames = _resized(self._min_time_frames, capacity)
+        self._tentacles_settings = _resized(self._tentacles_settings, capacity)
+        self._data_files = _resized(self._data_files, capacity)
+        self._complete = _resized(self._complete, capacity)
+        self._configurations = _resized(self._configurations, capacity)
+        self._evaluators = _resized(self._evaluators, capacity)
+        self._time_frames = _resized(self._time_frames, capacity)
+
+    @staticmethod
+    def _get_bit_set_elements(bit_set, elements):
+        return [element for element, bit in zip(elements, numpy.unpackbits(bit_set)) if bit]
+
+    @staticmethod
+    def _get_bit_set(elements, indexes):
+        bits = numpy.zeros(len(indexes), dtype=numpy.bool_)
+        for element in elements:
+            if element in indexes:
+                bits[indexes[element]] = True
+        return numpy.packbits(bits)
+
+
+def _get_value_id(value, value_ids, values_by_id):
+    # rows share the ids of their repeated values instead of storing them
+    if value not in value_ids:
+        value_ids[value] = len(value_ids)
+        if values_by_id is not None:
+            values_by_id.append(value)
+    return value_ids[value]
+
+
+def _get_packed_size(elements):
+    return (len(elements) + 7) // 8
+
+
+def _resized(array, capacity):
+    resized_array = numpy.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    resized_array[:len(array)] = array
+    return resized_array
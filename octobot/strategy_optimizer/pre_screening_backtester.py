@@ -0,0 +1,227 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import math
+
+import numpy
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+
+import octobot_backtesting.api as backtesting_api
+
+import octobot.constants as constants
+import octobot.strategy_optimizer as strategy_optimizer
+
+TIME_INDEX = commons_enums.PriceIndexes.IND_PRICE_TIME.value
+CLOSE_INDEX = commons_enums.PriceIndexes.IND_PRICE_CLOSE.value
+
+
+def get_moving_average(values, period):
+    """
+    :return: the simple moving average of values, nan until period values are available
+    """
+    averages = numpy.full(len(values), numpy.nan)
+    if len(values) >= period:
+        sums = numpy.cumsum(numpy.concatenate(([0], values)))
+        averages[period - 1:] = (sums[period:] - sums[:-period]) / period
+    return averages
+
+
+def get_rsi_notes(closes, period=14):
+    # oversold markets are bullish: low RSI values give negative (buy) notes
+    deltas = numpy.diff(closes, prepend=closes[:1])
+    average_gains = get_moving_average(numpy.clip(deltas, 0, None), period)
+    average_losses = get_moving_average(numpy.clip(-deltas, 0, None), period)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        rsi = numpy.where(average_losses > 0, 100 - 100 / (1 + average_gains / average_losses), 100)
+    return numpy.where(numpy.isnan(average_gains), numpy.nan, (rsi - 50) / 50)
+
+
+def get_double_moving_average_notes(closes, short_period=5, long_period=10):
+    # a short moving average above the long one is an uptrend: negative (buy) notes
+    short_averages = get_moving_average(closes, short_period)
+    long_averages = get_moving_average(closes, long_period)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        return numpy.clip((long_averages - short_averages) / long_averages * 100, -1, 1)
+
+
+def get_bollinger_bands_notes(closes, period=20, deviations=2):
+    # prices close to the upper band give positive (sell) notes
+    averages = get_moving_average(closes, period)
+    variances = numpy.clip(get_moving_average(closes ** 2, period) - averages ** 2, 0, None)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        return numpy.clip((closes - averages) / (deviations * numpy.sqrt(variances)), -1, 1)
+
+
+def get_macd_notes(closes, short_period=12, long_period=26, signal_period=9):
+    # moving averages are simple ones: this is an approximation of the exponential MACD
+    macd = get_moving_average(closes, short_period) - get_moving_average(closes, long_period)
+    histogram = macd - get_moving_average(numpy.nan_to_num(macd), signal_period)
+    return -numpy.sign(numpy.where(numpy.isnan(macd), numpy.nan, histogram))
+
+
+# {evaluator name: function computing the notes of each candle from the candles close prices}
+SIGNAL_FUNCTIONS = {
+    "RSIMomentumEvaluator": get_rsi_notes,
+    "DoubleMovingAverageTrendEvaluator": get_double_moving_average_notes,
+    "BBMomentumEvaluator": get_bollinger_bands_notes,
+    "MACDMomentumEvaluator": get_macd_notes,
+}
+
+
+def get_aligned_notes(close_times, time_frame_close_times, time_frame_notes):
+    """
+    :return: the notes of the last closed time frame candle at each of the given close times, nan when there is none
+    """
+    indexes = numpy.searchsorted(time_frame_close_times, close_times, side="right") - 1
+    return numpy.where(indexes >= 0, time_frame_notes[numpy.clip(indexes, 0, None)], numpy.nan)
+
+
+def get_average_notes(notes):
+    """
+    :return: the average of the given notes arrays ignoring nan notes, nan when every note is nan
+    """
+    notes = numpy.array(notes)
+    known_notes = ~numpy.isnan(notes)
+    counts = known_notes.sum(axis=0)
+    sums = numpy.where(known_notes, notes, 0).sum(axis=0)
+    return numpy.where(counts > 0, sums / numpy.maximum(counts, 1), numpy.nan)
+
+
+def get_approximate_profitabilities(closes, notes, risk, fees_rate, threshold):
+    """
+    Simplified long only fill model: risk of the portfolio is bought at the close of a candle which note is lower
+    than -threshold and sold at the close of a candle which note is higher than threshold. Fees are paid on each fill.
+    :return: the bot and market profitabilities in percent
+    """
+    if len(closes) < 2:
+        return 0, 0
+    signals = numpy.full(len(notes), numpy.nan)
+    signals[notes <= -threshold] = 1
+    signals[notes >= threshold] = 0
+    # keep the previous position between signals
+    last_signal_indexes = numpy.maximum.accumulate(numpy.where(numpy.isnan(signals), 0, numpy.arange(len(signals))))
+    positions = numpy.nan_to_num(signals[last_signal_indexes]) * risk
+    returns = closes[1:] / closes[:-1] - 1
+    fees = numpy.abs(numpy.diff(positions, prepend=0)) * fees_rate
+    portfolio_ratio = numpy.prod(1 + positions[:-1] * returns) * numpy.prod(1 - fees)
+    return (portfolio_ratio - 1) * 100, (closes[-1] / closes[0] - 1) * 100
+
+
+class PreScreeningBacktester:
+    """
+    PreScreeningBacktester approximates the score of optimizer configurations without running any backtesting:
+    evaluators notes are computed in bulk on the data files candles and the average evaluators notes are traded
+    using a simplified fill and fee model. Only configurations which evaluators are all in SIGNAL_FUNCTIONS can be
+    approximated, using their default settings: tentacles settings and the strategy are ignored.
+    """
+
+    def __init__(self, config, data_files, backtesting_window=None,
+                 threshold=constants.OPTIMIZER_PRE_SCREENING_NOTE_THRESHOLD):
+        self.config = config
+        self.data_files = data_files
+        self.backtesting_window = backtesting_window
+        self.threshold = threshold
+        self.fees_rate = config.get(commons_constants.CONFIG_SIMULATOR, {}).get(
+            commons_constants.CONFIG_SIMULATOR_FEES, {}).get(
+            commons_constants.CONFIG_SIMULATOR_FEES_TAKER, constants.OPTIMIZER_PRE_SCREENING_DEFAULT_FEES) / 100
+        # {time frame: (close times, close prices)} of each data file symbol
+        self._candles = None
+        self._notes = {}
+
+    def get_score(self, run_config):
+        """
+        :return: the approximate score of run_config: the average difference between the bot and the market
+        profitabilities or None when one of its evaluators or none of its time frames can be approximated
+        """
+        evaluators = list(run_config.evaluators)
+        if not evaluators or any(evaluator not in SIGNAL_FUNCTIONS for evaluator in evaluators):
+            return None
+        scores = []
+        for candles_index, candles in enumerate(self._get_candles()):
+            time_frames = sorted((time_frame for time_frame in run_config.time_frames if time_frame.value in candles),
+                                 key=lambda time_frame: commons_enums.TimeFramesMinutes[time_frame])
+            if not time_frames:
+                # full runs skip data files without the required time frames as well
+                continue
+            close_times, closes = candles[time_frames[0].value]
+            notes = get_average_notes([
+                get_aligned_notes(close_times, candles[time_frame.value][0],
+                                  self._get_notes(evaluator, candles_index, time_frame))
+                for evaluator in evaluators
+                for time_frame in time_frames
+            ])
+            window = self._get_window_slice(close_times)
+            bot_profitability, market_profitability = get_approximate_profitabilities(
+                closes[window], notes[window], run_config.risk, self.fees_rate, self.threshold)
+            scores.append(bot_profitability - market_profitability)
+        return float(numpy.mean(scores)) if scores else None
+
+    def select(self, run_configs, ratio):
+        """
+        :return: the configurations to fully run: the best ratio of the approximated configurations and every
+        configuration that can't be approximated, and the {run_config: approximate score} of the other ones
+        """
+        scores = {run_config: self.get_score(run_config) for run_config in run_configs}
+        approximated_run_configs = sorted((run_config for run_config in run_configs if scores[run_config] is not None),
+                                          key=scores.__getitem__, reverse=True)
+        rejected_run_configs = set(approximated_run_configs[math.ceil(len(approximated_run_configs) * ratio):])
+        return [run_config for run_config in run_configs if run_config not in rejected_run_configs], \
+            {run_config: scores[run_config] for run_config in rejected_run_configs}
+
+    def _get_notes(self, evaluator, candles_index, time_frame):
+        key = (evaluator, candles_index, time_frame.value)
+        if key not in self._notes:
+            self._notes[key] = SIGNAL_FUNCTIONS[evaluator](self._candles[candles_index][time_frame.value][1])
+        return self._notes[key]
+
+    def _get_window_slice(self, close_times):
+        if self.backtesting_window is None or not len(close_times):
+            return slice(None)
+        start_timestamp, end_timestamp = self.backtesting_window.get_time_range(close_times[0], close_times[-1])
+        return slice(numpy.searchsorted(close_times, start_timestamp),
+                     numpy.searchsorted(close_times, end_timestamp, side="right"))
+
+    def _get_candles(self):
+        if self._candles is None:
+            self._candles = strategy_optimizer.get_event_loop().run_until_complete(self._load_candles())
+        return self._candles
+
+    async def _load_candles(self):
+        candles = []
+        for importer in await backtesting_api.get_importers_from_data_files(self.config, self.data_files):
+            if importer is None:
+                continue
+            try:
+                for symbol in backtesting_api.get_available_symbols(importer):
+                    candles.append({
+                        time_frame.value: _get_close_prices(
+                            await importer.get_ohlcv(exchange_name=importer.exchange_name, symbol=symbol,
+                                                     time_frame=time_frame),
+                            time_frame)
+                        for time_frame in backtesting_api.get_available_time_frames(importer)
+                    })
+            finally:
+                await backtesting_api.stop_importer(importer)
+        return candles
+
+
+def _get_close_prices(ohlcvs, time_frame):
+    # the candle is the last element of each data file row
+    candles = numpy.array([ohlcv[-1] for ohlcv in ohlcvs], dtype=numpy.float64).reshape(len(ohlcvs), -1)
+    candles = candles[numpy.argsort(candles[:, TIME_INDEX], kind="stable")] if len(candles) else candles
+    time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+    return candles[:, TIME_INDEX] + time_frame_seconds, candles[:, CLOSE_INDEX]
@@ -0,0 +1,54 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+
+class RunResultUpdate:
+    """
+    RunResultUpdate describes a strategy optimizer run result as soon as it is available
+    """
+
+    RUN_ID = "run_id"
+    TOTAL_RUNS = "total_runs"
+    RUN_TIME = "run_time"
+    RUNS_PER_MINUTE = "runs_per_minute"
+    ETA = "eta"
+    RESULT = "result"
+
+    def __init__(self, run_id, total_runs, run_config, run_result, run_time, elapsed_time, completed_runs_count):
+        self.run_id = run_id
+        self.total_runs = total_runs
+        self.run_config = run_config
+        self.run_result = run_result
+        # wall time in seconds between the run start and its result
+        self.run_time = run_time
+        self.runs_per_minute = completed_runs_count / elapsed_time * 60 if elapsed_time > 0 else 0
+        remaining_runs = max(total_runs - run_id, 0)
+        # estimated remaining time in seconds
+        self.eta = remaining_runs / self.runs_per_minute * 60 if self.runs_per_minute else None
+
+    def get_update_dict(self):
+        return {
+            self.RUN_ID: self.run_id,
+            self.TOTAL_RUNS: self.total_runs,
+            self.RUN_TIME: round(self.run_time, 3),
+            self.RUNS_PER_MINUTE: round(self.runs_per_minute, 3),
+            self.ETA: None if self.eta is None else round(self.eta, 3),
+            self.RESULT: self.run_result.get_result_dict(self.run_id),
+        }
+
+    def get_progress_string(self):
+        eta = "unknown" if self.eta is None else f"{round(self.eta)}s"
+        return f"{round(self.runs_per_minute, 2)} runs/min, ETA: {eta}"
@@ -0,0 +1,211 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import itertools
+
+import octobot.strategy_optimizer.configuration_generator as configuration_generator
+
+MIN_EVALUATORS = "min_evaluators"
+MAX_EVALUATORS = "max_evaluators"
+REQUIRED_TIME_FRAMES = "required_time_frames"
+FORBIDDEN_TIME_FRAMES = "forbidden_time_frames"
+EXCLUSIVE_EVALUATORS = "exclusive_evaluators"
+
+
+class SearchSpaceConstraints:
+    """
+    SearchSpaceConstraints restricts the optimizer search space:
+    - evaluators combinations have between min_evaluators and max_evaluators evaluators
+    - time frames combinations include every required time frame and no forbidden time frame
+    - evaluators combinations include at most one evaluator of each exclusive evaluators group
+    Constraints are applied when enumerating and sampling configurations: invalid ones are never run.
+    """
+
+    def __init__(self, min_evaluators=1, max_evaluators=None, required_time_frames=None, forbidden_time_frames=None,
+                 exclusive_evaluators=None):
+        self.min_evaluators = max(min_evaluators, 1)
+        self.max_evaluators = max_evaluators
+        # time frames are compared by value
+        self.required_time_frames = sorted(set(_get_time_frame_value(time_frame)
+                                               for time_frame in required_time_frames or []))
+        self.forbidden_time_frames = sorted(set(_get_time_frame_value(time_frame)
+                                                for time_frame in forbidden_time_frames or []))
+        self.exclusive_evaluators = [sorted(set(group)) for group in exclusive_evaluators or []]
+        if set(self.required_time_frames).intersection(self.forbidden_time_frames):
+            raise RuntimeError(f"Time frames can't be both required and forbidden: required: "
+                               f"{self.required_time_frames}, forbidden: {self.forbidden_time_frames}")
+        grouped_evaluators = [evaluator for group in self.exclusive_evaluators for evaluator in group]
+        if len(grouped_evaluators) != len(set(grouped_evaluators)):
+            raise RuntimeError(f"Exclusive evaluators groups must not overlap: {self.exclusive_evaluators}")
+        self._evaluator_groups = {evaluator: index
+                                  for index, group in enumerate(self.exclusive_evaluators)
+                                  for evaluator in group}
+
+    @staticmethod
+    def from_dict(constraints):
+        return SearchSpaceConstraints(min_evaluators=constraints.get(MIN_EVALUATORS, 1),
+                                      max_evaluators=constraints.get(MAX_EVALUATORS),
+                                      required_time_frames=constraints.get(REQUIRED_TIME_FRAMES),
+                                      forbidden_time_frames=constraints.get(FORBIDDEN_TIME_FRAMES),
+                                      exclusive_evaluators=constraints.get(EXCLUSIVE_EVALUATORS))
+
+    def to_dict(self):
+        return {
+            MIN_EVALUATORS: self.min_evaluators,
+            MAX_EVALUATORS: self.max_evaluators,
+            REQUIRED_TIME_FRAMES: self.required_time_frames,
+            FORBIDDEN_TIME_FRAMES: self.forbidden_time_frames,
+            EXCLUSIVE_EVALUATORS: self.exclusive_evaluators,
+        }
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_dict()})"
+
+    def is_valid(self, run_config):
+        return self.is_valid_evaluators(run_config.evaluators) and self.is_valid_time_frames(run_config.time_frames)
+
+    def is_valid_evaluators(self, evaluators):
+        if not self.min_evaluators <= len(evaluators) <= self._get_max_evaluators(evaluators):
+            return False
+        groups = [self._evaluator_groups[evaluator] for evaluator in evaluators if evaluator in self._evaluator_groups]
+        return len(groups) == len(set(groups))
+
+    def is_valid_time_frames(self, time_frames):
+        values = set(_get_time_frame_value(time_frame) for time_frame in time_frames)
+        return bool(values) and values.issuperset(self.required_time_frames) \
+            and values.isdisjoint(self.forbidden_time_frames)
+
+    def check_search_space(self, time_frames):
+        """
+        Raises a RuntimeError when required time frames are not part of the optimized time frames
+        """
+        missing_time_frames = set(self.required_time_frames).difference(_get_time_frame_value(time_frame)
+                                                                         for time_frame in time_frames)
+        if missing_time_frames:
+            raise RuntimeError(f"Required time frames are not optimized time frames: {sorted(missing_time_frames)}")
+
+    def iterate_evaluators_subsets(self, evaluators):
+        """
+        Lazily yields the valid evaluators subsets in the same order as configuration_generator.iterate_subsets
+        """
+        unique_evaluators = configuration_generator.get_unique_elements(evaluators)
+        for subset_size in range(self.min_evaluators, self._get_max_evaluators(unique_evaluators) + 1):
+            for subset in itertools.combinations(unique_evaluators, subset_size):
+                if self.is_valid_evaluators(subset):
+                    yield subset
+
+    def iterate_time_frames_subsets(self, time_frames):
+        for subset in configuration_generator.iterate_subsets(time_frames):
+            if self.is_valid_time_frames(subset):
+                yield subset
+
+    def get_evaluators_subsets_count(self, evaluators):
+        """
+        :return: the number of valid evaluators subsets, computed without enumerating them
+        """
+        units = self._get_selection_units(configuration_generator.get_unique_elements(evaluators))
+        subsets_counts = _get_remaining_subsets_counts(units)[0]
+        return sum(_get_count(subsets_counts, size) for size in self._get_subsets_sizes(units))
+
+    def get_time_frames_subsets_count(self, time_frames):
+        values = set(_get_time_frame_value(time_frame)
+                     for time_frame in configuration_generator.get_unique_elements(time_frames))
+        if not values.issuperset(self.required_time_frames):
+            return 0
+        free_time_frames_count = len(values.difference(self.required_time_frames, self.forbidden_time_frames))
+        # the empty subset is not a valid configuration
+        return 2 ** free_time_frames_count - (0 if self.required_time_frames else 1)
+
+    def get_random_evaluators(self, evaluators, random):
+        """
+        :return: a valid evaluators subset uniformly sampled among the valid ones, None when there is none
+        """
+        unique_evaluators = configuration_generator.get_unique_elements(evaluators)
+        units = self._get_selection_units(unique_evaluators)
+        remaining_counts = _get_remaining_subsets_counts(units)
+        sizes = self._get_subsets_sizes(units)
+        weights = [_get_count(remaining_counts[0], size) for size in sizes]
+        if not any(weights):
+            return None
+        size = random.choices(sizes, weights=weights)[0]
+        selected_evaluators = set()
+        for index, unit in enumerate(units):
+            if size == 0:
+                break
+            # select an evaluator of this unit with the probability of the subsets that include one
+            selected_count = len(unit) * _get_count(remaining_counts[index + 1], size - 1)
+            skipped_count = _get_count(remaining_counts[index + 1], size)
+            if random.random() * (selected_count + skipped_count) < selected_count:
+                selected_evaluators.add(random.choice(unit))
+                size -= 1
+        return tuple(evaluator for evaluator in unique_evaluators if evaluator in selected_evaluators)
+
+    def get_random_time_frames(self, time_frames, random):
+        """
+        :return: a valid time frames subset uniformly sampled among the valid ones, None when there is none
+        """
+        if not self.get_time_frames_subsets_count(time_frames):
+            return None
+        while True:
+            subset = tuple(time_frame
+                           for time_frame in configuration_generator.get_unique_elements(time_frames)
+                           if _get_time_frame_value(time_frame) in self.required_time_frames
+                           or (_get_time_frame_value(time_frame) not in self.forbidden_time_frames
+                               and random.random() < 0.5))
+            # only the empty subset is rejected
+            if subset:
+                return subset
+
+    def _get_max_evaluators(self, evaluators):
+        return len(evaluators) if self.max_evaluators is None else min(self.max_evaluators, len(evaluators))
+
+    def _get_selection_units(self, evaluators):
+        # a unit is either an evaluator without exclusive group or the evaluators of a group: at most one evaluator
+        # of each unit can be selected
+        units = []
+        group_units = {}
+        for evaluator in evaluators:
+            group_index = self._evaluator_groups.get(evaluator)
+            if group_index is None:
+                units.append([evaluator])
+            elif group_index in group_units:
+                group_units[group_index].append(evaluator)
+            else:
+                group_units[group_index] = [evaluator]
+                units.append(group_units[group_index])
+        return units
+
+    def _get_subsets_sizes(self, units):
+        return range(self.min_evaluators, self._get_max_evaluators(units) + 1)
+
+
+def _get_remaining_subsets_counts(units):
+    """
+    :return: counts where counts[index][size] is the number of ways to select size evaluators from units[index:]
+    """
+    remaining_counts = [[1]]
+    for unit in reversed(units):
+        next_counts = remaining_counts[-1]
+        remaining_counts.append([_get_count(next_counts, size) + len(unit) * _get_count(next_counts, size - 1)
+                                 for size in range(len(next_counts) + 1)])
+    return remaining_counts[::-1]
+
+
+def _get_count(counts, size):
+    return counts[size] if 0 <= size < len(counts) else 0
+
+
+def _get_time_frame_value(time_frame):
+    return getattr(time_frame, "value", time_frame)
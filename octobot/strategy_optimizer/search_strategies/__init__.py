@@ -0,0 +1,49 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+from octobot.strategy_optimizer.search_strategies import abstract_search_strategy
+from octobot.strategy_optimizer.search_strategies import exhaustive_search_strategy
+from octobot.strategy_optimizer.search_strategies import random_search_strategy
+from octobot.strategy_optimizer.search_strategies import tpe_search_strategy
+from octobot.strategy_optimizer.search_strategies import genetic_search_strategy
+
+from octobot.strategy_optimizer.search_strategies.abstract_search_strategy import (
+    AbstractSearchStrategy,
+    get_search_strategy_class,
+    get_search_strategy_names,
+)
+from octobot.strategy_optimizer.search_strategies.exhaustive_search_strategy import (
+    ExhaustiveSearchStrategy,
+)
+from octobot.strategy_optimizer.search_strategies.random_search_strategy import (
+    RandomSearchStrategy,
+)
+from octobot.strategy_optimizer.search_strategies.tpe_search_strategy import (
+    TPESearchStrategy,
+)
+from octobot.strategy_optimizer.search_strategies.genetic_search_strategy import (
+    GeneticSearchStrategy,
+)
+
+__all__ = [
+    "AbstractSearchStrategy",
+    "get_search_strategy_class",
+    "get_search_strategy_names",
+    "ExhaustiveSearchStrategy",
+    "RandomSearchStrategy",
+    "TPESearchStrategy",
+    "GeneticSearchStrategy",
+]
@@ -0,0 +1,173 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import abc
+import random
+
+import octobot.strategy_optimizer.configuration_generator as configuration_generator
+
+
+class AbstractSearchStrategy:
+    """
+    AbstractSearchStrategy selects the next configurations to run in the optimizer search space
+    """
+    __metaclass__ = abc.ABCMeta
+
+    # True when suggested configurations depend on the results of previous runs
+    USES_RESULTS = True
+
+    def __init__(self, risks, evaluators, time_frames, budget=None, seed=None, tentacles_settings=None,
+                 constraints=None):
+        self.risks = configuration_generator.get_unique_elements(risks)
+        self.evaluators = configuration_generator.get_unique_elements(evaluators)
+        self.time_frames = configuration_generator.get_unique_elements(time_frames)
+        self.tentacles_settings = configuration_generator.get_unique_elements(
+            tentacles_settings or [configuration_generator.NO_TENTACLES_SETTINGS])
+        # SearchSpaceConstraints that every suggested configuration respects
+        self.constraints = constraints
+        self.search_space_size = configuration_generator.get_run_configurations_count(self.risks,
+                                                                                      self.evaluators,
+                                                                                      self.time_frames,
+                                                                                      self.tentacles_settings,
+                                                                                      self.constraints)
+        self.max_runs_count = self.search_space_size if budget is None else min(budget, self.search_space_size)
+        self.random = random.Random(seed)
+        self.suggested_run_configurations = set()
+        self.scores = {}
+        # scores of the configurations that were not run: they are not on the same scale as run scores
+        self.approximate_scores = {}
+
+    @classmethod
+    def get_name(cls):
+        return cls.__name__
+
+    def suggest_run_configuration(self):
+        """
+        :return: the next RunConfiguration to run or None when no configuration can be suggested until the
+        results of pending runs are registered or when the run budget is consumed
+        """
+        if len(self.suggested_run_configurations) >= self.max_runs_count:
+            return None
+        run_config = self._suggest_run_configuration()
+        # skip restored configurations
+        while run_config is not None and run_config in self.suggested_run_configurations:
+            run_config = self._suggest_run_configuration()
+        if run_config is not None:
+            self.suggested_run_configurations.add(run_config)
+        return run_config
+
+    def register_result(self, run_config, score):
+        self.scores[run_config] = score
+
+    def register_approximate_result(self, run_config, approximate_score):
+        self.approximate_scores[run_config] = approximate_score
+
+    def is_evaluated(self, run_config):
+        return run_config in self.scores or run_config in self.approximate_scores
+
+    def restore_result(self, run_config, score):
+        # restored configurations are considered as already suggested
+        self.suggested_run_configurations.add(run_config)
+        self.register_result(run_config, score)
+
+    @abc.abstractmethod
+    def _suggest_run_configuration(self):
+        raise NotImplementedError("_suggest_run_configuration not implemented")
+
+    # configurations can be represented as genomes:
+    # (risk index, evaluators bit mask, time frames bit mask, tentacles settings index)
+    def _get_run_configuration(self, genome):
+        risk_index, evaluators_mask, time_frames_mask, tentacles_settings_index = genome
+        return configuration_generator.RunConfiguration(self.risks[risk_index],
+                                                        _get_masked_elements(self.evaluators, evaluators_mask),
+                                                        _get_masked_elements(self.time_frames, time_frames_mask),
+                                                        self.tentacles_settings[tentacles_settings_index])
+
+    def _get_genome(self, run_config):
+        return (self.risks.index(run_config.risk),
+                _get_mask(self.evaluators, run_config.evaluators),
+                _get_mask(self.time_frames, run_config.time_frames),
+                self.tentacles_settings.index(run_config.tentacles_settings))
+
+    def _get_random_genome(self):
+        if self.constraints is None:
+            evaluators_mask = self.random.randrange(1, 2 ** len(self.evaluators))
+            time_frames_mask = self.random.randrange(1, 2 ** len(self.time_frames))
+        else:
+            # only sample valid configurations
+            evaluators_mask = _get_mask(self.evaluators,
+                                        self.constraints.get_random_evaluators(self.evaluators, self.random))
+            time_frames_mask = _get_mask(self.time_frames,
+                                         self.constraints.get_random_time_frames(self.time_frames, self.random))
+        return (self.random.randrange(len(self.risks)),
+                evaluators_mask,
+                time_frames_mask,
+                self.random.randrange(len(self.tentacles_settings)))
+
+    def _is_valid_run_configuration(self, run_config):
+        return self.constraints is None or self.constraints.is_valid(run_config)
+
+    def _get_genome_from_index(self, index):
+        # index is in [0, search_space_size[
+        evaluators_subsets_count = 2 ** len(self.evaluators) - 1
+        index, tentacles_settings_index = divmod(index, len(self.tentacles_settings))
+        index, risk_index = divmod(index, len(self.risks))
+        time_frames_index, evaluators_index = divmod(index, evaluators_subsets_count)
+        return risk_index, evaluators_index + 1, time_frames_index + 1, tentacles_settings_index
+
+    def _get_unseen_random_run_configuration(self, max_attempts=100):
+        if not self.search_space_size:
+            return None
+        for _ in range(max_attempts):
+            run_config = self._get_run_configuration(self._get_random_genome())
+            if run_config not in self.suggested_run_configurations:
+                return run_config
+        # almost exhausted search space: look for any remaining configuration
+        for run_config in configuration_generator.iterate_run_configurations(self.risks, self.evaluators,
+                                                                             self.time_frames,
+                                                                             self.tentacles_settings,
+                                                                             self.constraints):
+            if run_config not in self.suggested_run_configurations:
+                return run_config
+        return None
+
+
+def get_search_strategy_class(strategy_name, parent=AbstractSearchStrategy):
+    for search_strategy_class in parent.__subclasses__():
+        if search_strategy_class.get_name() == strategy_name:
+            return search_strategy_class
+        found_class = get_search_strategy_class(strategy_name, search_strategy_class)
+        if found_class is not None:
+            return found_class
+    return None
+
+
+def get_search_strategy_names(parent=AbstractSearchStrategy):
+    names = []
+    for search_strategy_class in parent.__subclasses__():
+        names.append(search_strategy_class.get_name())
+        names += get_search_strategy_names(search_strategy_class)
+    return names
+
+
+def _get_masked_elements(elements, mask):
+    return tuple(element for index, element in enumerate(elements) if mask & (1 << index))
+
+
+def _get_mask(elements, selected_elements):
+    mask = 0
+    for element in selected_elements:
+        mask |= 1 << elements.index(element)
+    return mask
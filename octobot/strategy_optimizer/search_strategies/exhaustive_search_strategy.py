@@ -0,0 +1,37 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot.strategy_optimizer.configuration_generator as configuration_generator
+import octobot.strategy_optimizer.search_strategies.abstract_search_strategy as abstract_search_strategy
+
+
+class ExhaustiveSearchStrategy(abstract_search_strategy.AbstractSearchStrategy):
+    """
+    ExhaustiveSearchStrategy runs every configuration of the search space in enumeration order
+    """
+    USES_RESULTS = False
+
+    def __init__(self, risks, evaluators, time_frames, budget=None, seed=None, tentacles_settings=None,
+                 constraints=None):
+        super().__init__(risks, evaluators, time_frames, budget=budget, seed=seed,
+                         tentacles_settings=tentacles_settings, constraints=constraints)
+        self._run_configurations = configuration_generator.iterate_run_configurations(self.risks,
+                                                                                      self.evaluators,
+                                                                                      self.time_frames,
+                                                                                      self.tentacles_settings,
+                                                                                      self.constraints)
+
+    def _suggest_run_configuration(self):
+        return next(self._run_configurations, None)
@@ -0,0 +1,112 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+
+import octobot.strategy_optimizer.search_strategies.abstract_search_strategy as abstract_search_strategy
+
+
+class GeneticSearchStrategy(abstract_search_strategy.AbstractSearchStrategy):
+    """
+    GeneticSearchStrategy evolves generations of configurations using tournament selection,
+    uniform crossover and mutation on risk, evaluators, time frames and tentacles settings
+    """
+    POPULATION_SIZE = 20
+    TOURNAMENT_SIZE = 3
+    MAX_BREEDING_ATTEMPTS_FACTOR = 10
+
+    def __init__(self, risks, evaluators, time_frames, budget=None, seed=None, tentacles_settings=None,
+                 constraints=None):
+        super().__init__(risks, evaluators, time_frames, budget=budget, seed=seed,
+                         tentacles_settings=tentacles_settings, constraints=constraints)
+        self.generation_id = 0
+        self.generation = []
+        self._to_suggest_run_configurations = collections.deque()
+        # mutate on average one gene per child
+        self._mutation_rate = 1 / (1 + len(self.evaluators) + len(self.time_frames) +
+                                   (1 if len(self.tentacles_settings) > 1 else 0))
+
+    def _suggest_run_configuration(self):
+        if not self._to_suggest_run_configurations:
+            if not all(self.is_evaluated(run_config) for run_config in self.generation):
+                # wait for the current generation results
+                return None
+            self.generation = self._create_initial_generation() if self.generation_id == 0 \
+                else self._create_next_generation()
+            self.generation_id += 1
+            self._to_suggest_run_configurations.extend(self.generation)
+        return self._to_suggest_run_configurations.popleft() if self._to_suggest_run_configurations else None
+
+    def _create_initial_generation(self):
+        return self._complete_generation([])
+
+    def _create_next_generation(self):
+        # scored configurations are kept as parents: the best ones are not run again
+        population = sorted(self.scores, key=self.scores.get, reverse=True)[:self.POPULATION_SIZE]
+        children = []
+        for _ in range(self.POPULATION_SIZE * self.MAX_BREEDING_ATTEMPTS_FACTOR):
+            if len(children) >= self.POPULATION_SIZE:
+                break
+            child = self._get_run_configuration(self._mutate(self._crossover(self._select(population),
+                                                                             self._select(population))))
+            if child not in self.suggested_run_configurations and child not in children \
+                    and self._is_valid_run_configuration(child):
+                children.append(child)
+        return self._complete_generation(children)
+
+    def _complete_generation(self, generation):
+        # add random configurations when breeding does not produce enough new ones
+        while len(generation) < self.POPULATION_SIZE:
+            run_config = self._get_unseen_random_run_configuration()
+            if run_config is None or run_config in generation:
+                break
+            generation.append(run_config)
+        return generation
+
+    def _select(self, population):
+        competitors = self.random.sample(population, min(self.TOURNAMENT_SIZE, len(population)))
+        return self._get_genome(max(competitors, key=self.scores.get))
+
+    def _crossover(self, first_parent, second_parent):
+        return tuple(self._crossover_mask(first_gene, second_gene, index)
+                     for index, (first_gene, second_gene) in enumerate(zip(first_parent, second_parent)))
+
+    def _crossover_mask(self, first_gene, second_gene, gene_index):
+        if gene_index in (0, 3):
+            # risk and tentacles settings indexes
+            return self.random.choice((first_gene, second_gene))
+        selection_mask = self.random.getrandbits(self._get_genes_count(gene_index))
+        return (first_gene & selection_mask) | (second_gene & ~selection_mask)
+
+    def _mutate(self, genome):
+        risk_index, evaluators_mask, time_frames_mask, tentacles_settings_index = genome
+        if self.random.random() < self._mutation_rate:
+            risk_index = self.random.randrange(len(self.risks))
+        if self.random.random() < self._mutation_rate:
+            tentacles_settings_index = self.random.randrange(len(self.tentacles_settings))
+        return (risk_index,
+                self._mutate_mask(evaluators_mask, self._get_genes_count(1)),
+                self._mutate_mask(time_frames_mask, self._get_genes_count(2)),
+                tentacles_settings_index)
+
+    def _mutate_mask(self, mask, genes_count):
+        for index in range(genes_count):
+            if self.random.random() < self._mutation_rate:
+                mask ^= 1 << index
+        # configurations require at least one element
+        return mask or 1 << self.random.randrange(genes_count)
+
+    def _get_genes_count(self, gene_index):
+        return len(self.evaluators) if gene_index == 1 else len(self.time_frames)
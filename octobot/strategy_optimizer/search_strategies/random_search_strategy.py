@@ -0,0 +1,39 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot.strategy_optimizer.search_strategies.abstract_search_strategy as abstract_search_strategy
+
+
+class RandomSearchStrategy(abstract_search_strategy.AbstractSearchStrategy):
+    """
+    RandomSearchStrategy runs uniformly sampled configurations, each of them at most once
+    """
+    USES_RESULTS = False
+
+    def __init__(self, risks, evaluators, time_frames, budget=None, seed=None, tentacles_settings=None,
+                 constraints=None):
+        super().__init__(risks, evaluators, time_frames, budget=budget, seed=seed,
+                         tentacles_settings=tentacles_settings, constraints=constraints)
+        # sampling from a range does not materialize the search space, indexes only map to configurations of
+        # unconstrained search spaces: constrained ones are sampled from valid random configurations
+        self._sampled_indexes = iter(()) if self.constraints is not None \
+            else iter(self.random.sample(range(self.search_space_size), self.max_runs_count))
+
+    def _suggest_run_configuration(self):
+        index = next(self._sampled_indexes, None)
+        if index is None:
+            # sampled configurations can already have been restored or the search space is constrained
+            return self._get_unseen_random_run_configuration()
+        return self._get_run_configuration(self._get_genome_from_index(index))
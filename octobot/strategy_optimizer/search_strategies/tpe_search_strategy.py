@@ -0,0 +1,103 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import math
+
+import octobot.strategy_optimizer.search_strategies.abstract_search_strategy as abstract_search_strategy
+
+
+class TPESearchStrategy(abstract_search_strategy.AbstractSearchStrategy):
+    """
+    TPESearchStrategy is a Tree-structured Parzen Estimator sampler: it favors configurations which risk,
+    evaluators, time frames and tentacles settings are frequent among the best results and rare among the other ones
+    """
+    STARTUP_RUNS = 10
+    GOOD_RESULTS_RATIO = 0.25
+    CANDIDATES_COUNT = 24
+
+    def _suggest_run_configuration(self):
+        if len(self.scores) < min(self.STARTUP_RUNS, self.max_runs_count):
+            return self._get_unseen_random_run_configuration()
+        sorted_genomes = [self._get_genome(run_config)
+                          for run_config in sorted(self.scores, key=self.scores.get, reverse=True)]
+        good_results_count = max(1, math.ceil(len(sorted_genomes) * self.GOOD_RESULTS_RATIO))
+        good_distribution = self._get_distribution(sorted_genomes[:good_results_count])
+        bad_distribution = self._get_distribution(sorted_genomes[good_results_count:])
+        best_run_config = None
+        best_expected_improvement = None
+        for _ in range(self.CANDIDATES_COUNT):
+            genome = self._sample_genome(good_distribution)
+            run_config = self._get_run_configuration(genome)
+            if run_config in self.suggested_run_configurations or not self._is_valid_run_configuration(run_config):
+                continue
+            expected_improvement = _get_log_likelihood(genome, good_distribution) - \
+                _get_log_likelihood(genome, bad_distribution)
+            if best_expected_improvement is None or expected_improvement > best_expected_improvement:
+                best_run_config = run_config
+                best_expected_improvement = expected_improvement
+        return self._get_unseen_random_run_configuration() if best_run_config is None else best_run_config
+
+    def _get_distribution(self, genomes):
+        # laplace smoothing: every risk and element keeps a non zero probability
+        risks_counts = [1] * len(self.risks)
+        evaluators_counts = [1] * len(self.evaluators)
+        time_frames_counts = [1] * len(self.time_frames)
+        tentacles_settings_counts = [1] * len(self.tentacles_settings)
+        for risk_index, evaluators_mask, time_frames_mask, tentacles_settings_index in genomes:
+            risks_counts[risk_index] += 1
+            _count_bits(evaluators_mask, evaluators_counts)
+            _count_bits(time_frames_mask, time_frames_counts)
+            tentacles_settings_counts[tentacles_settings_index] += 1
+        return ([count / (len(genomes) + len(self.risks)) for count in risks_counts],
+                [count / (len(genomes) + 2) for count in evaluators_counts],
+                [count / (len(genomes) + 2) for count in time_frames_counts],
+                [count / (len(genomes) + len(self.tentacles_settings)) for count in tentacles_settings_counts])
+
+    def _sample_genome(self, distribution):
+        risks_probabilities, evaluators_probabilities, time_frames_probabilities, \
+            tentacles_settings_probabilities = distribution
+        return (self.random.choices(range(len(self.risks)), weights=risks_probabilities)[0],
+                self._sample_mask(evaluators_probabilities),
+                self._sample_mask(time_frames_probabilities),
+                self.random.choices(range(len(self.tentacles_settings)), weights=tentacles_settings_probabilities)[0])
+
+    def _sample_mask(self, probabilities):
+        mask = 0
+        for index, probability in enumerate(probabilities):
+            if self.random.random() < probability:
+                mask |= 1 << index
+        # configurations require at least one element
+        return mask or 1 << self.random.randrange(len(probabilities))
+
+
+def _count_bits(mask, counts):
+    for index in range(len(counts)):
+        if mask & (1 << index):
+            counts[index] += 1
+
+
+def _get_log_likelihood(genome, distribution):
+    risk_index, evaluators_mask, time_frames_mask, tentacles_settings_index = genome
+    risks_probabilities, evaluators_probabilities, time_frames_probabilities, \
+        tentacles_settings_probabilities = distribution
+    return math.log(risks_probabilities[risk_index]) + \
+        _get_mask_log_likelihood(evaluators_mask, evaluators_probabilities) + \
+        _get_mask_log_likelihood(time_frames_mask, time_frames_probabilities) + \
+        math.log(tentacles_settings_probabilities[tentacles_settings_index])
+
+
+def _get_mask_log_likelihood(mask, probabilities):
+    return sum(math.log(probability if mask & (1 << index) else 1 - probability)
+               for index, probability in enumerate(probabilities))
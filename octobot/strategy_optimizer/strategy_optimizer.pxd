@@ -23,9 +23,20 @@ cdef class StrategyOptimizer:
     cdef dict sorted_results_by_time_frame
     cdef list sorted_results_through_all_time_frame
     cdef object current_test_suite
-    cdef set errors
-    cdef int run_id
-    cdef int total_nb_runs
+    cdef dict _kept_results_by_row
+    cdef object _report_lock
+    cdef list _report
+    cdef object _session_start_time
+    cdef int _session_runs_count
+    cdef long long _interval_peak_memory
+    cdef object _pre_screened_run_configs
+    cdef bint _group_risks
+    cdef object _grouped_run_configs
+    cdef object _next_run_config
+
+    cdef public set errors
+    cdef public int run_id
+    cdef public int total_nb_runs
 
     cdef public bint is_properly_initialized
     cdef public object trading_mode
@@ -33,10 +44,41 @@ cdef class StrategyOptimizer:
     cdef public list all_time_frames
     cdef public list all_TAs
     cdef public list risks
+    cdef public list tentacles_settings
+    cdef public object constraints
     cdef public bint is_computing
     cdef public list run_results
+    cdef public list run_configurations
+    cdef public list result_rows
+    cdef public object max_kept_results
+    cdef public object search_strategy
+    cdef public object results_cache
+    cdef public object evaluations_recordings_folder
+    cdef public object checkpoint
+    cdef public object backtesting_window
+    cdef public object abort_rules
+    cdef public bint batch_data_files
+    cdef public object pre_screening_ratio
+    cdef public object pre_screening_backtester
+    cdef public object monte_carlo_simulator
+    cdef public int pre_screened_out_runs_count
+    cdef public object results_table
+    cdef public list run_result_listeners
+    cdef public object last_run_update
+    cdef public double total_runs_overhead_time
 
-    cpdef void find_optimal_configuration(self, list TAs=*, list time_frames=*, list risks=*)
+    cpdef void find_optimal_configuration(self, list TAs=*, list time_frames=*, list risks=*, int workers=*,
+                                          object search_strategy=*, object budget=*, bint use_results_cache=*,
+                                          object checkpoint_file=*, bint resume=*, bint replay_evaluations=*,
+                                          object coordinator_address=*, int local_workers=*, bint racing=*,
+                                          object backtesting_window=*, dict tentacles_parameters=*,
+                                          object max_kept_results=*, object constraints=*, object abort_rules=*,
+                                          object pre_screening_ratio=*, bint batch_data_files=*,
+                                          object monte_carlo_paths=*, bint fork_server=*)
+    cpdef object estimate_cost(self, list TAs=*, list time_frames=*, list risks=*, int workers=*,
+                               object search_strategy=*, object budget=*, dict tentacles_parameters=*,
+                               object constraints=*)
+    cpdef dict run_configurations_test_suites(self, list run_configs, object backtesting_window=*)
     cpdef void print_report(self)
     cpdef int get_overall_progress(self)
     cpdef bint is_in_progress(self)
@@ -44,10 +86,13 @@ cdef class StrategyOptimizer:
     cpdef list get_report(self)
     cpdef object get_errors_description(self)
 
-    cdef void _run_test_suite(self, dict config, dict evaluators)
-    cdef void _adapt_tentacles_config(self, dict activated_evaluators)
+    cpdef double get_average_run_overhead_time(self)
+
+    cdef void _init_ranking(self)
+    cdef double _add_to_ranking(self, object run_config, object run_result, bint is_complete=*)
+    cdef dict _get_tentacles_activation_update(self, dict activated_evaluators)
     cdef void _find_optimal_configuration_using_results(self)
-    cdef void _iterate_on_configs(self, int nb_TAs, int nb_TFs)
-    cdef void _run_on_config(self, object risk, object current_forced_time_frame, int nb_time_frames,
-                            list time_frames_conf_history, dict activated_evaluators)
+    cdef list _get_ranked_configurations(self, object max_count=*)
+    cdef void _update_report(self)
+    cdef object _get_config_summary(self, int row)
     cdef list _get_all_TA(self)
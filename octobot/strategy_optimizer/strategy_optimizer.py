@@ -13,30 +13,33 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import asyncio
+import collections
+import concurrent.futures
+import contextlib
 import logging
-import math
+import multiprocessing
 import copy
+import threading
+import time
 
-import octobot_commons.data_util as data_util
-import octobot_commons.tentacles_management as tentacles_management
 import octobot_commons.logging as common_logging
 import octobot_commons.constants as commons_constants
 
+import octobot.backtesting as octobot_backtesting
 import octobot.constants as constants
 import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.search_strategies as search_strategies
+import octobot.strategy_optimizer.distributed.protocol as distributed_protocol
 
 import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_tentacles_manager.constants as tentacles_manager_constants
 
 import octobot_evaluators.constants as evaluator_constants
-import octobot_evaluators.evaluators as evaluators
 
 import octobot_trading.modes as trading_modes
 
 CONFIG = 0
 RANK = 1
-TRADES = 0
 TRADES_IN_RESULT = 2
 
 
@@ -46,24 +49,55 @@ class StrategyOptimizer:
     """
 
     def __init__(self, config, tentacles_setup_config, strategy_name):
-        # Lazy import of tentacles to let tentacles manager handle imports
-        import tentacles.Evaluator as tentacles_Evaluator
         self.is_properly_initialized = False
         self.logger = common_logging.get_logger(self.get_name())
         self.config = config
         self.tentacles_setup_config = copy.deepcopy(tentacles_setup_config)
         self.trading_mode = trading_modes.get_activated_trading_mode(tentacles_setup_config)
-        self.strategy_class = tentacles_management.get_class_from_string(
-            strategy_name, evaluators.StrategyEvaluator,
-            tentacles_Evaluator.Strategies, tentacles_management.evaluator_parent_inspection)
+        self.strategy_class = octobot_backtesting.TENTACLES_INDEX.get_class(strategy_name,
+                                                                           octobot_backtesting.tentacles_index.STRATEGY)
         self.run_results = []
+        self.run_configurations = []
+        # results table row of each kept result
+        self.result_rows = []
+        self.max_kept_results = None
         self.sorted_results_by_time_frame = {}
         self.sorted_results_through_all_time_frame = []
         self.all_time_frames = []
         self.all_TAs = []
         self.risks = []
+        self.tentacles_settings = []
+        self.constraints = None
+        self.search_strategy = None
+        self.results_cache = None
+        self.evaluations_recordings_folder = None
+        self.checkpoint = None
+        self.backtesting_window = None
+        self.abort_rules = None
+        self.batch_data_files = False
+        self.pre_screening_ratio = None
+        self.pre_screening_backtester = None
+        self.pre_screened_out_runs_count = 0
+        self._pre_screened_run_configs = collections.deque()
+        # when True, configurations only differing by their risk are run together with one simulated trader per risk
+        self._group_risks = False
+        self._grouped_run_configs = collections.deque()
+        self._next_run_config = None
+        self.monte_carlo_simulator = None
         self.current_test_suite = None
         self.errors = set()
+        self.run_result_listeners = []
+        self.last_run_update = None
+        self.results_table = None
+        # kept results by results table row
+        self._kept_results_by_row = {}
+        # get_report is called from other threads: it only reads the last report built by the optimizer thread
+        self._report_lock = threading.Lock()
+        self._report = []
+        self._session_start_time = None
+        self._session_runs_count = 0
+        self._interval_peak_memory = 0
+        self.total_runs_overhead_time = 0
 
         self.is_computing = False
         self.run_id = 0
@@ -76,7 +110,39 @@ class StrategyOptimizer:
         else:
             self.is_properly_initialized = True
 
-    def find_optimal_configuration(self, TAs=None, time_frames=None, risks=None):
+    def find_optimal_configuration(self, TAs=None, time_frames=None, risks=None,
+                                   workers=constants.OPTIMIZER_DEFAULT_WORKERS,
+                                   search_strategy=None, budget=None, use_results_cache=False,
+                                   checkpoint_file=None, resume=False, replay_evaluations=False,
+                                   coordinator_address=None, local_workers=0, racing=False,
+                                   backtesting_window=None, tentacles_parameters=None, max_kept_results=None,
+                                   constraints=None, abort_rules=None, pre_screening_ratio=None,
+                                   batch_data_files=False, monte_carlo_paths=None, fork_server=False):
+        """
+        :param coordinator_address: "host:port" address to run test suites in the OptimizerWorker connecting to it
+        instead of using local processes
+        :param local_workers: number of local OptimizerWorker processes to start when coordinator_address is given
+        :param racing: when True, run test suites scenarios by rounds and stop running the configurations that are
+        statistically dominated by the best one
+        :param backtesting_window: BacktestingWindow restricting test suites backtestings to a part of their data files
+        :param tentacles_parameters: tentacles parameters values to sweep: {tentacle name: {parameter: values}} where
+        values are a list of values or a {"min": x, "max": y, "step": z} range
+        :param max_kept_results: when set, bound the session memory by only keeping the max_kept_results best full
+        results: other results are only kept as results table rows, backtestings are released after each run and
+        the peak memory usage is logged every OPTIMIZER_MEMORY_REPORT_INTERVAL runs
+        :param constraints: SearchSpaceConstraints restricting the tested configurations
+        :param abort_rules: BacktestingAbortRules stopping the backtestings that are not worth running until the end
+        of their data file, aborted backtestings results are partial
+        :param pre_screening_ratio: when set, suggested configurations are approximated by batches using a
+        PreScreeningBacktester and only this ratio of the best ones, with the ones that can't be approximated, are run
+        :param batch_data_files: when True, test suites run their scenarios data files together in multi-exchange
+        backtestings to only pay the backtesting setup once per batch, batches hold one data file per exchange
+        :param monte_carlo_paths: when set, the best configurations are also run on this number of synthetic market
+        paths generated by block bootstrap of the data files returns to report their scores distribution
+        :param fork_server: when True and workers > 1, the first run loads tentacles and data files in this process
+        and each next run is executed in a process forked from it instead of a spawned process pool worker, evaluators
+        are still initialized by each run
+        """
         if not self.is_computing:
 
             # set is_computing to True to prevent any simultaneous start
@@ -84,138 +150,704 @@ class StrategyOptimizer:
 
             self.errors = set()
             self.run_results = []
+            self.run_configurations = []
+            self.result_rows = []
+            self.max_kept_results = max_kept_results
+            self.search_strategy = None
             self.sorted_results_by_time_frame = {}
             self.sorted_results_through_all_time_frame = []
+            self.last_run_update = None
+            self.total_runs_overhead_time = 0
+            self.backtesting_window = backtesting_window
+            self.abort_rules = abort_rules
+            self.batch_data_files = batch_data_files
+            self.pre_screening_ratio = pre_screening_ratio
+            self.pre_screening_backtester = None
+            self.pre_screened_out_runs_count = 0
+            self._pre_screened_run_configs = collections.deque()
+            self._grouped_run_configs = collections.deque()
+            self._next_run_config = None
+            self.monte_carlo_simulator = None if monte_carlo_paths is None \
+                else strategy_optimizer.MonteCarloSimulator(monte_carlo_paths)
 
             previous_log_level = common_logging.get_global_logger_level()
 
             try:
-                self.all_TAs = self._get_all_TA() if TAs is None else TAs
-                nb_TAs = len(self.all_TAs)
+                self._init_search_space(TAs, time_frames, risks, tentacles_parameters, constraints)
+                self._init_ranking()
 
-                self.all_time_frames = self.strategy_class.get_required_time_frames(self.config,
-                                                                                    self.tentacles_setup_config) \
-                    if time_frames is None else time_frames
-                nb_TFs = len(self.all_time_frames)
-
-                self.risks = [1] if risks is None else risks
+                self.search_strategy = self._create_search_strategy(search_strategy, budget)
+                self.results_cache = strategy_optimizer.OptimizerResultsCache() if use_results_cache else None
+                self.evaluations_recordings_folder = constants.OPTIMIZER_EVALUATIONS_RECORDINGS_FOLDER \
+                    if replay_evaluations else None
+                self.checkpoint = None if checkpoint_file is None \
+                    else strategy_optimizer.OptimizerCheckpoint(checkpoint_file)
 
                 self.logger.info(f"Trying to find an optimized configuration for {self.strategy_class.get_name()} "
                                  f"strategy using {self.trading_mode.get_name()} trading mode, {self.all_TAs} "
                                  f"technical evaluator(s), {self.all_time_frames} time frames and {self.risks} "
-                                 f"risk(s).")
-
-                self.total_nb_runs = int(len(self.risks) * ((math.pow(2, nb_TFs) - 1) * (math.pow(2, nb_TAs) - 1)))
+                                 f"risk(s) and {len(self.tentacles_settings)} tentacles settings with "
+                                 f"{self.search_strategy.get_name()}"
+                                 f"{'' if self.constraints is None else f' and {self.constraints}'}.")
+
+                self.total_nb_runs = self.search_strategy.max_runs_count
+                # risks don't change evaluations: share backtestings between risks unless results are run by
+                # scenario, by remote workers or with settings depending on the risk. Only exhaustive searches
+                # suggest the configurations of each evaluators and time frames in a row.
+                self._group_risks = len(set(self.risks)) > 1 and not racing and coordinator_address is None \
+                    and self.results_cache is None and not batch_data_files and abort_rules is None \
+                    and isinstance(self.search_strategy, search_strategies.ExhaustiveSearchStrategy)
+                if self.pre_screening_ratio is not None:
+                    self._init_pre_screening()
 
                 self.logger.info("Setting logging level to logging.ERROR to limit messages.")
                 common_logging.set_global_logger_level(logging.ERROR)
+                # the optimizer progress is logged: only limit the other loggers
+                logging.getLogger(self.get_name()).setLevel(logging.INFO)
 
                 self.run_id = 1
-                self._iterate_on_configs(nb_TAs, nb_TFs)
+                if resume:
+                    self._resume_from_checkpoint()
+                    self._update_report()
+                self._session_start_time = time.time()
+                self._session_runs_count = 0
+                self._interval_peak_memory = 0
+                if racing or coordinator_address is not None or workers > 1:
+                    with self._get_run_submitter(workers, coordinator_address, local_workers,
+                                                 fork_server) as run_submitter:
+                        self._complete_restored_results(*run_submitter)
+                        if racing:
+                            self._race_configs(*run_submitter)
+                        else:
+                            self._run_pending_configs(*run_submitter)
+                        self._run_monte_carlo_simulation(*run_submitter)
+                else:
+                    try:
+                        self._complete_restored_results(self._submit_local_run, lambda: 1)
+                        self._run_configs()
+                        self._run_monte_carlo_simulation(self._submit_local_run, lambda: 1)
+                    finally:
+                        strategy_optimizer.close_event_loop()
                 self._find_optimal_configuration_using_results()
+                if self.pre_screening_backtester is not None:
+                    self.logger.info(f"Pre-screening skipped {self.pre_screened_out_runs_count} configurations.")
             finally:
+                if self.checkpoint is not None and self.search_strategy is not None:
+                    self.checkpoint.save(self)
                 self.current_test_suite = None
                 common_logging.set_global_logger_level(previous_log_level)
+                logging.getLogger(self.get_name()).setLevel(logging.NOTSET)
                 self.is_computing = False
+                # notify listeners that no more result will be produced
+                self._notify_run_result_listeners(None)
                 self.logger.info(f"{self.get_name()} finished computation.")
+                if self._session_runs_count:
+                    self.logger.info(f"Average fixed overhead per run: "
+                                     f"{round(self.get_average_run_overhead_time() * 1000, 3)} ms.")
                 self.logger.info("Logging level restored.")
         else:
             raise RuntimeError(f"{self.get_name()} is already computing: processed "
                                f"{self.run_id}/{self.total_nb_runs} processed")
 
-    def _iterate_on_configs(self, nb_TAs, nb_TFs):
-        # test with several risks
-        for risk in self.risks:
-            self.config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK] = risk
-            eval_conf_history = []
-            # test with several evaluators
-            for evaluator_conf_iteration in range(nb_TAs):
-                current_forced_evaluator = self.all_TAs[evaluator_conf_iteration]
-                # test with 1-n evaluators at a time
-                for nb_evaluators in range(1, nb_TAs + 1):
-                    # test different configurations
-                    for _ in range(nb_TAs):
-                        activated_evaluators = self._get_activated_element(self.all_TAs,
-                                                                           current_forced_evaluator,
-                                                                           nb_evaluators, eval_conf_history,
-                                                                           self.strategy_class.get_name(),
-                                                                           True)
-                        if activated_evaluators is not None:
-                            self._adapt_tentacles_config(activated_evaluators)
-                            time_frames_conf_history = []
-                            # test different time frames
-                            for time_frame_conf_iteration in range(nb_TFs):
-                                current_forced_time_frame = self.all_time_frames[time_frame_conf_iteration]
-                                # test with 1-n time frames at a time
-                                for nb_time_frames in range(1, nb_TFs + 1):
-                                    # test different configurations
-                                    for _ in range(nb_TFs):
-                                        self._run_on_config(risk, current_forced_time_frame, nb_time_frames,
-                                                            time_frames_conf_history, activated_evaluators)
-
-    def _run_on_config(self, risk, current_forced_time_frame, nb_time_frames,
-                       time_frames_conf_history, activated_evaluators):
-        activated_time_frames = self._get_activated_element(self.all_time_frames,
-                                                            current_forced_time_frame,
-                                                            nb_time_frames,
-                                                            time_frames_conf_history)
-        if activated_time_frames is not None:
-            self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME] = activated_time_frames
-            print(f"{self.run_id}/{self.total_nb_runs} Run with: evaluators: {activated_evaluators}, "
-                  f"time frames :{activated_time_frames}, risk: {risk}")
-            self._run_test_suite(self.config, activated_evaluators)
-            print(f" => Result: {self.run_results[-1].get_result_string(False)}")
-            self.run_id += 1
-
-    def _run_test_suite(self, config, evaluators):
+    def estimate_cost(self, TAs=None, time_frames=None, risks=None, workers=constants.OPTIMIZER_DEFAULT_WORKERS,
+                      search_strategy=None, budget=None, tentacles_parameters=None, constraints=None):
+        """
+        Runs a calibration backtesting of the first configuration of the search space to predict the duration of
+        find_optimal_configuration using the same arguments
+        :return: the OptimizerCostEstimate of the search
+        """
+        self._init_search_space(TAs, time_frames, risks, tentacles_parameters, constraints)
+        runs_count = self._create_search_strategy(search_strategy, budget).max_runs_count
+        run_config = next(strategy_optimizer.iterate_run_configurations(self.risks, self.all_TAs,
+                                                                        self.all_time_frames,
+                                                                        self.tentacles_settings,
+                                                                        self.constraints), None)
+        if run_config is None:
+            raise RuntimeError("Empty search space: no configuration to run")
+        activated_evaluators, config, tentacles_activation = self._get_run_settings(run_config)
+        try:
+            return strategy_optimizer.estimate_cost(config, self.tentacles_setup_config, self.strategy_class,
+                                                    activated_evaluators, runs_count, workers,
+                                                    tentacles_activation=tentacles_activation,
+                                                    tentacles_settings=run_config.get_tentacles_settings_config())
+        finally:
+            strategy_optimizer.close_event_loop()
+
+    def run_configurations_test_suites(self, run_configs, backtesting_window=None):
+        """
+        Runs the test suite of each given configuration in the current thread without ranking their results
+        :return: the {run_config: TestSuiteResult} results of the given configurations
+        """
+        results = {}
+        try:
+            for run_config in run_configs:
+                activated_evaluators, config, tentacles_activation = self._get_run_settings(run_config)
+                results[run_config], errors = strategy_optimizer.run_test_suite(
+                    config, self.tentacles_setup_config, self.strategy_class, activated_evaluators,
+                    tentacles_activation=tentacles_activation, backtesting_window=backtesting_window,
+                    tentacles_settings=run_config.get_tentacles_settings_config())
+                self._add_errors(errors)
+        finally:
+            strategy_optimizer.close_event_loop()
+        return results
+
+    def _init_search_space(self, TAs, time_frames, risks, tentacles_parameters, constraints):
+        self.all_TAs = self._get_all_TA() if TAs is None else TAs
+        self.all_time_frames = self.strategy_class.get_required_time_frames(self.config,
+                                                                            self.tentacles_setup_config) \
+            if time_frames is None else time_frames
+        self.risks = [1] if risks is None else risks
+        self.tentacles_settings = strategy_optimizer.get_tentacles_settings(tentacles_parameters)
+        self.constraints = constraints
+        if self.constraints is not None:
+            self.constraints.check_search_space(self.all_time_frames)
+
+    def _resume_from_checkpoint(self):
+        if self.checkpoint is None or not self.checkpoint.exists():
+            self.logger.info("No checkpoint to resume from: starting from the first run.")
+            return
+        try:
+            restored_runs_count = self.checkpoint.load(self)
+        except Exception:
+            # this session can't be resumed: never overwrite the checkpoint of the session it was meant to resume
+            self.checkpoint = None
+            raise
+        self.logger.info(f"Resuming from {self.checkpoint.checkpoint_file}: {restored_runs_count}/"
+                         f"{self.total_nb_runs} runs restored.")
+
+    def restore_run_result(self, run_config, run_result):
+        self.search_strategy.restore_result(run_config, self._add_to_ranking(run_config, run_result))
+
+    def restore_results_table(self, results_table, result_rows, run_configurations, run_results):
+        """
+        Restores every results table row, including the ones which full result has not been kept
+        """
+        self.results_table = results_table
+        kept_run_configurations = dict(zip(result_rows, run_configurations))
+        for row in range(len(results_table)):
+            run_config = kept_run_configurations[row] if row in kept_run_configurations \
+                else results_table.get_run_configuration(row)
+            self.search_strategy.restore_result(run_config, results_table.get_score(row))
+        self.result_rows = list(result_rows)
+        self.run_configurations = list(run_configurations)
+        self.run_results = list(run_results)
+        self._kept_results_by_row = dict(zip(self.result_rows, self.run_results))
+
+    def _complete_restored_results(self, submit_run, get_max_pending_runs):
+        """
+        Runs the restored configurations on the test suite data files added since their results were computed:
+        only the added data files are run and their results are added to the restored ones
+        """
+        # results without data files come from previous versions: which data files they ran is unknown
+        rows = [row for row in range(len(self.results_table)) if self.results_table.get_data_files(row)]
+        if not rows:
+            return
+        data_files = set(strategy_optimizer.optimizer_results_cache.get_data_file_identifier(data_file)
+                         for scenario_data_files in strategy_optimizer.get_scenarios_data_files()
+                         for data_file in scenario_data_files)
+        rows = [row for row in rows if not data_files.issubset(self.results_table.get_data_files(row))]
+        if not rows:
+            return
+        self.logger.info(f"Running {len(rows)} restored configurations on the new data files.")
+        run_configurations_by_row = dict(zip(self.result_rows, self.run_configurations))
+        pending_runs = collections.deque()
+        for row in rows:
+            if len(pending_runs) >= get_max_pending_runs():
+                self._complete_restored_result(*pending_runs.popleft())
+            run_config = run_configurations_by_row[row] if row in run_configurations_by_row \
+                else self.results_table.get_run_configuration(row)
+            activated_evaluators, config, tentacles_activation = self._get_run_settings(run_config)
+            pending_runs.append((row, run_config, submit_run(
+                run_config, activated_evaluators, config, tentacles_activation,
+                skipped_data_files=sorted(self.results_table.get_data_files(row)))))
+        while pending_runs:
+            self._complete_restored_result(*pending_runs.popleft())
+
+    def _complete_restored_result(self, row, run_config, future):
+        run_result, errors = future.result()
+        self._add_errors(errors)
+        self.results_table.update(row, run_result)
+        if row in self._kept_results_by_row:
+            self._kept_results_by_row[row].merge(run_result)
+        self.search_strategy.register_result(run_config, self.results_table.get_score(row))
+        self._update_report()
+
+    def add_run_result_listener(self, listener):
+        """
+        :param listener: called with a RunResultUpdate for each run result as soon as it is available and with None
+        when the computation is over. It is called from the optimizer thread.
+        """
+        self.run_result_listeners.append(listener)
+
+    def remove_run_result_listener(self, listener):
+        self.run_result_listeners.remove(listener)
+
+    def _notify_run_result_listeners(self, run_update):
+        for listener in list(self.run_result_listeners):
+            try:
+                listener(run_update)
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when calling run result listener: {e}")
+
+    def _create_search_strategy(self, search_strategy, budget):
+        search_strategy_class = search_strategies.ExhaustiveSearchStrategy if search_strategy is None \
+            else search_strategy
+        if isinstance(search_strategy_class, str):
+            search_strategy_class = search_strategies.get_search_strategy_class(search_strategy)
+            if search_strategy_class is None:
+                raise RuntimeError(f"Unknown optimizer search strategy: {search_strategy}, available search "
+                                   f"strategies are {search_strategies.get_search_strategy_names()}")
+        return search_strategy_class(self.risks, self.all_TAs, self.all_time_frames, budget=budget,
+                                     tentacles_settings=self.tentacles_settings, constraints=self.constraints)
+
+    def _init_pre_screening(self):
+        if not 0 < self.pre_screening_ratio <= 1:
+            raise RuntimeError(f"Invalid pre-screening ratio: {self.pre_screening_ratio}, expected a value in ]0, 1]")
+        data_files = list(dict.fromkeys(data_file
+                                        for scenario_data_files in strategy_optimizer.get_scenarios_data_files()
+                                        for data_file in scenario_data_files))
+        self.pre_screening_backtester = strategy_optimizer.PreScreeningBacktester(
+            self.config, data_files, backtesting_window=self.backtesting_window)
+
+    def _suggest_run_configuration(self):
+        if self.pre_screening_backtester is None:
+            return self.search_strategy.suggest_run_configuration()
+        if not self._pre_screened_run_configs:
+            self._pre_screen_run_configurations()
+        return self._pre_screened_run_configs.popleft() if self._pre_screened_run_configs else None
+
+    def _pre_screen_run_configurations(self):
+        run_configs = []
+        run_config = self.search_strategy.suggest_run_configuration()
+        while run_config is not None:
+            run_configs.append(run_config)
+            if len(run_configs) >= constants.OPTIMIZER_PRE_SCREENING_BATCH_SIZE:
+                break
+            run_config = self.search_strategy.suggest_run_configuration()
+        if not run_configs:
+            return
+        selected_run_configs, rejected_scores = self.pre_screening_backtester.select(run_configs,
+                                                                                     self.pre_screening_ratio)
+        for rejected_run_config, approximate_score in rejected_scores.items():
+            # rejected configurations are never run: search strategies only learn from run scores
+            self.search_strategy.register_approximate_result(rejected_run_config, approximate_score)
+        self.pre_screened_out_runs_count += len(rejected_scores)
+        self.total_nb_runs -= len(rejected_scores)
+        self._pre_screened_run_configs.extend(selected_run_configs)
+
+    def _run_configs(self):
+        run_configs = self._suggest_run_configurations()
+        while run_configs:
+            run_start_time = time.time()
+            self._register_run_configurations_results(
+                run_configs, *self._submit_run_configurations(self._submit_local_run, run_configs),
+                run_start_time=run_start_time)
+            run_configs = self._suggest_run_configurations()
+
+    def _suggest_run_configurations(self):
+        """
+        :return: the next configurations to run together: configurations only differing by their risk when risks
+        are grouped, a single configuration otherwise and an empty list when no configuration is suggested
+        """
+        if not self._group_risks:
+            run_config = self._suggest_run_configuration()
+            return [] if run_config is None else [run_config]
+        if not self._grouped_run_configs:
+            self._group_next_run_configurations()
+        return self._grouped_run_configs.popleft() if self._grouped_run_configs else []
+
+    def _group_next_run_configurations(self):
+        run_config = self._suggest_run_configuration() if self._next_run_config is None else self._next_run_config
+        self._next_run_config = None
+        if run_config is None:
+            return
+        groups = {}
+        evaluators_and_time_frames = (frozenset(run_config.evaluators), frozenset(run_config.time_frames))
+        # exhaustive searches suggest every risk and tentacles settings of evaluators and time frames in a row:
+        # group them until the next evaluators and time frames, whose first configuration is kept for later
+        while run_config is not None:
+            if (frozenset(run_config.evaluators), frozenset(run_config.time_frames)) != evaluators_and_time_frames:
+                self._next_run_config = run_config
+                break
+            groups.setdefault(run_config.tentacles_settings, []).append(run_config)
+            run_config = self._suggest_run_configuration()
+        self._grouped_run_configs.extend(groups.values())
+
+    def _submit_run_configurations(self, submit_run, run_configs):
+        """
+        :return: the activated evaluators of run_configs and the future of their run
+        """
+        activated_evaluators, config, tentacles_activation = self._get_run_settings(run_configs[0])
+        if len(run_configs) == 1:
+            return activated_evaluators, submit_run(run_configs[0], activated_evaluators, config,
+                                                    tentacles_activation)
+        return activated_evaluators, submit_run(run_configs[0], activated_evaluators, config, tentacles_activation,
+                                                traders_risks=[run_config.risk for run_config in run_configs])
+
+    def _register_run_configurations_results(self, run_configs, activated_evaluators, future, run_start_time=None):
+        run_results, errors = future.result()
+        if len(run_configs) == 1:
+            run_results = [run_results]
+        for run_config, run_result in zip(run_configs, run_results):
+            self._log_run_config(run_config, activated_evaluators)
+            self._register_run_result(run_config, run_result, errors, run_start_time=run_start_time)
+            self._log_last_run_result()
+
+    @contextlib.contextmanager
+    def _get_run_submitter(self, workers, coordinator_address, local_workers, fork_server=False):
+        """
+        :return: a context manager of a function submitting a run and returning a future of the run result and
+        errors and of a function returning the maximum number of pending runs
+        """
+        if coordinator_address is not None:
+            host, port = distributed_protocol.parse_address(coordinator_address)
+            coordinator = strategy_optimizer.OptimizerCoordinator(
+                host, port, self.strategy_class.get_name(),
+                use_results_cache=self.results_cache is not None,
+                replay_evaluations=self.evaluations_recordings_folder is not None)
+            coordinator.start()
+            local_processes = []
+
+            def _submit_run(run_config, activated_evaluators, config, tentacles_activation, scenarios=None,
+                            skipped_data_files=None, synthetic_market_path=None):
+                # workers are only given descriptors: they use their own configuration and data files
+                return coordinator.submit_job(distributed_protocol.get_job_descriptor(
+                    run_config, activated_evaluators, tentacles_activation, scenarios=scenarios,
+                    backtesting_window=self.backtesting_window,
+                    release_memory=self.max_kept_results is not None,
+                    skipped_data_files=skipped_data_files,
+                    abort_rules=self.abort_rules,
+                    batch_data_files=self.batch_data_files,
+                    synthetic_market_path=synthetic_market_path))
+
+            try:
+                if local_workers:
+                    self.logger.info(f"Starting {local_workers} local workers.")
+                    local_processes = strategy_optimizer.start_local_workers(
+                        "127.0.0.1" if host in ("", "0.0.0.0") else host, coordinator.port,
+                        self.config, self.tentacles_setup_config, local_workers)
+                yield _submit_run, lambda: max(coordinator.slots_count, 1) * constants.OPTIMIZER_PENDING_RUNS_PER_WORKER
+            finally:
+                coordinator.stop()
+                strategy_optimizer.stop_local_workers(local_processes)
+        elif workers > 1:
+            if fork_server:
+                self.logger.info(f"Running test suites using {workers} forked workers.")
+                executor = strategy_optimizer.ForkServer(workers, initializer=strategy_optimizer.init_forked_process)
+            else:
+                self.logger.info(f"Running test suites using {workers} workers.")
+                # workers receive the configuration once: runs configuration overlays are sent without it
+                octobot_backtesting.set_shared_base_config(self.config)
+                # use spawned processes to start each worker with its own logging, channels and exchange managers
+                executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                                  mp_context=multiprocessing.get_context("spawn"),
+                                                                  initializer=strategy_optimizer.init_worker_process,
+                                                                  initargs=(logging.ERROR, self.config))
+            is_warmed_up = not fork_server
+
+            def _submit_run(run_config, activated_evaluators, config, tentacles_activation, scenarios=None,
+                            skipped_data_files=None, synthetic_market_path=None, traders_risks=None):
+                nonlocal is_warmed_up
+                if not is_warmed_up:
+                    # run the first test suite in this process: forked runs inherit its loaded tentacles, data
+                    # files candles and indexes but not its evaluators, they are initialized again in each run
+                    is_warmed_up = True
+                    return self._submit_local_run(run_config, activated_evaluators, config, tentacles_activation,
+                                                  scenarios=scenarios, skipped_data_files=skipped_data_files,
+                                                  synthetic_market_path=synthetic_market_path,
+                                                  traders_risks=traders_risks)
+                return executor.submit(strategy_optimizer.run_test_suite,
+                                       config,
+                                       self.tentacles_setup_config,
+                                       self.strategy_class,
+                                       list(activated_evaluators),
+                                       results_cache=self.results_cache,
+                                       evaluations_recordings_folder=self.evaluations_recordings_folder,
+                                       tentacles_activation=tentacles_activation,
+                                       scenarios=scenarios,
+                                       backtesting_window=self.backtesting_window,
+                                       tentacles_settings=run_config.get_tentacles_settings_config(),
+                                       release_memory=self.max_kept_results is not None,
+                                       skipped_data_files=skipped_data_files,
+                                       abort_rules=self.abort_rules,
+                                       batch_data_files=self.batch_data_files,
+                                       synthetic_market_path=synthetic_market_path,
+                                       traders_risks=traders_risks)
+
+            try:
+                with executor:
+                    yield _submit_run, lambda: workers * constants.OPTIMIZER_PENDING_RUNS_PER_WORKER
+            finally:
+                octobot_backtesting.set_shared_base_config(None)
+                strategy_optimizer.close_event_loop()
+        else:
+            try:
+                yield self._submit_local_run, lambda: 1
+            finally:
+                strategy_optimizer.close_event_loop()
+
+    def _run_pending_configs(self, submit_run, get_max_pending_runs):
+        """
+        Runs configurations using submit_run which returns a future of each run result and errors
+        """
+        pending_runs = collections.deque()
+        while True:
+            while len(pending_runs) < get_max_pending_runs():
+                run_configs = self._suggest_run_configurations()
+                if not run_configs:
+                    # search is over or waiting for pending runs results
+                    break
+                run_start_time = time.time()
+                # run settings are given as overrides: shared configs are never updated while being pickled
+                pending_runs.append((run_configs, *self._submit_run_configurations(submit_run, run_configs),
+                                     run_start_time))
+            if not pending_runs:
+                break
+            # register results in submission order to keep them independent from workers scheduling
+            run_configs, activated_evaluators, future, run_start_time = pending_runs.popleft()
+            self._register_run_configurations_results(run_configs, activated_evaluators, future,
+                                                      run_start_time=run_start_time)
+
+    def _race_configs(self, submit_run, get_max_pending_runs):
+        """
+        Runs the test suite scenarios of each batch of suggested configurations by rounds: configurations that are
+        dominated after a round are registered using the scenarios they ran and are not run anymore
+        """
+        scenarios_count = len(strategy_optimizer.StrategyTestSuite().get_scenarios())
+        scenario_runs_count = full_scenario_runs_count = 0
+        run_configs = self._get_suggested_run_configurations()
+        while run_configs:
+            race = strategy_optimizer.ConfigurationsRace(run_configs)
+            full_scenario_runs_count += len(run_configs) * scenarios_count
+            for scenario in range(scenarios_count):
+                scenario_runs_count += len(race.alive_run_configurations)
+                self._run_race_round(race, scenario, submit_run, get_max_pending_runs)
+                for run_config in race.end_round():
+                    self._register_race_result(race, run_config)
+            for run_config in race.alive_run_configurations:
+                self._register_race_result(race, run_config)
+            run_configs = self._get_suggested_run_configurations()
+        self.logger.info(f"Racing ran {scenario_runs_count}/{full_scenario_runs_count} test suite scenarios.")
+
+    def _get_suggested_run_configurations(self):
+        run_configs = []
+        run_config = self._suggest_run_configuration()
+        while run_config is not None:
+            run_configs.append(run_config)
+            run_config = self._suggest_run_configuration()
+        return run_configs
+
+    def _run_race_round(self, race, scenario, submit_run, get_max_pending_runs):
+        pending_runs = collections.deque()
+        for run_config in race.alive_run_configurations:
+            if len(pending_runs) >= get_max_pending_runs():
+                pending_run_config, future = pending_runs.popleft()
+                race.add_result(pending_run_config, *future.result())
+            activated_evaluators, config, tentacles_activation = self._get_run_settings(run_config)
+            race.start_times.setdefault(run_config, time.time())
+            pending_runs.append((run_config, submit_run(run_config, activated_evaluators, config, tentacles_activation,
+                                                        scenarios=[scenario])))
+        for run_config, future in pending_runs:
+            race.add_result(run_config, *future.result())
+
+    def _run_monte_carlo_simulation(self, submit_run, get_max_pending_runs):
+        """
+        Runs the best ranked configurations on each synthetic market path of the Monte Carlo simulator
+        """
+        if self.monte_carlo_simulator is None:
+            return
+        rows = self.results_table.get_ranking()[0][:constants.OPTIMIZER_MONTE_CARLO_CONFIGURATIONS_COUNT]
+        self.logger.info(f"Running {len(rows)} best configurations on {self.monte_carlo_simulator.paths_count} "
+                         f"synthetic market paths.")
+        pending_runs = collections.deque()
+        for row in rows:
+            run_config = self.results_table.get_run_configuration(row)
+            activated_evaluators, config, tentacles_activation = self._get_run_settings(run_config)
+            for index in range(self.monte_carlo_simulator.paths_count):
+                if len(pending_runs) >= get_max_pending_runs():
+                    self._add_monte_carlo_result(*pending_runs.popleft())
+                pending_runs.append((run_config, submit_run(
+                    run_config, activated_evaluators, config, tentacles_activation,
+                    synthetic_market_path=self.monte_carlo_simulator.get_market_path(index))))
+        while pending_runs:
+            self._add_monte_carlo_result(*pending_runs.popleft())
+
+    def _add_monte_carlo_result(self, run_config, future):
+        run_result, errors = future.result()
+        self._add_errors(errors)
+        self.monte_carlo_simulator.add_result(run_config, run_result)
+
+    def _register_race_result(self, race, run_config):
+        self._log_run_config(run_config, run_config.get_evaluators_config(self.strategy_class.get_name()))
+        # eliminated configurations did not run every scenario: they are ranked after the ones that did
+        self._register_run_result(run_config, *race.get_result(run_config), run_start_time=race.start_times[run_config],
+                                  is_complete=run_config in race.alive_run_configurations)
+        self._log_last_run_result()
+
+    def _get_run_settings(self, run_config):
+        """
+        :return: the activated evaluators, the run configuration overlay and the tentacles activation update
+        """
+        activated_evaluators = run_config.get_evaluators_config(self.strategy_class.get_name())
+        # only store overridden values on top of the shared configuration
+        config = octobot_backtesting.ConfigurationOverlay(self.config, {
+            (commons_constants.CONFIG_TRADING, commons_constants.CONFIG_TRADER_RISK): run_config.risk,
+            (evaluator_constants.CONFIG_FORCED_TIME_FRAME,): run_config.get_time_frames_config(),
+        })
+        return activated_evaluators, config, self._get_tentacles_activation_update(activated_evaluators)
+
+    def _log_run_config(self, run_config, activated_evaluators):
+        tentacles_settings = f", tentacles settings: {run_config.get_tentacles_settings_config()}" \
+            if run_config.tentacles_settings else ""
+        self.logger.info(f"{self.run_id}/{self.total_nb_runs} Run with: evaluators: {activated_evaluators}, "
+                         f"time frames :{run_config.get_time_frames_config()}, risk: {run_config.risk}"
+                         f"{tentacles_settings}")
+
+    def _log_last_run_result(self):
+        progress = f" ({self.last_run_update.get_progress_string()})" if self.last_run_update else ""
+        self.logger.info(f" => Result: {self.last_run_update.run_result.get_result_string(False)}{progress}")
+        self.run_id += 1
+        if self.checkpoint is not None:
+            self.checkpoint.save_if_necessary(self)
+
+    def _submit_local_run(self, run_config, activated_evaluators, config, tentacles_activation, scenarios=None,
+                          skipped_data_files=None, synthetic_market_path=None, traders_risks=None):
+        # runs in the current thread: the returned future is already done
+        future = concurrent.futures.Future()
         self.current_test_suite = strategy_optimizer.StrategyTestSuite()
-        self.current_test_suite.evaluators = list(evaluators)
-        self.current_test_suite.initialize_with_strategy(self.strategy_class,
-                                                         self.tentacles_setup_config,
-                                                         copy.deepcopy(config))
-        no_error = asyncio.run(self.current_test_suite.run_test_suite(self.current_test_suite),
-                               debug=constants.OPTIMIZER_FORCE_ASYNCIO_DEBUG_OPTION)
-        if not no_error:
-            self.errors = self.errors.union(set([str(e) for e in self.current_test_suite.exceptions]))
-        run_result = self.current_test_suite.get_test_suite_result()
+        future.set_result(strategy_optimizer.run_test_suite(
+            config,
+            self.tentacles_setup_config,
+            self.strategy_class,
+            activated_evaluators,
+            test_suite=self.current_test_suite,
+            results_cache=self.results_cache,
+            evaluations_recordings_folder=self.evaluations_recordings_folder,
+            tentacles_activation=tentacles_activation,
+            scenarios=scenarios,
+            backtesting_window=self.backtesting_window,
+            tentacles_settings=run_config.get_tentacles_settings_config(),
+            release_memory=self.max_kept_results is not None,
+            skipped_data_files=skipped_data_files,
+            abort_rules=self.abort_rules,
+            batch_data_files=self.batch_data_files,
+            synthetic_market_path=synthetic_market_path,
+            traders_risks=traders_risks))
+        return future
+
+    def _register_run_result(self, run_config, run_result, errors, run_start_time=None, is_complete=True):
+        self._add_errors(errors)
+        self.search_strategy.register_result(run_config, self._add_to_ranking(run_config, run_result,
+                                                                              is_complete=is_complete))
+        self._update_report()
+        self._session_runs_count += 1
+        self.total_runs_overhead_time += run_result.overhead_time
+        if self.max_kept_results is not None:
+            self._update_memory_report(run_result)
+        now = time.time()
+        self.last_run_update = strategy_optimizer.RunResultUpdate(
+            self.run_id, self.total_nb_runs, run_config, run_result,
+            0 if run_start_time is None else now - run_start_time,
+            now - self._session_start_time if self._session_start_time else 0,
+            self._session_runs_count
+        )
+        self._notify_run_result_listeners(self.last_run_update)
+
+    def _add_errors(self, errors):
+        if self.max_kept_results is None:
+            self.errors = self.errors.union(errors)
+            return
+        # only keep the first errors descriptions in bounded memory sessions
+        for error in errors:
+            if len(self.errors) >= constants.OPTIMIZER_BOUNDED_MEMORY_MAX_ERRORS:
+                break
+            self.errors.add(error)
+
+    def _update_memory_report(self, run_result):
+        self._interval_peak_memory = max(self._interval_peak_memory, run_result.peak_memory)
+        if self._session_runs_count % constants.OPTIMIZER_MEMORY_REPORT_INTERVAL == 0:
+            self.logger.info(f"Peak memory over the last {constants.OPTIMIZER_MEMORY_REPORT_INTERVAL} runs: test "
+                             f"suites: {_to_mega_bytes(self._interval_peak_memory)} MB, optimizer: "
+                             f"{_to_mega_bytes(strategy_optimizer.get_peak_memory())} MB "
+                             f"({len(self.run_results)} kept results out of {len(self.results_table)})")
+            self._interval_peak_memory = 0
+
+    def _keep_result(self, run_config, run_result, row):
+        self.run_configurations.append(run_config)
         self.run_results.append(run_result)
-
-    def _adapt_tentacles_config(self, activated_evaluators):
-        # Lazy import of tentacles to let tentacles manager handle imports
-        import tentacles.Evaluator as tentacles_Evaluator
+        self.result_rows.append(row)
+        self._kept_results_by_row[row] = run_result
+        if self.max_kept_results is not None and len(self.run_results) > self.max_kept_results:
+            # drop the worst kept result: its row is still used in rankings
+            worst_index = min(range(len(self.result_rows)),
+                              key=lambda index: self.results_table.get_score(self.result_rows[index]))
+            del self._kept_results_by_row[self.result_rows[worst_index]]
+            del self.run_configurations[worst_index]
+            del self.run_results[worst_index]
+            del self.result_rows[worst_index]
+
+    def _init_ranking(self):
+        self.results_table = strategy_optimizer.OptimizerResultsTable(self.all_TAs, self.all_time_frames)
+        self.sorted_results_by_time_frame = {time_frame.value: [] for time_frame in self.all_time_frames}
+        self._kept_results_by_row = {}
+        with self._report_lock:
+            self._report = []
+
+    def _add_to_ranking(self, run_config, run_result, is_complete=True):
+        """
+        :return: the score of the given result
+        """
+        row = self.results_table.add(run_result, is_complete=is_complete)
+        self._keep_result(run_config, run_result, row)
+        return self.results_table.get_score(row)
+
+    def _get_tentacles_activation_update(self, activated_evaluators):
         to_update_config = {}
         tentacles_activation = tentacles_manager_api.get_tentacles_activation(self.tentacles_setup_config)
         for tentacle_class_name in tentacles_activation[tentacles_manager_constants.TENTACLES_EVALUATOR_PATH]:
             if tentacle_class_name in activated_evaluators:
                 to_update_config[tentacle_class_name] = True
-            elif tentacles_management.get_class_from_string(tentacle_class_name, evaluators.StrategyEvaluator,
-                                                            tentacles_Evaluator.Strategies,
-                                                            tentacles_management.evaluator_parent_inspection) is None:
+            elif not octobot_backtesting.TENTACLES_INDEX.is_strategy(tentacle_class_name):
                 to_update_config[tentacle_class_name] = False
-        tentacles_manager_api.update_activation_configuration(self.tentacles_setup_config, to_update_config, False)
+        return to_update_config
 
     def _find_optimal_configuration_using_results(self):
-        for time_frame in self.all_time_frames:
-            time_frame_sorted_results = self._get_sorted_results(self.run_results, time_frame)
-            self.sorted_results_by_time_frame[time_frame.value] = time_frame_sorted_results
-
-        results_through_all_time_frame = {}
-        for results in self.sorted_results_by_time_frame.values():
-            for rank, result in enumerate(results):
-                result_summary = result.get_config_summary()
-                if result_summary not in results_through_all_time_frame:
-                    results_through_all_time_frame[result_summary] = [[], 0]
-                results_through_all_time_frame[result_summary][RANK] += rank
-                results_through_all_time_frame[result_summary][TRADES] += result.trades_counts
-
-        result_list = [(result, trades_and_rank[RANK], data_util.mean(trades_and_rank[TRADES]))
-                       for result, trades_and_rank in results_through_all_time_frame.items()]
-
-        # inner function to replace uncythonizable lambda expression
-        def _sorting_key(elem):
-            return elem[RANK]
-
-        self.sorted_results_through_all_time_frame = sorted(result_list, key=_sorting_key)
+        # only kept results are listed by time frame
+        self.sorted_results_by_time_frame = {
+            time_frame.value: [self._kept_results_by_row[row]
+                               for row in self.results_table.get_sorted_indexes(time_frame)
+                               if row in self._kept_results_by_row]
+            for time_frame in self.all_time_frames
+        }
+        self.sorted_results_through_all_time_frame = self._get_ranked_configurations()
+        self._update_report()
+
+    def _get_ranked_configurations(self, max_count=None):
+        """
+        :return: the (config summary, ranks sum, average trades) of the max_count best configurations
+        """
+        indexes, ranks_sums, average_trades = self.results_table.get_ranking()
+        return [
+            (self._get_config_summary(row), int(ranks_sum), float(trades))
+            for row, ranks_sum, trades in zip(indexes[:max_count], ranks_sums[:max_count], average_trades[:max_count])
+        ]
+
+    def _update_report(self):
+        # the ranking is updated with each added row: only the reported configurations are read here
+        report = [
+            strategy_optimizer.TestSuiteResult.convert_result_into_dict(rank, result[CONFIG].evaluators, "",
+                                                                        result[CONFIG].risk, result[RANK],
+                                                                        round(result[TRADES_IN_RESULT], 5))
+            for rank, result in enumerate(self._get_ranked_configurations(constants.OPTIMIZER_REPORT_SIZE))
+        ]
+        with self._report_lock:
+            self._report = report
+
+    def _get_config_summary(self, row):
+        if row in self._kept_results_by_row:
+            return self._kept_results_by_row[row].get_config_summary()
+        return strategy_optimizer.TestSuiteResultSummary.from_run_configuration(
+            self.results_table.get_run_configuration(row))
 
     def print_report(self):
         self.logger.info("Full execution sorted results: Minimum time frames are defining the range of the run "
@@ -238,6 +870,10 @@ class StrategyOptimizer:
         best_result = self.sorted_results_through_all_time_frame[0]
         self.logger.info(f"{best_result[CONFIG].get_result_string()} "
                          f"average trades count: {best_result[TRADES_IN_RESULT]:f}")
+        if self.monte_carlo_simulator is not None:
+            self.logger.info(f" *** Monte Carlo scores distributions *** ")
+            for rank, (run_config, distribution) in enumerate(self.monte_carlo_simulator.get_report()):
+                self.logger.info(f"{rank}: {run_config}: {strategy_optimizer.get_distribution_string(distribution)}")
 
     def get_overall_progress(self):
         return int((self.run_id - 1) / self.total_nb_runs * 100) if self.total_nb_runs else 0
@@ -245,19 +881,19 @@ class StrategyOptimizer:
     def is_in_progress(self):
         return self.get_overall_progress() != 100
 
+    def get_average_run_overhead_time(self):
+        """
+        :return: the average time in seconds spent by the runs of the last computation outside of their test suite
+        """
+        return self.total_runs_overhead_time / self._session_runs_count if self._session_runs_count else 0
+
     def get_current_test_suite_progress(self):
         return self.current_test_suite.current_progress if self.current_test_suite else 0
 
     def get_report(self):
         # index, evaluators, risk, score, trades
-        if self.sorted_results_through_all_time_frame:
-            results = [strategy_optimizer.TestSuiteResult.convert_result_into_dict(rank, result[CONFIG].evaluators, "",
-                                                                                   result[CONFIG].risk, result[RANK],
-                                                                                   round(result[TRADES_IN_RESULT], 5))
-                       for rank, result in enumerate(self.sorted_results_through_all_time_frame[0:100])]
-        else:
-            results = []
-        return results
+        with self._report_lock:
+            return list(self._report)
 
     def get_errors_description(self):
         if self.errors:
@@ -269,35 +905,6 @@ class StrategyOptimizer:
     def get_name(cls):
         return cls.__name__
 
-    @staticmethod
-    def _get_activated_element(all_elements, current_forced_element, nb_elements_to_consider,
-                               elem_conf_history, default_element=None, dict_shaped=False):
-        eval_conf = {current_forced_element: True}
-        additional_elements_count = 0
-        if default_element is not None:
-            eval_conf[default_element] = True
-            additional_elements_count = 1
-        if nb_elements_to_consider > 1:
-            i = 0
-            while i < len(all_elements) and \
-                    len(eval_conf) < nb_elements_to_consider + additional_elements_count:
-                current_elem = all_elements[i]
-                if current_elem not in eval_conf:
-                    eval_conf[current_elem] = True
-                    if len(eval_conf) == nb_elements_to_consider + additional_elements_count and \
-                            ((eval_conf if dict_shaped else sorted([key.value for key in eval_conf]))
-                             in elem_conf_history):
-                        eval_conf.pop(current_elem)
-                i += 1
-        if len(eval_conf) == nb_elements_to_consider + additional_elements_count:
-            to_use_conf = eval_conf
-            if not dict_shaped:
-                to_use_conf = sorted([key.value for key in eval_conf])
-            if to_use_conf not in elem_conf_history:
-                elem_conf_history.append(to_use_conf)
-                return to_use_conf
-        return None
-
     @staticmethod
     def _get_filtered_results(results, time_frame=None):
         return [result for result in results if time_frame is None or result.min_time_frame == time_frame]
@@ -309,11 +916,8 @@ class StrategyOptimizer:
 
     @staticmethod
     def _is_relevant_evaluation_config(evaluator):
-        # Lazy import of tentacles to let tentacles manager handle imports
-        import tentacles.Evaluator as tentacles_Evaluator
-        return tentacles_management.get_class_from_string(
-            evaluator, evaluators.TAEvaluator, tentacles_Evaluator.TA,
-            tentacles_management.evaluator_parent_inspection) is not None
+        return octobot_backtesting.TENTACLES_INDEX.get_class(evaluator,
+                                                             octobot_backtesting.tentacles_index.TA) is not None
 
     def _get_all_TA(self):
         return [evaluator
@@ -321,3 +925,7 @@ class StrategyOptimizer:
                 in tentacles_manager_api.get_tentacles_activation(self.tentacles_setup_config)[
                     tentacles_manager_constants.TENTACLES_EVALUATOR_PATH].items()
                 if activated and StrategyOptimizer._is_relevant_evaluation_config(evaluator)]
+
+
+def _to_mega_bytes(size):
+    return round(size / (1024 * 1024), 1)
@@ -26,7 +26,27 @@ cdef class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
     cdef public double current_progress
     cdef public list exceptions
     cdef public list evaluators
+    cdef public object results_cache
+    cdef public object evaluations_recordings_folder
+    cdef public object backtesting_window
+    cdef public object abort_rules
+    cdef public object synthetic_market_path
+    cdef public object tentacles_settings
+    cdef public object traders_risks
+    cdef public object skipped_data_files
+    cdef public bint batch_data_files
+    cdef list _run_data_files
+    cdef list _batched_data_files
+    cdef int _aborted_runs_count
+    cdef list _other_traders_results
+    cdef object _run_fingerprint
+    cdef object _evaluations_fingerprint
 
     cpdef strategy_optimizer.TestSuiteResult get_test_suite_result(self)
+    cpdef list get_traders_test_suite_results(self)
+    cpdef list get_scenarios(self)
 
-    cdef void _handle_results(self, object independent_backtesting, object profitability)
+    cdef bint _add_cached_results(self, str data_file)
+    cdef void _cache_last_results(self, str data_file)
+    cdef void _handle_results(self, object independent_backtesting, object profitability, object data_file=*)
+    cdef object _get_traders_settings(self)
@@ -13,18 +13,25 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import copy
+import os
 
 import octobot.api.backtesting as octobot_backtesting_api
+import octobot.backtesting.candles_cache as candles_cache
 import octobot.strategy_optimizer as octobot_strategy_optimizer
 import octobot.backtesting as octobot_backtesting
 import octobot_commons.constants as commons_constants
 
+import octobot_tentacles_manager.api as tentacles_manager_api
+
+import octobot.constants as constants
+
+import octobot_backtesting.enums as backtesting_enums
 import octobot_backtesting.errors as backtesting_errors
 
 import octobot_evaluators.constants as evaluator_constants
 
 import octobot_trading.api as trading_api
+import octobot_trading.modes as trading_modes
 
 
 class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
@@ -38,20 +45,80 @@ class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
         self.current_progress = 0
         self.exceptions = []
         self.evaluators = []
+        self.results_cache = None
+        self.evaluations_recordings_folder = None
+        self.backtesting_window = None
+        self.abort_rules = None
+        # when set, backtestings run on this synthetic market path instead of the historical prices
+        self.synthetic_market_path = None
+        self.tentacles_settings = None
+        # when set, each backtesting runs one simulated trader per risk on the same evaluations
+        self.traders_risks = None
+        # identifiers of the data files not to run: their results are already known
+        self.skipped_data_files = None
+        # when True, scenarios data files are run together in multi-exchange backtestings
+        self.batch_data_files = False
+        self._run_data_files = []
+        self._batched_data_files = []
+        self._aborted_runs_count = 0
+        # (profitability results, trades counts) of the traders following the first one
+        self._other_traders_results = []
+        self._run_fingerprint = None
+        self._evaluations_fingerprint = None
 
     def get_test_suite_result(self):
-        return octobot_strategy_optimizer.TestSuiteResult(self._profitability_results,
-                                                          self._trades_counts,
-                                                          self.config[commons_constants.CONFIG_TRADING][
-                                                              commons_constants.CONFIG_TRADER_RISK],
-                                                          self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
-                                                          self.evaluators,
-                                                          self.strategy_evaluator_class.get_name())
-
-    async def run_test_suite(self, strategy_tester):
+        test_suite_result = octobot_strategy_optimizer.TestSuiteResult(
+            self._profitability_results,
+            self._trades_counts,
+            self.config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK],
+            self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+            self.evaluators,
+            self.strategy_evaluator_class.get_name(),
+            tentacles_settings=self.tentacles_settings,
+            data_files=self._run_data_files
+        )
+        test_suite_result.aborted_runs_count = self._aborted_runs_count
+        return test_suite_result
+
+    def get_traders_test_suite_results(self):
+        """
+        :return: the TestSuiteResult of each trader risk, in traders_risks order
+        """
+        first_trader_result = self.get_test_suite_result()
+        if not self.traders_risks:
+            return [first_trader_result]
+        first_trader_result.risk = self.traders_risks[0]
+        return [first_trader_result] + [
+            octobot_strategy_optimizer.TestSuiteResult(
+                profitability_results,
+                trades_counts,
+                risk,
+                self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+                self.evaluators,
+                self.strategy_evaluator_class.get_name(),
+                tentacles_settings=self.tentacles_settings,
+                data_files=list(self._run_data_files)
+            )
+            for risk, (profitability_results, trades_counts) in zip(self.traders_risks[1:],
+                                                                    self._other_traders_results)
+        ]
+
+    def get_scenarios(self):
+        return [self.test_slow_downtrend, self.test_sharp_downtrend, self.test_flat_markets,
+                self.test_slow_uptrend, self.test_sharp_uptrend, self.test_up_then_down]
+
+    async def run_test_suite(self, strategy_tester, scenarios=None):
+        """
+        :param scenarios: indexes in get_scenarios() of the scenarios to run, every scenario is run by default
+        """
         self.exceptions = []
-        tests = [self.test_slow_downtrend, self.test_sharp_downtrend, self.test_flat_markets,
-                 self.test_slow_uptrend, self.test_sharp_uptrend, self.test_up_then_down]
+        self._run_fingerprint = None
+        self._evaluations_fingerprint = None
+        self._batched_data_files = []
+        self._other_traders_results = [([], []) for _ in (self.traders_risks or [])[1:]]
+        tests = self.get_scenarios()
+        if scenarios is not None:
+            tests = [tests[index] for index in scenarios]
         print('| ', end='')
         nb_tests = len(tests)
         for i, test in enumerate(tests):
@@ -61,8 +128,11 @@ class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
                 self.logger.exception(e, True, f"Exception when running test {test.__name__}: {e}")
                 self.exceptions.append(e)
             finally:
-                self.current_progress = int((i + 1) / nb_tests * 100)
+                if not self.batch_data_files:
+                    self.current_progress = int((i + 1) / nb_tests * 100)
             print('#', end='')
+        if self._batched_data_files:
+            await self._run_batched_data_files()
         print(' |', end='')
         return not self.exceptions
 
@@ -87,38 +157,252 @@ class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
     async def test_up_then_down(self, strategy_tester):
         await strategy_tester.run_test_up_then_down(None, StrategyTestSuite.SKIP_LONG_STEPS)
 
-    def _handle_results(self, independent_backtesting, profitability):
-        trades_count = 0
-        profitability_result = None
+    async def _run_and_handle_results(self, data_file, expected_profitability):
+        data_file_identifier = octobot_strategy_optimizer.optimizer_results_cache.get_data_file_identifier(data_file)
+        if self.skipped_data_files and data_file_identifier in self.skipped_data_files:
+            return
+        self._run_data_files.append(data_file_identifier)
+        if self.batch_data_files:
+            # run after every scenario data file is known
+            self._batched_data_files.append((data_file, expected_profitability))
+        else:
+            await self._run_or_get_cached_results(data_file, expected_profitability)
+
+    async def _run_or_get_cached_results(self, data_file, expected_profitability):
+        if not self._add_cached_results(data_file):
+            results_count = len(self._profitability_results)
+            await super()._run_and_handle_results(data_file, expected_profitability)
+            if len(self._profitability_results) > results_count:
+                self._cache_last_results(data_file)
+
+    def _add_cached_results(self, data_file):
+        if self.results_cache is None:
+            return False
+        cached_result = self.results_cache.get(self.results_cache.get_scenario_key(self._get_run_fingerprint(),
+                                                                                   data_file))
+        if cached_result is None:
+            return False
+        profitability_result, trades_count = cached_result
+        self._profitability_results.append(profitability_result)
+        self._trades_counts.append(trades_count)
+        return True
+
+    def _cache_last_results(self, data_file):
+        if self.results_cache is not None:
+            self.results_cache.set(self.results_cache.get_scenario_key(self._get_run_fingerprint(), data_file),
+                                   self._profitability_results[-1], self._trades_counts[-1])
+
+    async def _run_batched_data_files(self):
+        """
+        Runs the collected scenarios data files by batches sharing a single backtesting: the evaluators, channels and
+        service feeds setup is only paid once per batch. A batch only contains one data file per exchange to give
+        each data file its own simulated exchange and portfolio: a backtesting simulates each exchange once with
+        every data file of this exchange, data files of a same exchange can't be isolated in a shared backtesting.
+        The gain is therefore bounded by the number of exchanges of the data files, ex: the default scenarios 15
+        data files from 2 exchanges are run in 9 backtestings.
+        """
+        to_run_data_files = [(data_file, expected_profitability)
+                             for data_file, expected_profitability in self._batched_data_files
+                             if not self._add_cached_results(data_file)]
+        exchange_names = [await self._get_exchange_name(data_file) for data_file, _ in to_run_data_files]
+        batches = get_data_files_batches(to_run_data_files, exchange_names)
+        self.logger.info(f"Running {len(to_run_data_files)} data files in {len(batches)} backtestings.")
+        for index, batch in enumerate(batches):
+            try:
+                # single data file batches don't save any setup: run them with their evaluations recording
+                if len(batch) == 1 or not await self._run_and_handle_batched_results(
+                        [data_file for data_file, _ in batch],
+                        [expected_profitability for _, expected_profitability in batch]):
+                    for data_file, expected_profitability in batch:
+                        await self._run_or_get_cached_results(data_file, expected_profitability)
+            except Exception as e:
+                self.logger.exception(e, True, f"Exception when running batched data files {batch}: {e}")
+                self.exceptions.append(e)
+            finally:
+                self.current_progress = int((index + 1) / len(batches) * 100)
+        self.current_progress = 100
+
+    @staticmethod
+    async def _get_exchange_name(data_file):
+        description = await candles_cache.CANDLES_CACHE.get_file_description(data_file)
+        return None if description is None else description[backtesting_enums.DataFormatKeys.EXCHANGE.value]
+
+    def _get_run_fingerprint(self):
+        if self._run_fingerprint is None:
+            trading_mode = trading_modes.get_activated_trading_mode(self.tentacles_setup_config)
+            self._run_fingerprint = self.results_cache.get_run_fingerprint(
+                version=constants.LONG_VERSION,
+                strategy=self.strategy_evaluator_class.get_name(),
+                evaluators=sorted(self.evaluators),
+                time_frames=self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+                risk=self.config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK],
+                simulator=self.config[commons_constants.CONFIG_SIMULATOR],
+                trading_mode=trading_mode.get_name(),
+                tentacles_activation=tentacles_manager_api.get_tentacles_activation(self.tentacles_setup_config),
+                tentacles_config=self._get_tentacles_config(trading_mode),
+                **self._get_backtesting_window_description(),
+                **self._get_abort_rules_description(),
+                **self._get_synthetic_market_path_description()
+            )
+        return self._run_fingerprint
+
+    def _get_evaluations_fingerprint(self):
+        # evaluations do not depend on risk and trading mode settings: exclude them to share recordings
+        if self._evaluations_fingerprint is None:
+            self._evaluations_fingerprint = octobot_strategy_optimizer.OptimizerResultsCache.get_run_fingerprint(
+                version=constants.LONG_VERSION,
+                strategy=self.strategy_evaluator_class.get_name(),
+                evaluators=sorted(self.evaluators),
+                time_frames=self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+                tentacles_config=self._get_tentacles_config(None),
+                **self._get_backtesting_window_description(),
+                **self._get_synthetic_market_path_description()
+            )
+        return self._evaluations_fingerprint
+
+    def _get_backtesting_window_description(self):
+        # runs on the whole data files keep their fingerprint
+        return {} if self.backtesting_window is None else {"backtesting_window": self.backtesting_window.to_dict()}
+
+    def _get_abort_rules_description(self):
+        # aborted runs have partial results: only share results of runs using the same abort rules
+        return {} if self.abort_rules is None else {"abort_rules": self.abort_rules.to_dict()}
+
+    def _get_synthetic_market_path_description(self):
+        return {} if self.synthetic_market_path is None \
+            else {"synthetic_market_path": self.synthetic_market_path.to_dict()}
+
+    def _get_evaluator_fingerprint(self, evaluator):
+        # an evaluator evaluations only depend on its own configuration: share them between strategies settings
+        return octobot_strategy_optimizer.OptimizerResultsCache.get_run_fingerprint(
+            version=constants.LONG_VERSION,
+            evaluator=evaluator,
+            time_frames=self.config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+            evaluator_config=tentacles_manager_api.get_tentacle_config(self.tentacles_setup_config,
+                                                                       self._get_evaluator_class(evaluator)),
+            **self._get_backtesting_window_description(),
+            **self._get_synthetic_market_path_description()
+        )
+
+    def _get_evaluations_recording(self, data_file):
+        """
+        :return: the evaluations recording to replay or to record on the given data file and its file path.
+        When the run evaluations are not recorded, evaluations recorded by evaluators using the same configuration
+        in other runs are replayed.
+        """
+        if self.evaluations_recordings_folder is None:
+            return None, None
+        recording = octobot_backtesting.EvaluationsRecording()
+        recording_file = self._get_evaluations_recording_file(self._get_evaluations_fingerprint(), data_file)
+        if not recording.load(recording_file):
+            for evaluator in self.evaluators:
+                evaluator_recording = octobot_backtesting.EvaluationsRecording()
+                if evaluator_recording.load(self._get_evaluations_recording_file(
+                        self._get_evaluator_fingerprint(evaluator), data_file)):
+                    recording.add_replayed_evaluator(evaluator, evaluator_recording)
+        return recording, recording_file
+
+    def _save_evaluations_recording(self, recording, recording_file, data_file):
+        recording.save(recording_file)
+        for evaluator in self.evaluators:
+            if evaluator not in recording.replayed_evaluators:
+                recording.get_evaluator_recording(evaluator).save(
+                    self._get_evaluations_recording_file(self._get_evaluator_fingerprint(evaluator), data_file))
+
+    def _get_evaluations_recording_file(self, fingerprint, data_file):
+        recording_key = octobot_strategy_optimizer.OptimizerResultsCache.get_scenario_key(fingerprint, data_file)
+        return os.path.join(self.evaluations_recordings_folder, f"{recording_key}.recording")
+
+    def _get_tentacles_config(self, trading_mode):
+        tentacle_classes = [self.strategy_evaluator_class, trading_mode] + [
+            self._get_evaluator_class(evaluator)
+            for evaluator in self.evaluators
+        ]
+        return {
+            tentacle_class.get_name(): tentacles_manager_api.get_tentacle_config(self.tentacles_setup_config,
+                                                                                 tentacle_class)
+            for tentacle_class in tentacle_classes
+            if tentacle_class is not None
+        }
+
+    @staticmethod
+    def _get_evaluator_class(evaluator):
+        return octobot_backtesting.TENTACLES_INDEX.get_class(evaluator, octobot_backtesting.tentacles_index.TA)
+
+    def _handle_results(self, independent_backtesting, profitability, data_file=None):
         skip_this_run = False
         if independent_backtesting is not None:
-            exchange_manager_ids = octobot_backtesting_api.get_independent_backtesting_exchange_manager_ids(
-                independent_backtesting)
+            if data_file is not None:
+                traders_exchange_manager_ids = [
+                    octobot_backtesting_api.get_independent_backtesting_data_file_exchange_manager_ids(
+                        independent_backtesting, data_file)
+                ]
+            elif self.traders_risks:
+                traders_exchange_manager_ids = \
+                    octobot_backtesting_api.get_independent_backtesting_traders_exchange_manager_ids(
+                        independent_backtesting)
+            else:
+                traders_exchange_manager_ids = [
+                    octobot_backtesting_api.get_independent_backtesting_exchange_manager_ids(independent_backtesting)
+                ]
             try:
-                for exchange_manager in trading_api.get_exchange_managers_from_exchange_ids(exchange_manager_ids):
-                    _, profitability, _, market_average_profitability, _ = \
-                        trading_api.get_profitability_stats(exchange_manager)
-                    # Only one exchange manager per run
-                    profitability_result = (profitability, market_average_profitability)
-                    trades_count += len(trading_api.get_trade_history(exchange_manager))
+                traders_results = [self._get_trader_results(exchange_manager_ids)
+                                   for exchange_manager_ids in traders_exchange_manager_ids]
             except (AttributeError, KeyError):
                 skip_this_run = True
             if not skip_this_run:
-                if profitability_result is None:
-                    raise RuntimeError("Error with independent backtesting: no available exchange manager")
+                for profitability_result, _ in traders_results:
+                    if profitability_result is None:
+                        raise RuntimeError("Error with independent backtesting: no available exchange manager")
+                (profitability_result, trades_count), other_traders_results = traders_results[0], traders_results[1:]
                 self._profitability_results.append(profitability_result)
                 self._trades_counts.append(trades_count)
+                for (profitability_results, trades_counts), (profitability_result, trades_count) in \
+                        zip(self._other_traders_results, other_traders_results):
+                    profitability_results.append(profitability_result)
+                    trades_counts.append(trades_count)
+                if octobot_backtesting_api.get_independent_backtesting_abort_reason(independent_backtesting):
+                    # aborted runs keep their partial profitability
+                    self._aborted_runs_count += 1
+                if data_file is not None:
+                    # batched data files results are handled once their shared backtesting is over
+                    self._cache_last_results(data_file)
+
+    @staticmethod
+    def _get_trader_results(exchange_manager_ids):
+        trades_count = 0
+        profitability_result = None
+        for exchange_manager in trading_api.get_exchange_managers_from_exchange_ids(exchange_manager_ids):
+            _, profitability, _, market_average_profitability, _ = \
+                trading_api.get_profitability_stats(exchange_manager)
+            # Only one exchange manager per trader
+            profitability_result = (profitability, market_average_profitability)
+            trades_count += len(trading_api.get_trade_history(exchange_manager))
+        return profitability_result, trades_count
 
     async def _run_backtesting_with_current_config(self, data_file_to_use):
         independent_backtesting = None
         try:
-            config_to_use = copy.deepcopy(self.config)
-            independent_backtesting = octobot_backtesting_api.create_independent_backtesting(config_to_use,
-                                                                                 self.tentacles_setup_config,
-                                                                                 [data_file_to_use],
-                                                                                 "")
+            recording, recording_file = self._get_evaluations_recording(data_file_to_use)
+            # independent backtesting only reads the given config: share it instead of copying it
+            independent_backtesting = octobot_backtesting_api.create_independent_backtesting(
+                self.config,
+                self.tentacles_setup_config,
+                [data_file_to_use],
+                "",
+                use_candles_cache=True,
+                evaluations_recording=recording,
+                traders_settings=self._get_traders_settings(),
+                backtesting_window=self.backtesting_window,
+                abort_rules=self.abort_rules,
+                synthetic_market_path=self.synthetic_market_path)
             await octobot_backtesting_api.initialize_and_run_independent_backtesting(independent_backtesting, log_errors=False)
             await octobot_backtesting_api.join_independent_backtesting(independent_backtesting)
+            if recording is not None and not recording.is_replay():
+                recording.stop(True)
+                # aborted runs only recorded the beginning of their data file
+                if not octobot_backtesting_api.get_independent_backtesting_abort_reason(independent_backtesting):
+                    self._save_evaluations_recording(recording, recording_file, data_file_to_use)
             return independent_backtesting
         except backtesting_errors.MissingTimeFrame:
             # ignore this exception: is due to missing of the only required time frame
@@ -126,3 +410,57 @@ class StrategyTestSuite(octobot_backtesting.AbstractBacktestingTest):
         except Exception as e:
             self.logger.exception(e, True, str(e))
             return independent_backtesting
+
+    def _get_traders_settings(self):
+        if not self.traders_risks:
+            return None
+        return [{commons_constants.CONFIG_TRADER_RISK: risk} for risk in self.traders_risks]
+
+    async def _run_batched_backtesting_with_current_config(self, data_files_to_use):
+        independent_backtesting = None
+        try:
+            # data files can cover different periods: run each of them entirely
+            independent_backtesting = octobot_backtesting_api.create_independent_backtesting(
+                self.config,
+                self.tentacles_setup_config,
+                data_files_to_use,
+                "",
+                run_on_common_part_only=False,
+                use_candles_cache=True,
+                backtesting_window=self.backtesting_window,
+                abort_rules=self.abort_rules,
+                synthetic_market_path=self.synthetic_market_path)
+            await octobot_backtesting_api.initialize_and_run_independent_backtesting(independent_backtesting,
+                                                                                    log_errors=False)
+            await octobot_backtesting_api.join_independent_backtesting(independent_backtesting)
+            return independent_backtesting
+        except Exception as e:
+            self.logger.exception(e, True, str(e))
+            if independent_backtesting is not None:
+                # not started batches are run data file by data file
+                await octobot_backtesting_api.stop_independent_backtesting(independent_backtesting)
+            return independent_backtesting
+
+
+def get_data_files_batches(data_files, exchange_names):
+    """
+    :param exchange_names: the exchange name of each data file, None when unknown
+    :return: lists of data_files elements where each exchange name is only used once, data files of unknown
+    exchanges are alone in their list. There are at least as many lists as data files of the most used exchange.
+    """
+    batches = []
+    batches_exchange_names = []
+    for data_file, exchange_name in zip(data_files, exchange_names):
+        batch_index = None
+        if exchange_name is not None:
+            batch_index = next((index
+                                for index, batch_exchange_names in enumerate(batches_exchange_names)
+                                if None not in batch_exchange_names and exchange_name not in batch_exchange_names),
+                               None)
+        if batch_index is None:
+            batch_index = len(batches)
+            batches.append([])
+            batches_exchange_names.append(set())
+        batches[batch_index].append(data_file)
+        batches_exchange_names[batch_index].add(exchange_name)
+    return batches
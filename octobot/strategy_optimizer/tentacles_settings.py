@@ -0,0 +1,86 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import json
+import os
+import shutil
+
+import octobot_tentacles_manager.constants as tentacles_manager_constants
+
+import octobot.constants as constants
+import octobot.strategy_optimizer as strategy_optimizer
+
+# settings folders by (tentacles configuration folder, tentacles settings) in this process
+_SETTINGS_FOLDERS = {}
+
+
+def get_tentacles_settings_setup_config(tentacles_setup_config, tentacles_settings,
+                                        settings_folder=constants.OPTIMIZER_TENTACLES_SETTINGS_FOLDER):
+    """
+    :param tentacles_settings: {tentacle name: {parameter: value}} tentacles configuration update
+    :return: a copy of tentacles_setup_config reading tentacles configurations updated with tentacles_settings.
+    Updated configurations are written once in a folder identified by their content: tentacles configuration files
+    are never modified and runs using the same settings share their configuration folder.
+    """
+    settings_setup_config = copy.copy(tentacles_setup_config)
+    settings_setup_config.config_path = os.path.join(
+        _get_settings_folder(tentacles_setup_config.get_config_folder(), tentacles_settings, settings_folder),
+        os.path.basename(tentacles_setup_config.config_path)
+    )
+    return settings_setup_config
+
+
+def _get_settings_folder(config_folder, tentacles_settings, settings_folder):
+    key = (config_folder, json.dumps(tentacles_settings, sort_keys=True))
+    if key not in _SETTINGS_FOLDERS:
+        tentacles_configs = _read_tentacles_configs(
+            os.path.join(config_folder, tentacles_manager_constants.TENTACLES_SPECIFIC_CONFIG_FOLDER))
+        for tentacle, tentacle_settings in tentacles_settings.items():
+            tentacles_configs[tentacle] = {**tentacles_configs.get(tentacle, {}), **tentacle_settings}
+        folder = os.path.join(settings_folder,
+                              strategy_optimizer.OptimizerResultsCache.get_run_fingerprint(**tentacles_configs))
+        if not os.path.isdir(folder):
+            _write_tentacles_configs(folder, tentacles_configs)
+        _SETTINGS_FOLDERS[key] = folder
+    return _SETTINGS_FOLDERS[key]
+
+
+def _read_tentacles_configs(specific_config_folder):
+    if not os.path.isdir(specific_config_folder):
+        return {}
+    tentacles_configs = {}
+    for file_name in os.listdir(specific_config_folder):
+        tentacle, extension = os.path.splitext(file_name)
+        if extension == tentacles_manager_constants.CONFIG_EXT:
+            with open(os.path.join(specific_config_folder, file_name)) as config_file:
+                tentacles_configs[tentacle] = json.load(config_file)
+    return tentacles_configs
+
+
+def _write_tentacles_configs(folder, tentacles_configs):
+    # write then rename to never expose partially written folders to other processes
+    temp_folder = f"{folder}.{os.getpid()}.tmp"
+    specific_config_folder = os.path.join(temp_folder, tentacles_manager_constants.TENTACLES_SPECIFIC_CONFIG_FOLDER)
+    os.makedirs(specific_config_folder, exist_ok=True)
+    for tentacle, tentacle_config in tentacles_configs.items():
+        with open(os.path.join(specific_config_folder,
+                               f"{tentacle}{tentacles_manager_constants.CONFIG_EXT}"), "w") as config_file:
+            json.dump(tentacle_config, config_file, indent=4, sort_keys=True)
+    try:
+        os.rename(temp_folder, folder)
+    except OSError:
+        # already written by another process
+        shutil.rmtree(temp_folder, ignore_errors=True)
@@ -24,8 +24,14 @@ cdef class TestSuiteResult:
     cdef public object min_time_frame
     cdef public list evaluators
     cdef public str strategy
+    cdef public dict tentacles_settings
+    cdef public list data_files
+    cdef public int aborted_runs_count
+    cdef public double overhead_time
+    cdef public long long peak_memory
 
     cpdef double get_average_score(self)
+    cpdef void merge(self, TestSuiteResult test_suite_result)
     cpdef double get_average_trades_count(self)
     cpdef list get_evaluators_without_strategy(self)
     cpdef TestSuiteResultSummary get_config_summary(self)
@@ -35,5 +41,6 @@ cdef class TestSuiteResult:
 cdef class TestSuiteResultSummary:
     cdef public list evaluators
     cdef public double risk
+    cdef public dict tentacles_settings
 
     cpdef str get_result_string(self)
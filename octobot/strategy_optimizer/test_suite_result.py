@@ -31,7 +31,8 @@ class TestSuiteResult:
     SCORE = "score"
     AVERAGE_TRADES = "average_trades"
 
-    def __init__(self, run_profitabilities, trades_counts, risk, time_frames, evaluators, strategy):
+    def __init__(self, run_profitabilities, trades_counts, risk, time_frames, evaluators, strategy,
+                 tentacles_settings=None, data_files=None):
         self.run_profitabilities = run_profitabilities
         self.trades_counts = trades_counts
         self.risk = risk
@@ -39,6 +40,16 @@ class TestSuiteResult:
         self.min_time_frame = time_frame_manager.find_min_time_frame(self.time_frames)
         self.evaluators = evaluators
         self.strategy = strategy
+        # {tentacle name: {parameter: value}} tentacles configuration update of this result
+        self.tentacles_settings = tentacles_settings or {}
+        # identifiers of the data files run by this result test suite, including the ones that gave no result
+        self.data_files = data_files or []
+        # number of runs stopped by abort rules before the end of their data file: their results are partial
+        self.aborted_runs_count = 0
+        # seconds spent running this result test suite outside of the test suite itself (event loop and cleanup)
+        self.overhead_time = 0
+        # peak resident memory in bytes of the process that ran this result test suite, 0 when unknown
+        self.peak_memory = 0
 
     def get_average_score(self):
         bot_profitabilities = [
@@ -46,6 +57,17 @@ class TestSuiteResult:
             for profitability_result in self.run_profitabilities]
         return data_util.mean(bot_profitabilities)
 
+    def merge(self, test_suite_result):
+        """
+        Adds the results of test_suite_result, which ran the same configuration on other data files
+        """
+        self.run_profitabilities = self.run_profitabilities + test_suite_result.run_profitabilities
+        self.trades_counts = self.trades_counts + test_suite_result.trades_counts
+        self.data_files = self.data_files + [data_file
+                                             for data_file in test_suite_result.data_files
+                                             if data_file not in self.data_files]
+        self.aborted_runs_count += test_suite_result.aborted_runs_count
+
     def get_average_trades_count(self):
         return data_util.mean(self.trades_counts)
 
@@ -60,9 +82,12 @@ class TestSuiteResult:
     def get_result_string(self, details=True):
         details_str = f" details: (profitabilities (bot, market):{self.run_profitabilities}, trades: " \
                       f"{self.trades_counts})" if details else ""
-        return (f"{self.get_evaluators_without_strategy()} on {self.time_frames} at risk: {self.risk} "
+        tentacles_settings = f" with {self.tentacles_settings}" if self.tentacles_settings else ""
+        aborted_runs = f" aborted runs: {self.aborted_runs_count}" if self.aborted_runs_count else ""
+        return (f"{self.get_evaluators_without_strategy()} on {self.time_frames} at risk: {self.risk}"
+                f"{tentacles_settings} "
                 f"score: {self.get_average_score():f} (the higher the better) "
-                f"average trades: {self.get_average_trades_count():f}{details_str}")
+                f"average trades: {self.get_average_trades_count():f}{aborted_runs}{details_str}")
 
     def get_result_dict(self, index=0):
         return self.convert_result_into_dict(index, self.get_evaluators_without_strategy(), self.time_frames,
@@ -85,12 +110,26 @@ class TestSuiteResultSummary:
     def __init__(self, test_suite_result):
         self.evaluators = test_suite_result.get_evaluators_without_strategy()
         self.risk = test_suite_result.risk
+        self.tentacles_settings = test_suite_result.tentacles_settings
+
+    @staticmethod
+    def from_run_configuration(run_configuration):
+        """
+        :return: the summary of the results of the given RunConfiguration
+        """
+        summary = TestSuiteResultSummary.__new__(TestSuiteResultSummary)
+        summary.evaluators = list(run_configuration.evaluators)
+        summary.risk = run_configuration.risk
+        summary.tentacles_settings = run_configuration.get_tentacles_settings_config()
+        return summary
 
     def get_result_string(self):
-        return f"{self.evaluators} risk: {self.risk}"
+        tentacles_settings = f" with {self.tentacles_settings}" if self.tentacles_settings else ""
+        return f"{self.evaluators} risk: {self.risk}{tentacles_settings}"
 
     def __eq__(self, other):
-        return self.evaluators == other.evaluators and self.risk == other.risk
+        return self.evaluators == other.evaluators and self.risk == other.risk \
+            and self.tentacles_settings == other.tentacles_settings
 
     def __hash__(self):
-        return abs(hash(f"{self.evaluators}{self.risk}"))
+        return abs(hash(f"{self.evaluators}{self.risk}{self.tentacles_settings}"))
@@ -0,0 +1,166 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import gc
+import logging
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:
+    # resource is not available on Windows: peak memory is unknown
+    resource = None
+
+import octobot_commons.logging as common_logging
+
+import octobot_tentacles_manager.api as tentacles_manager_api
+
+import octobot.backtesting as octobot_backtesting
+import octobot.constants as constants
+import octobot.strategy_optimizer as strategy_optimizer
+
+
+_LOCAL_STATE = threading.local()
+
+
+def init_worker_process(log_level=logging.ERROR, shared_base_config=None):
+    # each worker process has its own logging, channels and exchange managers: only limit its logs here
+    common_logging.set_global_logger_level(log_level)
+    if shared_base_config is not None:
+        # configuration overlays submitted to this worker are only sent with their overrides
+        octobot_backtesting.set_shared_base_config(shared_base_config)
+    # create the worker event loop once: it is reused by every test suite run in this process
+    get_event_loop()
+
+
+def init_forked_process(log_level=logging.ERROR):
+    # the event loop inherited from the forking process shares its selector: never use it
+    _LOCAL_STATE.event_loop = None
+    asyncio.set_event_loop(None)
+    init_worker_process(log_level)
+
+
+def get_event_loop():
+    """
+    :return: the event loop running test suites in the current thread, created on the first call
+    """
+    loop = getattr(_LOCAL_STATE, "event_loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        loop.set_debug(constants.OPTIMIZER_FORCE_ASYNCIO_DEBUG_OPTION)
+        _LOCAL_STATE.event_loop = loop
+    asyncio.set_event_loop(loop)
+    return loop
+
+
+def close_event_loop():
+    loop = getattr(_LOCAL_STATE, "event_loop", None)
+    if loop is not None and not loop.is_closed():
+        try:
+            _cancel_remaining_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+    _LOCAL_STATE.event_loop = None
+
+
+def run_test_suite(config, tentacles_setup_config, strategy_class, evaluators, test_suite=None, results_cache=None,
+                   evaluations_recordings_folder=None, tentacles_activation=None, scenarios=None,
+                   backtesting_window=None, tentacles_settings=None, release_memory=False, skipped_data_files=None,
+                   abort_rules=None, batch_data_files=False, synthetic_market_path=None, traders_risks=None):
+    """
+    Runs a StrategyTestSuite using the given configuration
+    :param tentacles_activation: tentacles activation update to apply to tentacles_setup_config before running
+    :param scenarios: indexes of the test suite scenarios to run, every scenario is run by default
+    :param backtesting_window: BacktestingWindow restricting each scenario backtesting, whole data files by default
+    :param tentacles_settings: {tentacle name: {parameter: value}} tentacles configuration update to run with
+    :param release_memory: when True, collect the finished backtestings exchange managers and evaluators right away
+    instead of waiting for the garbage collector
+    :param skipped_data_files: identifiers of the data files not to run, every data file is run by default
+    :param abort_rules: BacktestingAbortRules stopping scenarios backtestings early, they are fully run by default
+    :param batch_data_files: when True, run scenarios data files together in multi-exchange backtestings instead of
+    one backtesting per data file, data files of a same exchange are run in different backtestings
+    :param synthetic_market_path: SyntheticMarketPath to run scenarios on instead of their historical prices
+    :param traders_risks: risks of the simulated traders sharing each backtesting evaluations, the config risk is
+    used by a single trader by default
+    :return: the TestSuiteResult (the list of each trader TestSuiteResult when traders_risks is given) and the set
+    of encountered errors descriptions
+    """
+    if traders_risks and (results_cache is not None or batch_data_files or abort_rules is not None):
+        raise RuntimeError("Simulated traders can't be used with results cache, batched data files or abort rules")
+    if tentacles_activation:
+        tentacles_manager_api.update_activation_configuration(tentacles_setup_config, tentacles_activation, False)
+    if tentacles_settings:
+        tentacles_setup_config = strategy_optimizer.get_tentacles_settings_setup_config(tentacles_setup_config,
+                                                                                       tentacles_settings)
+    test_suite = strategy_optimizer.StrategyTestSuite() if test_suite is None else test_suite
+    test_suite.evaluators = list(evaluators)
+    test_suite.results_cache = results_cache
+    test_suite.evaluations_recordings_folder = evaluations_recordings_folder
+    test_suite.backtesting_window = backtesting_window
+    test_suite.abort_rules = abort_rules
+    test_suite.batch_data_files = batch_data_files
+    test_suite.synthetic_market_path = synthetic_market_path
+    test_suite.traders_risks = None if traders_risks is None else list(traders_risks)
+    test_suite.tentacles_settings = tentacles_settings
+    test_suite.skipped_data_files = None if skipped_data_files is None else set(skipped_data_files)
+    test_suite.initialize_with_strategy(strategy_class, tentacles_setup_config, config)
+    start_time = time.time()
+    loop = get_event_loop()
+    no_error, test_suite_time = loop.run_until_complete(_run_timed_test_suite(test_suite, scenarios))
+    # the event loop is reused: explicitly clean tasks left by this run instead of relying on its destruction
+    _cancel_remaining_tasks(loop)
+    errors = set() if no_error else set(str(e) for e in test_suite.exceptions)
+    test_suite_results = test_suite.get_traders_test_suite_results() if traders_risks \
+        else [test_suite.get_test_suite_result()]
+    if release_memory:
+        # stopped backtestings components reference each other: free them before the next run
+        gc.collect()
+    overhead_time = time.time() - start_time - test_suite_time
+    peak_memory = get_peak_memory()
+    for test_suite_result in test_suite_results:
+        # traders share the run overhead
+        test_suite_result.overhead_time = overhead_time / len(test_suite_results)
+        test_suite_result.peak_memory = peak_memory
+    return (test_suite_results if traders_risks else test_suite_results[0]), errors
+
+
+def get_peak_memory():
+    """
+    :return: the peak resident memory of the current process in bytes, 0 when unknown
+    """
+    if resource is None:
+        return 0
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is given in kilobytes on linux and in bytes on macOS
+    return peak_memory if sys.platform == "darwin" else peak_memory * 1024
+
+
+async def _run_timed_test_suite(test_suite, scenarios):
+    start_time = time.time()
+    no_error = await test_suite.run_test_suite(test_suite, scenarios=scenarios)
+    return no_error, time.time() - start_time
+
+
+def _cancel_remaining_tasks(loop):
+    remaining_tasks = asyncio.all_tasks(loop)
+    for task in remaining_tasks:
+        task.cancel()
+    if remaining_tasks:
+        loop.run_until_complete(asyncio.gather(*remaining_tasks, return_exceptions=True))
@@ -0,0 +1,208 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import concurrent.futures
+import multiprocessing
+
+import octobot_commons.logging as common_logging
+
+import octobot.backtesting as octobot_backtesting
+import octobot.constants as constants
+import octobot.strategy_optimizer as strategy_optimizer
+
+STEP = "step"
+IN_SAMPLE_SCORE = "in_sample_score"
+OUT_OF_SAMPLE_SCORE = "out_of_sample_score"
+
+
+class WalkForwardOptimizer:
+    """
+    WalkForwardOptimizer optimizes a strategy on successive windows of the test suite data files: at each step,
+    configurations are optimized on a window (in-sample) and the best ones are tested on the next one (out-of-sample).
+    Windows only restrict backtestings time ranges: data files are shared and never copied.
+    """
+
+    def __init__(self, config, tentacles_setup_config, strategy_name, windows=None,
+                 windows_count=constants.OPTIMIZER_WALK_FORWARD_WINDOWS_COUNT,
+                 selected_configurations_count=constants.OPTIMIZER_WALK_FORWARD_SELECTED_CONFIGURATIONS_COUNT):
+        self.logger = common_logging.get_logger(self.get_name())
+        self.config = config
+        self.tentacles_setup_config = tentacles_setup_config
+        self.strategy_name = strategy_name
+        self.windows = get_walk_forward_windows(windows_count) if windows is None else list(windows)
+        if len(self.windows) < 2:
+            raise RuntimeError(f"{self.get_name()} requires at least 2 windows, {len(self.windows)} given")
+        self.selected_configurations_count = selected_configurations_count
+        # {run_config: TestSuiteResult} of each step in-sample window
+        self.windows_results = []
+        # {run_config: TestSuiteResult} of each step selected configurations on the step out-of-sample window
+        self.out_of_sample_results = []
+        self.is_computing = False
+
+    def run(self, workers=constants.OPTIMIZER_DEFAULT_WORKERS, **optimizer_kwargs):
+        """
+        Optimizes every window but the last one using StrategyOptimizer and tests the best configurations of each
+        window on the next one
+        :param workers: number of steps to run concurrently, each step is run in its own process
+        :param optimizer_kwargs: StrategyOptimizer.find_optimal_configuration arguments used for each window
+        """
+        if self.is_computing:
+            raise RuntimeError(f"{self.get_name()} is already computing")
+        self.is_computing = True
+        try:
+            self.windows_results = []
+            self.out_of_sample_results = []
+            steps = list(zip(self.windows, self.windows[1:]))
+            self.logger.info(f"Optimizing {self.strategy_name} on {len(steps)} walk forward steps.")
+            if workers > 1:
+                # use spawned processes to run each step with its own logging, channels and exchange managers
+                with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(steps)),
+                                                            mp_context=multiprocessing.get_context("spawn")) \
+                        as executor:
+                    futures = [
+                        executor.submit(run_walk_forward_step, self.config, self.tentacles_setup_config,
+                                        self.strategy_name, in_sample_window, out_of_sample_window,
+                                        optimizer_kwargs, self.selected_configurations_count)
+                        for in_sample_window, out_of_sample_window in steps
+                    ]
+                    steps_results = [future.result() for future in futures]
+            else:
+                steps_results = [
+                    run_walk_forward_step(self.config, self.tentacles_setup_config, self.strategy_name,
+                                          in_sample_window, out_of_sample_window, optimizer_kwargs,
+                                          self.selected_configurations_count)
+                    for in_sample_window, out_of_sample_window in steps
+                ]
+            for in_sample_results, out_of_sample_results in steps_results:
+                self.windows_results.append(in_sample_results)
+                self.out_of_sample_results.append(out_of_sample_results)
+        finally:
+            self.is_computing = False
+
+    def get_report(self):
+        """
+        :return: for each walk forward step, the results of the configurations optimized on the step window with their
+        in-sample and out-of-sample scores, from the best in-sample score to the worst.
+        Out-of-sample scores of configurations that were not selected to run on the next window are None.
+        """
+        report = []
+        for step, (in_sample_results, out_of_sample_results) in enumerate(zip(self.windows_results,
+                                                                              self.out_of_sample_results)):
+            step_report = []
+            for rank, (run_config, in_sample_result) in enumerate(get_sorted_window_results(in_sample_results)):
+                out_of_sample_result = out_of_sample_results.get(run_config)
+                result = in_sample_result.get_result_dict(rank)
+                result.pop(strategy_optimizer.TestSuiteResult.SCORE)
+                result[STEP] = step
+                result[IN_SAMPLE_SCORE] = round(in_sample_result.get_average_score(), 5)
+                result[OUT_OF_SAMPLE_SCORE] = None if out_of_sample_result is None \
+                    else round(out_of_sample_result.get_average_score(), 5)
+                step_report.append(result)
+            report.append(step_report)
+        return report
+
+    def print_report(self):
+        selected_results = []
+        for step, step_report in enumerate(self.get_report()):
+            self.logger.info(f" *** Walk forward step {step}: optimized on {self.windows[step]}, tested on "
+                             f"{self.windows[step + 1]} *** ")
+            for result in step_report[0:self.selected_configurations_count]:
+                self.logger.info(f"{result[strategy_optimizer.TestSuiteResult.INDEX]}: "
+                                 f"{result[strategy_optimizer.TestSuiteResult.EVALUATORS]} on "
+                                 f"{result[strategy_optimizer.TestSuiteResult.TIME_FRAMES]} at risk: "
+                                 f"{result[strategy_optimizer.TestSuiteResult.RISK]} in-sample score: "
+                                 f"{result[IN_SAMPLE_SCORE]} out-of-sample score: {result[OUT_OF_SAMPLE_SCORE]}")
+            selected_results += [result for result in step_report if result[OUT_OF_SAMPLE_SCORE] is not None]
+        if selected_results:
+            self.logger.info(f" *** Walk forward selected configurations average scores: in-sample: "
+                             f"{_get_average(selected_results, IN_SAMPLE_SCORE):f} out-of-sample: "
+                             f"{_get_average(selected_results, OUT_OF_SAMPLE_SCORE):f} *** ")
+
+    @classmethod
+    def get_name(cls):
+        return cls.__name__
+
+
+def get_walk_forward_windows(windows_count, start_timestamp=None, end_timestamp=None):
+    """
+    :return: windows_count successive BacktestingWindow splitting [start_timestamp, end_timestamp] when both are
+    given or each data file time range otherwise
+    """
+    if windows_count < 2:
+        raise RuntimeError(f"Walk forward optimization requires at least 2 windows, {windows_count} given")
+    if start_timestamp is not None and end_timestamp is not None:
+        window_duration = (end_timestamp - start_timestamp) / windows_count
+        return [
+            octobot_backtesting.BacktestingWindow(start_timestamp=start_timestamp + window_duration * index,
+                                                  end_timestamp=start_timestamp + window_duration * (index + 1))
+            for index in range(windows_count)
+        ]
+    return [
+        octobot_backtesting.BacktestingWindow(start_ratio=index / windows_count, end_ratio=(index + 1) / windows_count)
+        for index in range(windows_count)
+    ]
+
+
+def run_walk_forward_step(config, tentacles_setup_config, strategy_name, in_sample_window, out_of_sample_window,
+                          optimizer_kwargs, selected_configurations_count):
+    """
+    Optimizes configurations on in_sample_window and runs the selected_configurations_count best ones on
+    out_of_sample_window
+    :return: the {run_config: TestSuiteResult} in-sample results and the selected configurations out-of-sample results
+    """
+    in_sample_results = optimize_window(config, tentacles_setup_config, strategy_name, in_sample_window,
+                                        optimizer_kwargs)
+    selected_results = get_sorted_window_results(in_sample_results)[:selected_configurations_count]
+    out_of_sample_results = backtest_window_configurations(config, tentacles_setup_config, strategy_name,
+                                                           out_of_sample_window,
+                                                           [run_config for run_config, _ in selected_results])
+    return in_sample_results, out_of_sample_results
+
+
+def optimize_window(config, tentacles_setup_config, strategy_name, backtesting_window, optimizer_kwargs):
+    """
+    :return: the {run_config: TestSuiteResult} results of a StrategyOptimizer run on backtesting_window
+    """
+    optimizer = _create_optimizer(config, tentacles_setup_config, strategy_name)
+    optimizer.find_optimal_configuration(backtesting_window=backtesting_window, **optimizer_kwargs)
+    return dict(zip(optimizer.run_configurations, optimizer.run_results))
+
+
+def backtest_window_configurations(config, tentacles_setup_config, strategy_name, backtesting_window, run_configs):
+    """
+    :return: the {run_config: TestSuiteResult} results of the given configurations on backtesting_window
+    """
+    if not run_configs:
+        return {}
+    optimizer = _create_optimizer(config, tentacles_setup_config, strategy_name)
+    return optimizer.run_configurations_test_suites(run_configs, backtesting_window=backtesting_window)
+
+
+def get_sorted_window_results(results):
+    """
+    :return: the (run_config, TestSuiteResult) items of results from the best average score to the worst
+    """
+    return sorted(results.items(), key=lambda result: result[1].get_average_score(), reverse=True)
+
+
+def _create_optimizer(config, tentacles_setup_config, strategy_name):
+    optimizer = strategy_optimizer.StrategyOptimizer(config, tentacles_setup_config, strategy_name)
+    if not optimizer.is_properly_initialized:
+        raise RuntimeError(f"Impossible to optimize {strategy_name}: strategy not found")
+    return optimizer
+
+
+def _get_average(results, key):
+    return sum(result[key] for result in results) / len(results)
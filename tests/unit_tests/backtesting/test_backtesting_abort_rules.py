@@ -0,0 +1,39 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot.backtesting as backtesting
+
+
+def test_get_abort_reason():
+    assert backtesting.BacktestingAbortRules().get_abort_reason(1000, 0.1, 0) is None
+    rules = backtesting.BacktestingAbortRules(min_portfolio_ratio=0.5, max_candles_without_order=100)
+    assert rules.get_abort_reason(10, 1, 0) is None
+    assert rules.get_abort_reason(10, 0.6, 2) is None
+    assert rules.get_abort_reason(10, 0.4, 2) is not None
+    assert rules.get_abort_reason(100, 1, 0) is not None
+    assert rules.get_abort_reason(100, 1, 1) is None
+    with pytest.raises(RuntimeError):
+        backtesting.BacktestingAbortRules(min_portfolio_ratio=1)
+    with pytest.raises(RuntimeError):
+        backtesting.BacktestingAbortRules(max_candles_without_order=0)
+
+
+def test_to_dict():
+    rules = backtesting.BacktestingAbortRules(min_portfolio_ratio=0.5)
+    restored_rules = backtesting.BacktestingAbortRules.from_dict(rules.to_dict())
+    assert restored_rules.min_portfolio_ratio == 0.5
+    assert restored_rules.max_candles_without_order is None
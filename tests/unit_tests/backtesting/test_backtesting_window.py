@@ -0,0 +1,48 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot.backtesting as backtesting
+
+
+class ImporterMock:
+    async def get_data_timestamp_interval(self, time_frame=None):
+        return 1000, 2000
+
+
+def test_get_time_range():
+    assert backtesting.BacktestingWindow().get_time_range(1000, 2000) == (1000, 2000)
+    assert backtesting.BacktestingWindow(0.25, 0.5).get_time_range(1000, 2000) == (1250, 1500)
+    assert backtesting.BacktestingWindow(start_timestamp=1200, end_timestamp=3000).get_time_range(1000, 2000) == \
+        (1200, 2000)
+    assert backtesting.BacktestingWindow(0.5, start_timestamp=1200, end_timestamp=1800).get_time_range(1000, 2000) == \
+        (1500, 1800)
+    with pytest.raises(RuntimeError):
+        backtesting.BacktestingWindow(start_timestamp=3000).get_time_range(1000, 2000)
+    with pytest.raises(RuntimeError):
+        backtesting.BacktestingWindow(0.5, 0.5)
+
+
+def test_to_dict():
+    window = backtesting.BacktestingWindow(0.25, 0.5, end_timestamp=1400)
+    assert backtesting.BacktestingWindow.from_dict(window.to_dict()).get_time_range(1000, 2000) == (1250, 1400)
+
+
+@pytest.mark.asyncio
+async def test_register_importer():
+    importer = ImporterMock()
+    backtesting.BacktestingWindow(0.5, 0.75).register_importer(importer)
+    assert await importer.get_data_timestamp_interval() == (1500, 1750)
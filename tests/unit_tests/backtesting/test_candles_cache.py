@@ -0,0 +1,106 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot.backtesting as backtesting
+
+pytestmark = pytest.mark.asyncio
+
+
+class ImporterMock:
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.calls_count = 0
+
+    async def get_ohlcv(self, exchange_name=None, symbol=None, time_frame=commons_enums.TimeFrames.ONE_HOUR,
+                        limit=100, inferior_timestamp=-1, superior_timestamp=-1):
+        self.calls_count += 1
+        return [[inferior_timestamp, exchange_name, symbol, time_frame.value, [1, 2, 3, 4, 5]]]
+
+    async def get_ohlcv_from_timestamps(self, exchange_name=None, symbol=None,
+                                        time_frame=commons_enums.TimeFrames.ONE_HOUR,
+                                        limit=100, inferior_timestamp=-1, superior_timestamp=-1):
+        return await self.get_ohlcv(exchange_name, symbol, time_frame, limit, inferior_timestamp, superior_timestamp)
+
+
+def _create_importer(folder, name="data_file.data"):
+    file_path = os.path.join(folder, name)
+    with open(file_path, "w") as file:
+        file.write(name)
+    return ImporterMock(file_path)
+
+
+async def test_shared_between_importers(tmp_path):
+    cache = backtesting.CandlesCache()
+    importer_1 = _create_importer(tmp_path)
+    importer_2 = _create_importer(tmp_path)
+    cache.register_importer(importer_1)
+    cache.register_importer(importer_2)
+    candles = await importer_1.get_ohlcv("binance", "BTC/USDT", commons_enums.TimeFrames.ONE_HOUR,
+                                         inferior_timestamp=10)
+    # same call using keywords on another importer of the same file
+    assert await importer_2.get_ohlcv(exchange_name="binance", symbol="BTC/USDT",
+                                      time_frame=commons_enums.TimeFrames.ONE_HOUR, inferior_timestamp=10) is candles
+    assert importer_2.calls_count == 0
+    assert cache.hits_count == 1
+    await importer_2.get_ohlcv("binance", "BTC/USDT", commons_enums.TimeFrames.ONE_HOUR, inferior_timestamp=20)
+    await importer_2.get_ohlcv_from_timestamps("binance", "BTC/USDT", commons_enums.TimeFrames.ONE_HOUR,
+                                               inferior_timestamp=20)
+    # get_ohlcv_from_timestamps is relying on the already cached get_ohlcv call
+    assert importer_2.calls_count == 1
+    assert cache.misses_count == 3
+    assert cache.hits_count == 2
+    # one candle per call, cache hits are not read
+    assert cache.read_candles_count == 3
+
+
+async def test_eviction(tmp_path):
+    cache = backtesting.CandlesCache(max_size=0)
+    importer = _create_importer(tmp_path)
+    cache.register_importer(importer)
+    await importer.get_ohlcv("binance", "BTC/USDT", commons_enums.TimeFrames.ONE_HOUR)
+    await importer.get_ohlcv("binance", "BTC/USDT", commons_enums.TimeFrames.ONE_HOUR)
+    # current group is kept
+    assert importer.calls_count == 1
+    await importer.get_ohlcv("binance", "ETH/USDT", commons_enums.TimeFrames.ONE_HOUR)
+    await importer.get_ohlcv("binance", "BTC/USDT", commons_enums.TimeFrames.ONE_HOUR)
+    # BTC/USDT group has been evicted
+    assert importer.calls_count == 3
+    cache.clear()
+    assert cache.size == 0
+
+
+async def test_unhashable_arguments(tmp_path):
+    cache = backtesting.CandlesCache()
+    importer = _create_importer(tmp_path)
+    cache.register_importer(importer)
+    await importer.get_ohlcv("binance", ["BTC/USDT"], commons_enums.TimeFrames.ONE_HOUR)
+    await importer.get_ohlcv("binance", ["BTC/USDT"], commons_enums.TimeFrames.ONE_HOUR)
+    assert importer.calls_count == 2
+
+
+async def test_get_file_description(tmp_path):
+    cache = backtesting.CandlesCache()
+    importer = _create_importer(tmp_path)
+    with mock.patch.object(backtesting.candles_cache.backtesting_data, "get_file_description",
+                           mock.AsyncMock(return_value={"exchange": "binance"})) as get_file_description_mock:
+        assert await cache.get_file_description(importer.file_path) == {"exchange": "binance"}
+        assert await cache.get_file_description(importer.file_path) == {"exchange": "binance"}
+        get_file_description_mock.assert_called_once_with(importer.file_path)
@@ -0,0 +1,81 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pickle
+import pytest
+
+import octobot.backtesting as backtesting
+
+
+def _get_config():
+    return {
+        "trading": {"risk": 0.5, "reference-market": "BTC"},
+        "simulator": {"starting-portfolio": {"BTC": 10}},
+    }
+
+
+def test_overrides():
+    config = _get_config()
+    overlay = backtesting.ConfigurationOverlay(config, {
+        ("trading", "risk"): 1,
+        ("forced-time-frame",): ["1h"],
+    })
+    assert overlay["trading"]["risk"] == 1
+    assert overlay["trading"]["reference-market"] == "BTC"
+    assert overlay["forced-time-frame"] == ["1h"]
+    assert "forced-time-frame" in overlay
+    assert "exchanges" not in overlay
+    assert overlay.get("exchanges") is None
+    with pytest.raises(KeyError):
+        overlay["exchanges"]
+    # not overridden elements are shared
+    assert overlay["simulator"] is config["simulator"]
+    assert sorted(overlay) == ["forced-time-frame", "simulator", "trading"]
+    assert len(overlay) == 3
+    assert overlay.to_dict() == {
+        "trading": {"risk": 1, "reference-market": "BTC"},
+        "simulator": {"starting-portfolio": {"BTC": 10}},
+        "forced-time-frame": ["1h"],
+    }
+    # base config is not modified
+    assert config == _get_config()
+    with pytest.raises(TypeError):
+        overlay["trading"]["risk"] = 2
+
+
+def test_pickle():
+    overlay = backtesting.ConfigurationOverlay(_get_config(), {("trading", "risk"): 1})
+    assert pickle.loads(pickle.dumps(overlay)).to_dict() == overlay.to_dict()
+
+
+def test_pickle_shared_base_config():
+    config = _get_config()
+    overlay = backtesting.ConfigurationOverlay(config, {("trading", "risk"): 1})
+    try:
+        backtesting.set_shared_base_config(config)
+        pickled_overlay = pickle.dumps(overlay)
+        # only overrides are pickled
+        assert b"starting-portfolio" not in pickled_overlay
+        # the overlay is rebuilt on top of the shared base configuration of the unpickling process
+        unpickled_overlay = pickle.loads(pickled_overlay)
+        assert unpickled_overlay.base_config is config
+        assert unpickled_overlay.to_dict() == overlay.to_dict()
+        # other overlays are pickled with their base configuration
+        assert b"starting-portfolio" in pickle.dumps(backtesting.ConfigurationOverlay(_get_config(), {}))
+        backtesting.set_shared_base_config(None)
+        with pytest.raises(RuntimeError):
+            pickle.loads(pickled_overlay)
+    finally:
+        backtesting.set_shared_base_config(None)
@@ -0,0 +1,80 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import pytest
+
+import octobot.backtesting as backtesting
+
+
+def _add_note(recording, timestamp, eval_note):
+    recording.add_note(timestamp, "SimpleStrategyEvaluator", "STRATEGIES", eval_note, None,
+                       "binance", "Bitcoin", "BTC/USDT", "1h")
+
+
+def test_pop_notes_until():
+    recording = backtesting.EvaluationsRecording()
+    _add_note(recording, 1, -1)
+    _add_note(recording, 2, 0.5)
+    _add_note(recording, 2, 0.2)
+    _add_note(recording, 5, 1)
+    assert recording.pop_notes_until(0) == []
+    assert [note[3] for note in recording.pop_notes_until(2)] == [-1, 0.5, 0.2]
+    assert recording.pop_notes_until(4) == []
+    assert [note[3] for note in recording.pop_notes_until(10)] == [1]
+    assert recording.pop_notes_until(11) == []
+
+
+def test_save_and_load(tmp_path):
+    recording_file = os.path.join(tmp_path, "recordings", "scenario.recording")
+    recording = backtesting.EvaluationsRecording()
+    _add_note(recording, 1, -1)
+    _add_note(recording, 2, 0.5)
+    with pytest.raises(RuntimeError):
+        # incomplete recordings can't be saved
+        recording.save(recording_file)
+    recording.stop(True)
+    recording.save(recording_file)
+
+    loaded_recording = backtesting.EvaluationsRecording()
+    assert loaded_recording.load(recording_file)
+    assert loaded_recording.is_replay()
+    assert loaded_recording.notes == recording.notes
+
+    assert not backtesting.EvaluationsRecording().load(os.path.join(tmp_path, "missing.recording"))
+    with open(recording_file, "wb") as file:
+        file.write(b"invalid")
+    invalid_recording = backtesting.EvaluationsRecording()
+    assert not invalid_recording.load(recording_file)
+    assert not invalid_recording.is_replay()
+
+
+def test_replayed_evaluators():
+    evaluator_recording = backtesting.EvaluationsRecording()
+    _add_note(evaluator_recording, 1, -1)
+    _add_note(evaluator_recording, 3, 1)
+    evaluator_recording.stop(True)
+    recording = backtesting.EvaluationsRecording()
+    recording.add_replayed_evaluator("SimpleStrategyEvaluator", evaluator_recording)
+    assert not recording.is_replay()
+    assert recording.replayed_evaluators == ["SimpleStrategyEvaluator"]
+    # replayed notes are not recorded ones
+    recording.add_note(2, "RSIMomentumEvaluator", "TA", 0.5, None, "binance", "Bitcoin", "BTC/USDT", "1h")
+    assert [note[3] for note in recording.pop_notes_until(2)] == [-1]
+    assert [note[3] for note in recording.pop_notes_until(3)] == [1]
+    recording.stop(True)
+    assert recording.get_evaluator_recording("RSIMomentumEvaluator").notes == recording.notes
+    assert recording.get_evaluator_recording("RSIMomentumEvaluator").is_replay()
+    assert recording.get_evaluator_recording("SimpleStrategyEvaluator").notes == []
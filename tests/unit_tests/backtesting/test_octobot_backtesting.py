@@ -0,0 +1,57 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.constants as commons_constants
+
+import octobot.backtesting as backtesting
+
+
+def _get_backtesting_config():
+    return {
+        commons_constants.CONFIG_TRADING: {
+            commons_constants.CONFIG_TRADER_RISK: 0.5,
+            commons_constants.CONFIG_TRADER_REFERENCE_MARKET: "BTC"
+        },
+        commons_constants.CONFIG_SIMULATOR: {
+            commons_constants.CONFIG_STARTING_PORTFOLIO: {"BTC": 10},
+            commons_constants.CONFIG_SIMULATOR_FEES: {}
+        },
+    }
+
+
+def test_traders_config():
+    config = _get_backtesting_config()
+    octobot_backtesting = backtesting.OctoBotBacktesting(config, None, {}, [], True,
+                                                         traders_settings=[
+                                                             {},
+                                                             {commons_constants.CONFIG_TRADER_RISK: 1},
+                                                             {commons_constants.CONFIG_STARTING_PORTFOLIO: {"BTC": 1}}
+                                                         ])
+    assert octobot_backtesting.exchange_manager_ids_by_trader == [[], [], []]
+    assert octobot_backtesting._get_trader_config(octobot_backtesting.traders_settings[0]) is config
+
+    risk_config = octobot_backtesting._get_trader_config(octobot_backtesting.traders_settings[1])
+    assert risk_config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK] == 1
+    assert risk_config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_REFERENCE_MARKET] == "BTC"
+    assert risk_config[commons_constants.CONFIG_SIMULATOR] == config[commons_constants.CONFIG_SIMULATOR]
+
+    portfolio_config = octobot_backtesting._get_trader_config(octobot_backtesting.traders_settings[2])
+    assert portfolio_config[commons_constants.CONFIG_SIMULATOR][commons_constants.CONFIG_STARTING_PORTFOLIO] == \
+        {"BTC": 1}
+    assert portfolio_config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK] == 0.5
+
+    # base config is not modified
+    assert config == _get_backtesting_config()
+    assert backtesting.OctoBotBacktesting(config, None, {}, [], True).exchange_manager_ids_by_trader == [[]]
@@ -0,0 +1,110 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot.backtesting as backtesting
+import octobot.backtesting.synthetic_market_path as synthetic_market_path
+
+TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
+HOUR = 3600
+
+
+def _get_ohlcv(time, open_price, high, low, close):
+    candle = [0] * len(commons_enums.PriceIndexes)
+    candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] = time
+    candle[commons_enums.PriceIndexes.IND_PRICE_OPEN.value] = open_price
+    candle[commons_enums.PriceIndexes.IND_PRICE_HIGH.value] = high
+    candle[commons_enums.PriceIndexes.IND_PRICE_LOW.value] = low
+    candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] = close
+    candle[commons_enums.PriceIndexes.IND_PRICE_VOL.value] = 1
+    return [time, "binance", "BTC/USDT", TIME_FRAME.value, candle]
+
+
+def _get_close(ohlcv):
+    return ohlcv[-1][commons_enums.PriceIndexes.IND_PRICE_CLOSE.value]
+
+
+class ImporterMock:
+    def __init__(self, ohlcvs):
+        self.file_path = "data/ExchangeHistoryDataCollector_1.data"
+        self.exchange_name = "binance"
+        self.time_frames = [TIME_FRAME]
+        self.ohlcvs = ohlcvs
+
+    async def get_ohlcv(self, exchange_name=None, symbol=None, time_frame=None, limit=None):
+        return self.ohlcvs
+
+
+@pytest.fixture(autouse=True)
+def clear_price_factors():
+    synthetic_market_path.clear_price_factors()
+    yield
+    synthetic_market_path.clear_price_factors()
+
+
+def test_init():
+    with pytest.raises(RuntimeError):
+        backtesting.SyntheticMarketPath(3, 3)
+    with pytest.raises(RuntimeError):
+        backtesting.SyntheticMarketPath(0, 3, block_size=0)
+    path = backtesting.SyntheticMarketPath(2, 3, block_size=5, seed=1)
+    assert backtesting.SyntheticMarketPath.from_dict(path.to_dict()).to_dict() == path.to_dict()
+
+
+def test_get_bootstrapped_prices():
+    prices = numpy.array([100, 110, 99, 105, 120, 118, 130])
+    paths = synthetic_market_path.get_bootstrapped_prices(prices, 4, 2, numpy.random.default_rng(0))
+    assert paths.shape == (4, len(prices))
+    assert numpy.allclose(paths[:, 0], 100)
+    # each path is made of historical returns
+    returns = numpy.diff(numpy.log(prices))
+    assert all(numpy.isclose(returns, path_return).any() for path_return in numpy.diff(numpy.log(paths)).ravel())
+    assert numpy.array_equal(paths, synthetic_market_path.get_bootstrapped_prices(prices, 4, 2,
+                                                                                   numpy.random.default_rng(0)))
+    assert numpy.array_equal(synthetic_market_path.get_bootstrapped_prices(numpy.array([100]), 2, 2,
+                                                                           numpy.random.default_rng(0)),
+                             [[100], [100]])
+
+
+def test_get_scaled_ohlcvs():
+    ohlcvs = [_get_ohlcv(0, 9, 12, 8, 10), _get_ohlcv(HOUR, 10, 22, 10, 20)]
+    close_times, _ = synthetic_market_path.get_close_prices(ohlcvs, TIME_FRAME)
+    assert close_times.tolist() == [HOUR, 2 * HOUR]
+    scaled_ohlcvs = synthetic_market_path.get_scaled_ohlcvs(ohlcvs, TIME_FRAME, close_times, numpy.array([1, 0.5]))
+    assert scaled_ohlcvs[0] == ohlcvs[0]
+    assert scaled_ohlcvs[1] == _get_ohlcv(HOUR, 5, 11, 5, 10)
+    # rows are copied
+    assert _get_close(ohlcvs[1]) == 20
+
+
+@pytest.mark.asyncio
+async def test_register_importer():
+    closes = [100, 101, 99, 103, 104, 102, 106, 108]
+    ohlcvs = [_get_ohlcv(index * HOUR, close, close, close, close) for index, close in enumerate(closes)]
+    importer = ImporterMock(ohlcvs)
+    backtesting.SyntheticMarketPath(1, 3, block_size=2).register_importer(importer)
+    synthetic_closes = [_get_close(ohlcv) for ohlcv in await importer.get_ohlcv("binance", "BTC/USDT", TIME_FRAME)]
+    assert synthetic_closes[0] == pytest.approx(closes[0])
+    assert synthetic_closes != closes
+    # paths are generated once for every path of the data file symbol
+    other_importer = ImporterMock(ohlcvs)
+    backtesting.SyntheticMarketPath(1, 3, block_size=2).register_importer(other_importer)
+    assert [_get_close(ohlcv) for ohlcv in await other_importer.get_ohlcv(symbol="BTC/USDT", time_frame=TIME_FRAME)] \
+        == synthetic_closes
+    assert len(synthetic_market_path._PRICE_FACTORS) == 1
@@ -0,0 +1,44 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import tentacles.Evaluator.Strategies as tentacles_strategies
+import tentacles.Evaluator.TA as tentacles_ta
+
+import octobot.backtesting as backtesting
+
+
+def test_get_class():
+    index = backtesting.TentaclesIndex()
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    evaluator_name = tentacles_ta.RSIMomentumEvaluator.get_name()
+    assert index.get_class(strategy_name, backtesting.tentacles_index.STRATEGY) is \
+        tentacles_strategies.SimpleStrategyEvaluator
+    assert index.get_class(strategy_name, backtesting.tentacles_index.TA) is None
+    assert index.get_class(evaluator_name, backtesting.tentacles_index.TA) is tentacles_ta.RSIMomentumEvaluator
+    assert index.get_class("UnknownEvaluator", backtesting.tentacles_index.TA) is None
+    assert index.is_strategy(strategy_name)
+    assert not index.is_strategy(evaluator_name)
+    assert index.get_type(evaluator_name) == backtesting.tentacles_index.TA
+    assert index.get_type("UnknownEvaluator") is None
+
+
+def test_clear():
+    index = backtesting.TentaclesIndex()
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    assert index.is_strategy(strategy_name)
+    index._classes_by_type[backtesting.tentacles_index.STRATEGY].clear()
+    assert not index.is_strategy(strategy_name)
+    index.clear()
+    assert index.is_strategy(strategy_name)
@@ -0,0 +1,101 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+
+def test_iterate_subsets():
+    elements = ["a", "b", "c", "d"]
+    subsets = list(strategy_optimizer.iterate_subsets(elements))
+    assert len(subsets) == strategy_optimizer.get_subsets_count(elements) == 15
+    assert len(set(frozenset(subset) for subset in subsets)) == len(subsets)
+    assert subsets[0] == ("a",)
+    assert subsets[-1] == ("a", "b", "c", "d")
+    # duplicated elements are only considered once
+    assert list(strategy_optimizer.iterate_subsets(["a", "b", "a"])) == [("a",), ("b",), ("a", "b")]
+    assert strategy_optimizer.get_subsets_count(["a", "b", "a"]) == 3
+    assert list(strategy_optimizer.iterate_subsets([])) == []
+
+
+def test_iterate_run_configurations():
+    risks = [0.5, 1]
+    evaluators = ["RSIMomentumEvaluator", "DoubleMovingAverageTrendEvaluator", "BBMomentumEvaluator"]
+    time_frames = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS]
+    run_configs = list(strategy_optimizer.iterate_run_configurations(risks, evaluators, time_frames))
+    assert len(run_configs) == strategy_optimizer.get_run_configurations_count(risks, evaluators, time_frames) == 42
+    assert len(set(run_configs)) == len(run_configs)
+    # configurations only differing by their risk are consecutive
+    assert [run_config.risk for run_config in run_configs[:4]] == [0.5, 1, 0.5, 1]
+    assert run_configs[0].evaluators == run_configs[1].evaluators
+    assert run_configs[0].time_frames == run_configs[1].time_frames
+
+
+def test_run_configuration():
+    run_config = strategy_optimizer.RunConfiguration(1, ("RSIMomentumEvaluator", "BBMomentumEvaluator"),
+                                                     (commons_enums.TimeFrames.FOUR_HOURS,
+                                                      commons_enums.TimeFrames.ONE_HOUR))
+    assert run_config == strategy_optimizer.RunConfiguration(1, ("BBMomentumEvaluator", "RSIMomentumEvaluator"),
+                                                             (commons_enums.TimeFrames.ONE_HOUR,
+                                                              commons_enums.TimeFrames.FOUR_HOURS))
+    assert run_config in {run_config}
+    assert run_config != strategy_optimizer.RunConfiguration(0.5, run_config.evaluators, run_config.time_frames)
+    assert run_config.get_evaluators_config("SimpleStrategyEvaluator") == {
+        "RSIMomentumEvaluator": True,
+        "BBMomentumEvaluator": True,
+        "SimpleStrategyEvaluator": True
+    }
+    assert run_config.get_time_frames_config() == ["1h", "4h"]
+
+
+def test_get_parameter_values():
+    assert strategy_optimizer.get_parameter_values([14, 21, 14]) == [14, 21]
+    assert strategy_optimizer.get_parameter_values({"min": 10, "max": 20, "step": 5}) == [10, 15, 20]
+    assert strategy_optimizer.get_parameter_values({"min": 0.1, "max": 0.3, "step": 0.1}) == [0.1, 0.2, 0.3]
+    assert strategy_optimizer.get_parameter_values({"min": 10, "max": 12, "step": 5}) == [10]
+    with pytest.raises(RuntimeError):
+        strategy_optimizer.get_parameter_values({"min": 10, "max": 12, "step": 0})
+
+
+def test_get_tentacles_settings():
+    assert strategy_optimizer.get_tentacles_settings(None) == [strategy_optimizer.NO_TENTACLES_SETTINGS]
+    tentacles_settings = strategy_optimizer.get_tentacles_settings({
+        "RSIMomentumEvaluator": {"period_length": [14, 21], "short_term_averages_length": {"min": 1, "max": 3,
+                                                                                           "step": 1}},
+        "BBMomentumEvaluator": {"period_length": [20]}
+    })
+    assert len(tentacles_settings) == 6
+    assert tentacles_settings[0] == ((("BBMomentumEvaluator", "period_length"), 20),
+                                     (("RSIMomentumEvaluator", "period_length"), 14),
+                                     (("RSIMomentumEvaluator", "short_term_averages_length"), 1))
+    config = strategy_optimizer.get_tentacles_settings_config(tentacles_settings[0])
+    assert config == {
+        "BBMomentumEvaluator": {"period_length": 20},
+        "RSIMomentumEvaluator": {"period_length": 14, "short_term_averages_length": 1}
+    }
+    assert strategy_optimizer.get_tentacles_settings_from_config(config) == tentacles_settings[0]
+
+    risks = [1]
+    evaluators = ["RSIMomentumEvaluator"]
+    time_frames = [commons_enums.TimeFrames.ONE_HOUR]
+    run_configs = list(strategy_optimizer.iterate_run_configurations(risks, evaluators, time_frames,
+                                                                     tentacles_settings))
+    assert len(run_configs) == len(set(run_configs)) == 6
+    assert strategy_optimizer.get_run_configurations_count(risks, evaluators, time_frames, tentacles_settings) == 6
+    assert [run_config.tentacles_settings for run_config in run_configs] == tentacles_settings
+    assert run_configs[0].get_tentacles_settings_config() == config
@@ -0,0 +1,72 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy
+
+import octobot_commons.enums as commons_enums
+
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.configurations_race as configurations_race
+
+STRATEGY = "Strategy"
+
+
+def _result(run_config, score):
+    return strategy_optimizer.TestSuiteResult([(score, 0)], [1], run_config.risk, run_config.get_time_frames_config(),
+                                              list(run_config.evaluators) + [STRATEGY], STRATEGY)
+
+
+def test_get_dominated_indexes():
+    # not enough rounds or configurations
+    assert configurations_race.get_dominated_indexes(numpy.array([[1, 2, 3]]), 0.95) == []
+    assert configurations_race.get_dominated_indexes(numpy.array([[1], [2]]), 0.95) == []
+    # same scores
+    assert configurations_race.get_dominated_indexes(numpy.ones((3, 4)), 0.95) == []
+    # no significant difference
+    assert configurations_race.get_dominated_indexes(numpy.array([[1, 2, 3], [3, 2, 1]]), 0.95) == []
+    scores = numpy.array([
+        [5, 4, 1, 0.5, 0],
+        [4, 5, 0, 1, 0.5],
+        [5, 4, 0.5, 0, 1],
+        [5, 4, 0, 0.5, 1],
+    ])
+    assert configurations_race.get_dominated_indexes(scores, 0.95) == [2, 3, 4]
+
+
+def test_configurations_race():
+    one_hour = commons_enums.TimeFrames.ONE_HOUR
+    four_hours = commons_enums.TimeFrames.FOUR_HOURS
+    run_configs = [strategy_optimizer.RunConfiguration(1, [f"TA{i}" for i in range(index)], [one_hour])
+                   for index in range(5)]
+    # the worst configuration on another time frame is never compared to the others
+    other_time_frame_run_config = strategy_optimizer.RunConfiguration(1, [], [four_hours])
+    race = strategy_optimizer.ConfigurationsRace(run_configs + [other_time_frame_run_config], min_rounds=2)
+    for round_index in range(3):
+        for index, run_config in enumerate(run_configs):
+            race.add_result(run_config, _result(run_config, index + round_index), {f"error {round_index}"})
+        race.add_result(other_time_frame_run_config, _result(other_time_frame_run_config, -10), set())
+        eliminated = race.end_round()
+        if round_index == 0:
+            assert eliminated == []
+    assert race.rounds_count == 3
+    assert run_configs[-1] in race.alive_run_configurations
+    assert other_time_frame_run_config in race.alive_run_configurations
+    assert run_configs[0] not in race.alive_run_configurations
+
+    test_suite_result, errors = race.get_result(run_configs[-1])
+    assert test_suite_result.run_profitabilities == [(4, 0), (5, 0), (6, 0)]
+    assert test_suite_result.trades_counts == [1, 1, 1]
+    assert test_suite_result.risk == 1
+    assert errors == {"error 0", "error 1", "error 2"}
@@ -0,0 +1,136 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import builtins
+import socket
+import threading
+import mock
+import pytest
+
+import tests.test_utils.config as test_utils_config
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+import octobot_commons.tests.test_config as test_config
+import octobot_evaluators.constants as evaluator_constants
+import tentacles.Evaluator.Strategies as tentacles_strategies
+import octobot.constants as constants
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.distributed.protocol as protocol
+
+HOST = "127.0.0.1"
+STRATEGY_NAME = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+
+
+def _run_test_suite(config, tentacles_setup_config, strategy_class, evaluators, traders_risks=None, **_):
+    def _get_result(risk):
+        return strategy_optimizer.TestSuiteResult([(risk * len(evaluators), 0)], [1], risk,
+                                                  config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+                                                  list(evaluators), STRATEGY_NAME)
+
+    if traders_risks is not None:
+        # local runs share backtestings between risks
+        return [_get_result(risk) for risk in traders_risks], set()
+    return _get_result(config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK]), set()
+
+
+def _get_free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def _start_worker_thread(port, name):
+    thread = threading.Thread(target=strategy_optimizer.run_worker,
+                              args=(HOST, port, test_config.load_test_config(),
+                                    test_utils_config.load_test_tentacles_config()),
+                              kwargs={"name": name})
+    thread.start()
+    return thread
+
+
+async def _take_job_and_disconnect(port, silence=0):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    await protocol.send_message(writer, protocol.HELLO, name="lost worker", slots=1)
+    assert (await protocol.read_message(reader))[protocol.TYPE] == protocol.SETUP
+    await protocol.send_message(writer, protocol.READY)
+    job = await protocol.read_message(reader)
+    await asyncio.sleep(silence)
+    writer.close()
+    return job
+
+
+def _get_job_descriptor():
+    run_config = strategy_optimizer.RunConfiguration(1, ["RSIMomentumEvaluator"], [commons_enums.TimeFrames.ONE_HOUR])
+    return protocol.get_job_descriptor(run_config, run_config.get_evaluators_config(STRATEGY_NAME), {})
+
+
+def test_find_optimal_configuration_with_distributed_workers():
+    port = _get_free_port()
+    with mock.patch.object(strategy_optimizer, "run_test_suite", mock.Mock(side_effect=_run_test_suite)), \
+         mock.patch.object(constants, "OPTIMIZER_DISTRIBUTED_CONNECTION_RETRY_DELAY", 0.05), \
+         mock.patch.object(builtins, "print", mock.Mock()):
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         STRATEGY_NAME)
+        workers = [_start_worker_thread(port, f"worker-{index}") for index in range(2)]
+        optimizer.find_optimal_configuration(risks=[0.5, 1], coordinator_address=f"{HOST}:{port}")
+        for worker in workers:
+            worker.join(5)
+            assert not worker.is_alive()
+
+        local_optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                               test_utils_config.load_test_tentacles_config(),
+                                                               STRATEGY_NAME)
+        local_optimizer.find_optimal_configuration(risks=[0.5, 1])
+    assert len(optimizer.run_results) == optimizer.total_nb_runs == 42
+    assert optimizer.run_configurations == local_optimizer.run_configurations
+    assert optimizer.get_report() == local_optimizer.get_report()
+
+
+def test_coordinator_requeues_lost_jobs():
+    coordinator = strategy_optimizer.OptimizerCoordinator(HOST, 0, STRATEGY_NAME)
+    coordinator.start()
+    worker = None
+    try:
+        future = coordinator.submit_job(_get_job_descriptor())
+        job = asyncio.run(_take_job_and_disconnect(coordinator.port))
+        assert job[protocol.TYPE] == protocol.JOB
+        assert not future.done()
+        with mock.patch.object(strategy_optimizer, "run_test_suite", mock.Mock(side_effect=_run_test_suite)):
+            worker = _start_worker_thread(coordinator.port, "worker")
+            test_suite_result, errors = future.result(5)
+        assert test_suite_result.risk == 1
+        assert test_suite_result.evaluators == ["RSIMomentumEvaluator", STRATEGY_NAME]
+        assert errors == set()
+    finally:
+        coordinator.stop()
+        if worker is not None:
+            worker.join(5)
+
+
+def test_coordinator_fails_jobs_after_max_attempts():
+    coordinator = strategy_optimizer.OptimizerCoordinator(HOST, 0, STRATEGY_NAME, heartbeat_timeout=0.1,
+                                                          max_job_attempts=1)
+    coordinator.start()
+    try:
+        future = coordinator.submit_job(_get_job_descriptor())
+        # the worker is ready but never sends any heartbeat
+        asyncio.run(_take_job_and_disconnect(coordinator.port, silence=1))
+        with pytest.raises(RuntimeError):
+            future.result(5)
+        assert coordinator.slots_count == 0
+    finally:
+        coordinator.stop()
@@ -0,0 +1,91 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import concurrent.futures
+import os
+import sys
+import time
+import pytest
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="processes can't be forked on Windows")
+
+_LOADED_DATA = {}
+
+
+def _get_loaded_data(key):
+    return os.getpid(), _LOADED_DATA.get(key)
+
+
+def _raise_error(message):
+    raise ValueError(message)
+
+
+def _exit_process():
+    os._exit(1)
+
+
+def _sleep(duration):
+    time.sleep(duration)
+    return duration
+
+
+def test_submit():
+    # data loaded before forking is available in forked processes
+    _LOADED_DATA["candles"] = [1, 2, 3]
+    try:
+        with strategy_optimizer.ForkServer(2) as fork_server:
+            futures = [fork_server.submit(_get_loaded_data, "candles") for _ in range(5)]
+            results = [future.result() for future in futures]
+        assert all(data == [1, 2, 3] for _, data in results)
+        # one process per call
+        assert len(set(pid for pid, _ in results)) == 5
+        assert os.getpid() not in set(pid for pid, _ in results)
+    finally:
+        _LOADED_DATA.clear()
+
+
+def test_submit_errors():
+    with strategy_optimizer.ForkServer(1) as fork_server:
+        error_future = fork_server.submit(_raise_error, "error")
+        exit_future = fork_server.submit(_exit_process)
+        future = fork_server.submit(_get_loaded_data, "candles")
+        with pytest.raises(ValueError, match="error"):
+            error_future.result()
+        with pytest.raises(RuntimeError):
+            exit_future.result()
+        assert future.result()[1] is None
+    with pytest.raises(RuntimeError):
+        strategy_optimizer.ForkServer(0)
+
+
+def test_result_timeout():
+    with strategy_optimizer.ForkServer(1) as fork_server:
+        future = fork_server.submit(_sleep, 0.5)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            future.result(timeout=0.05)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            future.exception(timeout=0.05)
+        assert not future.done()
+        assert future.result(timeout=10) == 0.5
+        assert future.exception(timeout=0) is None
+
+
+def test_shutdown():
+    fork_server = strategy_optimizer.ForkServer(1)
+    futures = [fork_server.submit(_get_loaded_data, "candles") for _ in range(3)]
+    fork_server.shutdown()
+    assert all(future.cancelled() for future in futures)
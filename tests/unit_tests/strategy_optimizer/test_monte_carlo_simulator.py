@@ -0,0 +1,56 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.monte_carlo_simulator as monte_carlo_simulator
+
+STRATEGY = "Strategy"
+
+
+def _result(run_config, score):
+    return strategy_optimizer.TestSuiteResult([(score, 0)], [1], run_config.risk, run_config.get_time_frames_config(),
+                                              list(run_config.evaluators) + [STRATEGY], STRATEGY)
+
+
+def test_get_market_path():
+    with pytest.raises(RuntimeError):
+        strategy_optimizer.MonteCarloSimulator(0)
+    market_path = strategy_optimizer.MonteCarloSimulator(10, block_size=4, seed=2).get_market_path(3)
+    assert market_path.to_dict() == {"index": 3, "paths_count": 10, "block_size": 4, "seed": 2}
+
+
+def test_get_report():
+    one_hour = commons_enums.TimeFrames.ONE_HOUR
+    stable_run_config = strategy_optimizer.RunConfiguration(1, ["TA1"], [one_hour])
+    risky_run_config = strategy_optimizer.RunConfiguration(1, ["TA2"], [one_hour])
+    simulator = strategy_optimizer.MonteCarloSimulator(5, percentiles=(0, 50, 100))
+    for score in range(5):
+        simulator.add_result(stable_run_config, _result(stable_run_config, 1))
+        simulator.add_result(risky_run_config, _result(risky_run_config, score * 4 - 6))
+    assert simulator.get_scores_distribution(stable_run_config) == {
+        monte_carlo_simulator.PATHS_COUNT: 5,
+        monte_carlo_simulator.MEAN: 1,
+        monte_carlo_simulator.STD: 0,
+        monte_carlo_simulator.PERCENTILES: {0: 1, 50: 1, 100: 1},
+    }
+    risky_distribution = simulator.get_scores_distribution(risky_run_config)
+    assert risky_distribution[monte_carlo_simulator.MEAN] == 2
+    assert risky_distribution[monte_carlo_simulator.PERCENTILES] == {0: -6, 50: 2, 100: 10}
+    assert [run_config for run_config, _ in simulator.get_report()] == [risky_run_config, stable_run_config]
+    assert "p50: 2.000000" in strategy_optimizer.get_distribution_string(risky_distribution)
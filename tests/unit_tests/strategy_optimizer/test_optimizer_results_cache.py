@@ -0,0 +1,79 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+
+def _create_data_file(folder, name, content):
+    data_file = os.path.join(folder, name)
+    with open(data_file, "wb") as file:
+        file.write(content)
+    return data_file
+
+
+def test_get_scenario_key(tmp_path):
+    cache = strategy_optimizer.OptimizerResultsCache(os.path.join(tmp_path, "cache"))
+    data_file_1 = _create_data_file(tmp_path, "1.data", b"data 1")
+    data_file_2 = _create_data_file(tmp_path, "2.data", b"data 2")
+    data_file_copy = _create_data_file(tmp_path, "copy.data", b"data 1")
+    fingerprint = cache.get_run_fingerprint(evaluators=["RSIMomentumEvaluator"], time_frames=["1h"], risk=1)
+    assert fingerprint == cache.get_run_fingerprint(risk=1, time_frames=["1h"], evaluators=["RSIMomentumEvaluator"])
+    assert fingerprint != cache.get_run_fingerprint(evaluators=["RSIMomentumEvaluator"], time_frames=["1h"],
+                                                    risk=0.5)
+    # keys are addressed by data files content
+    assert cache.get_scenario_key(fingerprint, data_file_1) == cache.get_scenario_key(fingerprint, data_file_copy)
+    assert cache.get_scenario_key(fingerprint, data_file_1) != cache.get_scenario_key(fingerprint, data_file_2)
+
+
+def test_get_and_set(tmp_path):
+    cache = strategy_optimizer.OptimizerResultsCache(os.path.join(tmp_path, "cache"))
+    assert cache.get("a1b2") is None
+    cache.set("a1b2", (10.5, -3), 12)
+    assert cache.get("a1b2") == ((10.5, -3), 12)
+    assert strategy_optimizer.OptimizerResultsCache(os.path.join(tmp_path, "cache")).get("a1b2") == ((10.5, -3), 12)
+    assert cache.hits_count == 1
+    assert cache.misses_count == 1
+    cache.clear()
+    assert cache.get("a1b2") is None
+    assert cache.get_size() == 0
+
+
+def test_eviction(tmp_path):
+    cache = strategy_optimizer.OptimizerResultsCache(os.path.join(tmp_path, "cache"))
+    cache.set("aa00", (1, 1), 1)
+    entry_size = cache.get_size()
+    cache.max_size = 3 * entry_size
+    for index, key in enumerate(("aa01", "bb02")):
+        cache.set(key, (1, 1), 1)
+        # ensure distinct modification times
+        os.utime(cache._get_entry_path(key), (index + 10, index + 10))
+    os.utime(cache._get_entry_path("aa00"), (1, 1))
+    # read entries are the most recently used ones
+    assert cache.get("aa01") is not None
+    cache.set("cc03", (1, 1), 1)
+    assert cache.get_size() <= cache.max_size
+    assert cache.get("aa00") is None
+    assert cache.get("aa01") is not None
+    assert cache.get("cc03") is not None
+
+
+def test_invalid_entry(tmp_path):
+    cache = strategy_optimizer.OptimizerResultsCache(os.path.join(tmp_path, "cache"))
+    cache.set("a1b2", (10.5, -3), 12)
+    with open(cache._get_entry_path("a1b2"), "w") as entry_file:
+        entry_file.write("{invalid")
+    assert cache.get("a1b2") is None
@@ -0,0 +1,91 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.enums as commons_enums
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+STRATEGY = "Strategy"
+EVALUATORS = ["RSI", "EMA", "ADX"]
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS]
+
+
+def _result(evaluators, risk, time_frames, score, trades_counts):
+    return strategy_optimizer.TestSuiteResult([(score, 0)], trades_counts, risk,
+                                              [time_frame.value for time_frame in time_frames],
+                                              evaluators + [STRATEGY], STRATEGY)
+
+
+def test_get_sorted_indexes():
+    table = strategy_optimizer.OptimizerResultsTable(EVALUATORS, TIME_FRAMES, initial_capacity=1)
+    table.add(_result(["RSI"], 1, [TIME_FRAMES[0]], 1, [1]))
+    table.add(_result(["EMA"], 1, [TIME_FRAMES[1]], 2, [1]))
+    table.add(_result(["EMA"], 1, TIME_FRAMES, 3, [1]))
+    table.add(_result(["ADX"], 1, [TIME_FRAMES[0]], 1, [1]))
+    assert len(table) == 4
+    assert table.get_score(2) == 3
+    assert list(table.get_sorted_indexes(TIME_FRAMES[0])) == [2, 0, 3]
+    assert list(table.get_sorted_indexes(TIME_FRAMES[1])) == [1]
+    # incomplete results are ranked after complete ones whatever their score
+    table.add(_result(["RSI", "EMA"], 1, [TIME_FRAMES[0]], 10, [1]), is_complete=False)
+    table.add(_result(["RSI", "ADX"], 1, [TIME_FRAMES[0]], 0, [1]))
+    assert list(table.get_sorted_indexes(TIME_FRAMES[0])) == [2, 0, 3, 5, 4]
+
+
+def test_get_ranking():
+    table = strategy_optimizer.OptimizerResultsTable(EVALUATORS, TIME_FRAMES)
+    indexes, ranks_sums, average_trades = table.get_ranking()
+    assert len(indexes) == len(ranks_sums) == len(average_trades) == 0
+
+    table.add(_result(["RSI"], 1, [TIME_FRAMES[0]], 1, [1, 3]))
+    table.add(_result(["RSI", "EMA"], 1, [TIME_FRAMES[0]], 2, [4]))
+    table.add(_result(["RSI"], 0.5, [TIME_FRAMES[0]], 0, [4]))
+    table.add(_result(["RSI"], 1, [TIME_FRAMES[1]], 1, [6]))
+    table.add(_result(["RSI", "EMA"], 1, [TIME_FRAMES[1]], 0, [6]))
+    indexes, ranks_sums, average_trades = table.get_ranking()
+    # RSI risk 1: 1 + 0, RSI EMA risk 1: 0 + 1, RSI risk 0.5: 2
+    assert list(indexes) == [1, 0, 2]
+    assert list(ranks_sums) == [1, 1, 2]
+    assert list(average_trades) == [5, 10 / 3, 4]
+
+
+def test_get_run_configuration():
+    table = strategy_optimizer.OptimizerResultsTable(EVALUATORS, TIME_FRAMES)
+    table.add(_result(["RSI", "ADX"], 0.5, TIME_FRAMES, 1, [1]))
+    table.add(_result(["EMA"], 1, [TIME_FRAMES[1]], 2, [1]))
+    assert table.get_run_configuration(0) == strategy_optimizer.RunConfiguration(0.5, ["ADX", "RSI"], TIME_FRAMES)
+    assert table.get_run_configuration(1) == strategy_optimizer.RunConfiguration(1, ["EMA"], [TIME_FRAMES[1]])
+
+
+def test_update():
+    table = strategy_optimizer.OptimizerResultsTable(EVALUATORS, TIME_FRAMES)
+    first_result = _result(["RSI"], 1, [TIME_FRAMES[0]], 1, [2])
+    first_result.data_files = ["file_1"]
+    table.add(first_result)
+    table.add(_result(["EMA"], 1, [TIME_FRAMES[0]], 2, [2]))
+    assert table.get_data_files(0) == {"file_1"}
+    assert table.get_data_files(1) == frozenset()
+    added_result = strategy_optimizer.TestSuiteResult([(4, 0), (7, 0)], [3, 1], 1, [TIME_FRAMES[0].value],
+                                                      ["RSI", STRATEGY], STRATEGY, data_files=["file_2", "file_3"])
+    table.update(0, added_result)
+    # average score of the 3 data files
+    assert table.get_score(0) == 4
+    assert table.get_data_files(0) == {"file_1", "file_2", "file_3"}
+    indexes, _, average_trades = table.get_ranking()
+    assert list(indexes) == [0, 1]
+    assert list(average_trades) == [2, 2]
+    first_result.merge(added_result)
+    assert first_result.get_average_score() == table.get_score(0)
+    assert first_result.data_files == ["file_1", "file_2", "file_3"]
@@ -0,0 +1,94 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy
+
+import octobot_commons.enums as commons_enums
+
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.pre_screening_backtester as pre_screening_backtester
+
+HOUR = 3600
+
+
+def _get_backtester(closes_by_time_frame):
+    backtester = strategy_optimizer.PreScreeningBacktester({}, [])
+    # candles are given instead of being read from data files
+    backtester._candles = [{
+        time_frame.value: ((numpy.arange(len(closes)) + 1) * HOUR * commons_enums.TimeFramesMinutes[time_frame] / 60,
+                           numpy.array(closes, dtype=numpy.float64))
+        for time_frame, closes in closes_by_time_frame.items()
+    }]
+    return backtester
+
+
+def test_get_moving_average():
+    averages = pre_screening_backtester.get_moving_average(numpy.array([1., 2., 3., 4.]), 2)
+    assert numpy.isnan(averages[0])
+    assert list(averages[1:]) == [1.5, 2.5, 3.5]
+    assert numpy.isnan(pre_screening_backtester.get_moving_average(numpy.array([1.]), 2)).all()
+
+
+def test_get_aligned_notes():
+    notes = pre_screening_backtester.get_aligned_notes(numpy.array([1., 2., 3., 4.]), numpy.array([2., 4.]),
+                                                       numpy.array([-1., 1.]))
+    assert numpy.isnan(notes[0])
+    assert list(notes[1:]) == [-1, -1, 1]
+
+
+def test_get_average_notes():
+    notes = pre_screening_backtester.get_average_notes([numpy.array([numpy.nan, numpy.nan, 1.]),
+                                                        numpy.array([numpy.nan, -1., 0.])])
+    assert numpy.isnan(notes[0])
+    assert list(notes[1:]) == [-1, 0.5]
+
+
+def test_get_approximate_profitabilities():
+    closes = numpy.array([100., 100., 200., 100.])
+    # bought at the second close and sold at the third one
+    bot_profitability, market_profitability = pre_screening_backtester.get_approximate_profitabilities(
+        closes, numpy.array([0, -1, 1, 0]), 1, 0, 0.5)
+    assert bot_profitability == 100
+    assert market_profitability == 0
+    bot_profitability, _ = pre_screening_backtester.get_approximate_profitabilities(
+        closes, numpy.array([0, -1, 1, 0]), 0.5, 0.01, 0.5)
+    assert bot_profitability == (1.5 * 0.995 * 0.995 - 1) * 100
+    assert pre_screening_backtester.get_approximate_profitabilities(closes, numpy.zeros(4), 1, 0.01, 0.5) == (0, 0)
+
+
+def test_select():
+    closes = [100 + (10 if index % 6 < 3 else -10) * (index % 3) for index in range(200)]
+    backtester = _get_backtester({commons_enums.TimeFrames.ONE_HOUR: closes})
+    run_configs = [
+        strategy_optimizer.RunConfiguration(1, (evaluator,), (commons_enums.TimeFrames.ONE_HOUR,))
+        for evaluator in ("RSIMomentumEvaluator", "BBMomentumEvaluator", "DoubleMovingAverageTrendEvaluator",
+                          "UnknownEvaluator")
+    ]
+    # missing time frame
+    assert backtester.get_score(strategy_optimizer.RunConfiguration(1, ("RSIMomentumEvaluator",),
+                                                                    (commons_enums.TimeFrames.ONE_DAY,))) is None
+    assert backtester.get_score(run_configs[-1]) is None
+    # partially approximated strategies can't be compared
+    assert backtester.get_score(strategy_optimizer.RunConfiguration(1, ("RSIMomentumEvaluator", "UnknownEvaluator"),
+                                                                    (commons_enums.TimeFrames.ONE_HOUR,))) is None
+    scores = {run_config: backtester.get_score(run_config) for run_config in run_configs[:-1]}
+    selected_run_configs, rejected_scores = backtester.select(run_configs, 0.5)
+    # best approximated configurations and unknown ones are selected, in the given order
+    best_run_configs = sorted(scores, key=scores.__getitem__, reverse=True)[:2]
+    assert selected_run_configs == [run_config for run_config in run_configs
+                                    if run_config in best_run_configs or run_config is run_configs[-1]]
+    assert rejected_scores == {run_config: score for run_config, score in scores.items()
+                               if run_config not in best_run_configs}
+    assert backtester.select(run_configs, 1) == (run_configs, {})
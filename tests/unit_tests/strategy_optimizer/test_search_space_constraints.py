@@ -0,0 +1,104 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+EVALUATORS = ["RSIMomentumEvaluator", "DoubleMovingAverageTrendEvaluator", "BBMomentumEvaluator",
+              "ADXMomentumEvaluator", "MACDMomentumEvaluator"]
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS,
+               commons_enums.TimeFrames.ONE_DAY]
+
+
+@pytest.fixture
+def constraints():
+    return strategy_optimizer.SearchSpaceConstraints(
+        min_evaluators=2, max_evaluators=3,
+        required_time_frames=[commons_enums.TimeFrames.FOUR_HOURS],
+        forbidden_time_frames=["1d"],
+        exclusive_evaluators=[["RSIMomentumEvaluator", "BBMomentumEvaluator", "MACDMomentumEvaluator"]]
+    )
+
+
+def test_init():
+    with pytest.raises(RuntimeError):
+        strategy_optimizer.SearchSpaceConstraints(required_time_frames=["1h"], forbidden_time_frames=["1h"])
+    with pytest.raises(RuntimeError):
+        strategy_optimizer.SearchSpaceConstraints(exclusive_evaluators=[["a", "b"], ["b", "c"]])
+
+
+def test_dict(constraints):
+    assert strategy_optimizer.SearchSpaceConstraints.from_dict(constraints.to_dict()).to_dict() == \
+        constraints.to_dict()
+    assert strategy_optimizer.SearchSpaceConstraints.from_dict({}).to_dict() == \
+        strategy_optimizer.SearchSpaceConstraints().to_dict()
+
+
+def test_is_valid(constraints):
+    assert constraints.is_valid(strategy_optimizer.RunConfiguration(
+        1, ("RSIMomentumEvaluator", "ADXMomentumEvaluator"), (commons_enums.TimeFrames.FOUR_HOURS,)))
+    # too few evaluators
+    assert not constraints.is_valid_evaluators(("RSIMomentumEvaluator",))
+    # exclusive evaluators
+    assert not constraints.is_valid_evaluators(("RSIMomentumEvaluator", "BBMomentumEvaluator"))
+    # missing required time frame
+    assert not constraints.is_valid_time_frames((commons_enums.TimeFrames.ONE_HOUR,))
+    # forbidden time frame
+    assert not constraints.is_valid_time_frames((commons_enums.TimeFrames.FOUR_HOURS,
+                                                 commons_enums.TimeFrames.ONE_DAY))
+
+
+def test_check_search_space(constraints):
+    constraints.check_search_space(TIME_FRAMES)
+    with pytest.raises(RuntimeError):
+        constraints.check_search_space([commons_enums.TimeFrames.ONE_HOUR])
+
+
+def test_counts_match_enumeration(constraints):
+    for tested_constraints in (constraints, strategy_optimizer.SearchSpaceConstraints()):
+        evaluators_subsets = list(tested_constraints.iterate_evaluators_subsets(EVALUATORS))
+        assert len(evaluators_subsets) == tested_constraints.get_evaluators_subsets_count(EVALUATORS)
+        assert evaluators_subsets == [subset for subset in strategy_optimizer.iterate_subsets(EVALUATORS)
+                                      if tested_constraints.is_valid_evaluators(subset)]
+        time_frames_subsets = list(tested_constraints.iterate_time_frames_subsets(TIME_FRAMES))
+        assert len(time_frames_subsets) == tested_constraints.get_time_frames_subsets_count(TIME_FRAMES)
+    run_configs = list(strategy_optimizer.iterate_run_configurations([0.5, 1], EVALUATORS, TIME_FRAMES,
+                                                                     constraints=constraints))
+    assert len(run_configs) == strategy_optimizer.get_run_configurations_count([0.5, 1], EVALUATORS, TIME_FRAMES,
+                                                                               constraints=constraints)
+    assert run_configs and all(constraints.is_valid(run_config) for run_config in run_configs)
+    # without constraints, every configuration is valid
+    assert strategy_optimizer.get_run_configurations_count(
+        [1], EVALUATORS, TIME_FRAMES, constraints=strategy_optimizer.SearchSpaceConstraints()) == \
+        strategy_optimizer.get_run_configurations_count([1], EVALUATORS, TIME_FRAMES)
+
+
+def test_random_subsets(constraints):
+    rand = random.Random(1)
+    valid_subsets = set(constraints.iterate_evaluators_subsets(EVALUATORS))
+    sampled_subsets = [constraints.get_random_evaluators(EVALUATORS, rand) for _ in range(2000)]
+    assert set(sampled_subsets) == valid_subsets
+    # subsets are uniformly sampled
+    assert min(sampled_subsets.count(subset) for subset in valid_subsets) > 2000 / len(valid_subsets) / 2
+    assert all(constraints.is_valid_time_frames(constraints.get_random_time_frames(TIME_FRAMES, rand))
+               for _ in range(100))
+    assert strategy_optimizer.SearchSpaceConstraints(min_evaluators=6).get_random_evaluators(EVALUATORS, rand) \
+        is None
+    assert constraints.get_random_time_frames([commons_enums.TimeFrames.ONE_HOUR], rand) is None
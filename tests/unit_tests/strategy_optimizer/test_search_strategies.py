@@ -0,0 +1,153 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.search_strategies as search_strategies
+
+RISKS = [0.5, 1]
+EVALUATORS = ["RSIMomentumEvaluator", "DoubleMovingAverageTrendEvaluator", "BBMomentumEvaluator",
+              "ADXMomentumEvaluator", "MACDMomentumEvaluator"]
+TIME_FRAMES = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.FOUR_HOURS,
+               commons_enums.TimeFrames.ONE_DAY]
+BEST_EVALUATORS = {"RSIMomentumEvaluator", "ADXMomentumEvaluator"}
+
+
+def _score(run_config):
+    return - len(set(run_config.evaluators) ^ BEST_EVALUATORS) \
+        - len(set(run_config.time_frames) ^ {commons_enums.TimeFrames.FOUR_HOURS}) \
+        - abs(run_config.risk - 0.5)
+
+
+def _run_search(search_strategy, pending_runs_count=1):
+    run_configs = []
+    pending_run_configs = []
+    while True:
+        while len(pending_run_configs) < pending_runs_count:
+            run_config = search_strategy.suggest_run_configuration()
+            if run_config is None:
+                break
+            pending_run_configs.append(run_config)
+        if not pending_run_configs:
+            return run_configs
+        run_config = pending_run_configs.pop(0)
+        run_configs.append(run_config)
+        search_strategy.register_result(run_config, _score(run_config))
+
+
+def test_exhaustive_search_strategy():
+    search_strategy = search_strategies.ExhaustiveSearchStrategy(RISKS, EVALUATORS, TIME_FRAMES)
+    assert _run_search(search_strategy) == \
+        list(strategy_optimizer.iterate_run_configurations(RISKS, EVALUATORS, TIME_FRAMES))
+    search_strategy = search_strategies.ExhaustiveSearchStrategy(RISKS, EVALUATORS, TIME_FRAMES, budget=10)
+    assert _run_search(search_strategy) == \
+        list(strategy_optimizer.iterate_run_configurations(RISKS, EVALUATORS, TIME_FRAMES))[:10]
+
+
+@pytest.mark.parametrize("search_strategy_class", [search_strategies.RandomSearchStrategy,
+                                                   search_strategies.TPESearchStrategy,
+                                                   search_strategies.GeneticSearchStrategy])
+def test_search_strategies_respect_budget(search_strategy_class):
+    for pending_runs_count in (1, 4):
+        search_strategy = search_strategy_class(RISKS, EVALUATORS, TIME_FRAMES, budget=50, seed=1)
+        run_configs = _run_search(search_strategy, pending_runs_count)
+        assert len(run_configs) == search_strategy.max_runs_count == 50
+        # each configuration is run at most once
+        assert len(set(run_configs)) == len(run_configs)
+
+
+@pytest.mark.parametrize("search_strategy_class", [search_strategies.RandomSearchStrategy,
+                                                   search_strategies.TPESearchStrategy,
+                                                   search_strategies.GeneticSearchStrategy])
+def test_search_strategies_cover_small_search_space(search_strategy_class):
+    search_strategy = search_strategy_class(RISKS, EVALUATORS[:2], TIME_FRAMES[:2], seed=1)
+    run_configs = _run_search(search_strategy)
+    assert set(run_configs) == set(strategy_optimizer.iterate_run_configurations(RISKS, EVALUATORS[:2],
+                                                                                 TIME_FRAMES[:2]))
+
+
+@pytest.mark.parametrize("search_strategy_class", [search_strategies.TPESearchStrategy,
+                                                   search_strategies.GeneticSearchStrategy])
+def test_model_based_search_strategies_find_best_configuration(search_strategy_class):
+    search_strategy = search_strategy_class(RISKS, EVALUATORS, TIME_FRAMES, budget=150, seed=1)
+    run_configs = _run_search(search_strategy)
+    assert max(_score(run_config) for run_config in run_configs) == 0
+
+
+def test_get_search_strategy_class():
+    assert search_strategies.get_search_strategy_class("GeneticSearchStrategy") is \
+        search_strategies.GeneticSearchStrategy
+    assert search_strategies.get_search_strategy_class("GeneticSearch") is None
+    assert "TPESearchStrategy" in search_strategies.get_search_strategy_names()
+
+
+@pytest.mark.parametrize("search_strategy_class", [search_strategies.ExhaustiveSearchStrategy,
+                                                   search_strategies.RandomSearchStrategy,
+                                                   search_strategies.TPESearchStrategy,
+                                                   search_strategies.GeneticSearchStrategy])
+def test_restore_result(search_strategy_class):
+    run_configs = _run_search(search_strategy_class(RISKS, EVALUATORS, TIME_FRAMES, budget=30, seed=1))
+    search_strategy = search_strategy_class(RISKS, EVALUATORS, TIME_FRAMES, budget=30, seed=2)
+    for run_config in run_configs[:20]:
+        search_strategy.restore_result(run_config, _score(run_config))
+    remaining_run_configs = _run_search(search_strategy)
+    assert len(remaining_run_configs) == 10
+    assert not set(remaining_run_configs).intersection(run_configs[:20])
+
+
+@pytest.mark.parametrize("search_strategy_class", [search_strategies.ExhaustiveSearchStrategy,
+                                                   search_strategies.RandomSearchStrategy,
+                                                   search_strategies.TPESearchStrategy,
+                                                   search_strategies.GeneticSearchStrategy])
+def test_register_approximate_result(search_strategy_class):
+    search_strategy = search_strategy_class(RISKS, EVALUATORS, TIME_FRAMES, budget=60, seed=1)
+    run_configs = []
+    run_config = search_strategy.suggest_run_configuration()
+    while run_config is not None:
+        run_configs.append(run_config)
+        # every other configuration is pre-screened out
+        if len(run_configs) % 2:
+            search_strategy.register_approximate_result(run_config, -100)
+        else:
+            search_strategy.register_result(run_config, _score(run_config))
+        run_config = search_strategy.suggest_run_configuration()
+    assert len(run_configs) == 60
+    assert all(score != -100 for score in search_strategy.scores.values())
+    assert len(search_strategy.approximate_scores) == 30
+    assert all(search_strategy.is_evaluated(run_config) for run_config in run_configs)
+
+
+@pytest.mark.parametrize("search_strategy_class", [search_strategies.ExhaustiveSearchStrategy,
+                                                   search_strategies.RandomSearchStrategy,
+                                                   search_strategies.TPESearchStrategy,
+                                                   search_strategies.GeneticSearchStrategy])
+def test_search_strategies_respect_constraints(search_strategy_class):
+    constraints = strategy_optimizer.SearchSpaceConstraints(
+        max_evaluators=2, required_time_frames=[commons_enums.TimeFrames.FOUR_HOURS],
+        exclusive_evaluators=[["RSIMomentumEvaluator", "ADXMomentumEvaluator"]]
+    )
+    search_strategy = search_strategy_class(RISKS, EVALUATORS, TIME_FRAMES, seed=1, constraints=constraints)
+    run_configs = _run_search(search_strategy)
+    assert set(run_configs) == set(strategy_optimizer.iterate_run_configurations(RISKS, EVALUATORS, TIME_FRAMES,
+                                                                                 constraints=constraints))
+    assert len(run_configs) == search_strategy.max_runs_count
+    search_strategy = search_strategy_class(RISKS, EVALUATORS, TIME_FRAMES, budget=10, seed=1,
+                                            constraints=constraints)
+    run_configs = _run_search(search_strategy)
+    assert len(run_configs) == 10
+    assert all(constraints.is_valid(run_config) for run_config in run_configs)
@@ -13,12 +13,22 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import os
+import sys
 import mock
+import concurrent.futures
 import builtins
+import pytest
 
 import tests.test_utils.config as test_utils_config
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as common_logging
 import octobot_commons.tests.test_config as test_config
+import octobot_evaluators.constants as evaluator_constants
 import tentacles.Evaluator.Strategies as tentacles_strategies
+import octobot.backtesting as octobot_backtesting
+import octobot.constants as constants
 import octobot.strategy_optimizer as strategy_optimizer
 
 
@@ -33,18 +43,447 @@ class StrategyTestSuiteMock(mock.Mock):
         return strategy_optimizer.TestSuiteResult([(1, 0), (0, -1)], [1, 2], 1, ["tf1", "tf2"], [strategy_name], strategy_name)
 
 
+def _run_traders_test_suites(run_test_suite):
+    """
+    :return: a run_test_suite side effect running each trader risk of multi-trader runs as its own test suite
+    """
+    def _run_test_suites(config, *args, traders_risks=None, **kwargs):
+        if traders_risks is None:
+            return run_test_suite(config, *args, **kwargs)
+        traders_results = [
+            run_test_suite(octobot_backtesting.ConfigurationOverlay(
+                config, {(commons_constants.CONFIG_TRADING, commons_constants.CONFIG_TRADER_RISK): risk}
+            ), *args, **kwargs)
+            for risk in traders_risks
+        ]
+        return [result for result, _ in traders_results], set().union(*(errors for _, errors in traders_results))
+    return _run_test_suites
+
+
+def _get_progress_logs(logger_mock):
+    return [call.args[0] for call in logger_mock.info.call_args_list
+            if "Run with" in call.args[0] or " => Result" in call.args[0]]
+
+
 def test_find_optimal_configuration():
+    logger_mock = mock.Mock()
     with mock.patch.object(strategy_optimizer, "StrategyTestSuite", StrategyTestSuiteMock()) as test_suite_mock, \
          mock.patch.object(builtins, "print", mock.Mock()) as print_mock:
         strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
-        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
-                                                         test_utils_config.load_test_tentacles_config(),
-                                                         strategy_name)
+        with mock.patch.object(common_logging, "get_logger", mock.Mock(return_value=logger_mock)):
+            optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                             test_utils_config.load_test_tentacles_config(),
+                                                             strategy_name)
         optimizer.find_optimal_configuration()
         assert optimizer.total_nb_runs == 21
         assert test_suite_mock.call_count == optimizer.total_nb_runs
-        assert print_mock.call_count == optimizer.total_nb_runs * 2
+        # progress is logged, not printed
+        print_mock.assert_not_called()
+        progress_logs = _get_progress_logs(logger_mock)
+        assert len(progress_logs) == optimizer.total_nb_runs * 2
         # check each call has been different
-        # iterate over each second print call to check run config (each strategy optimizer run prints twice)
-        for call in print_mock.call_args_list[::2]:
-            assert len([c for c in print_mock.call_args_list if c == call]) == 1
+        # iterate over each second log to check run config (each strategy optimizer run logs twice)
+        for log in progress_logs[::2]:
+            assert progress_logs.count(log) == 1
+
+
+class ThreadPoolExecutorMock(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self, max_workers=None, mp_context=None, initializer=None, initargs=()):
+        super().__init__(max_workers=max_workers)
+
+
+def test_find_optimal_configuration_with_workers():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    logger_mock = mock.Mock()
+    with mock.patch.object(concurrent.futures, "ProcessPoolExecutor", ThreadPoolExecutorMock), \
+         mock.patch.object(strategy_optimizer, "run_test_suite",
+                           mock.Mock(return_value=(StrategyTestSuiteMock().get_test_suite_result(), {"error"}))) \
+            as run_test_suite_mock:
+        with mock.patch.object(common_logging, "get_logger", mock.Mock(return_value=logger_mock)):
+            optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                             test_utils_config.load_test_tentacles_config(),
+                                                             strategy_name)
+        optimizer.find_optimal_configuration(workers=4)
+        assert optimizer.total_nb_runs == 21
+        assert run_test_suite_mock.call_count == optimizer.total_nb_runs
+        assert len(optimizer.run_results) == optimizer.total_nb_runs
+        assert optimizer.errors == {"error"}
+        assert len(_get_progress_logs(logger_mock)) == optimizer.total_nb_runs * 2
+        # each worker received its own copy of the configuration
+        assert len(set(id(call.args[0]) for call in run_test_suite_mock.call_args_list)) == optimizer.total_nb_runs
+
+
+def test_find_optimal_configuration_with_search_strategy():
+    with mock.patch.object(strategy_optimizer, "StrategyTestSuite", StrategyTestSuiteMock()) as test_suite_mock, \
+         mock.patch.object(builtins, "print", mock.Mock()):
+        strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        optimizer.find_optimal_configuration(search_strategy="RandomSearchStrategy", budget=5)
+        assert optimizer.total_nb_runs == 5
+        assert test_suite_mock.call_count == 5
+        assert len(optimizer.run_results) == 5
+        assert len(optimizer.search_strategy.scores) == 5
+        with pytest.raises(RuntimeError):
+            optimizer.find_optimal_configuration(search_strategy="UnknownSearchStrategy")
+
+
+def test_find_optimal_configuration_max_kept_results(tmp_path):
+    checkpoint_file = os.path.join(tmp_path, "optimizer.checkpoint")
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    run_results = []
+
+    def _run_test_suite(config, _, __, evaluators, **___):
+        score = len(run_results)
+        run_results.append(strategy_optimizer.TestSuiteResult(
+            [(score, 0)], [1], config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK],
+            config[evaluator_constants.CONFIG_FORCED_TIME_FRAME], list(evaluators), strategy_name))
+        return run_results[-1], {f"error {score}"}
+
+    with mock.patch.object(builtins, "print", mock.Mock()), \
+         mock.patch.object(strategy_optimizer, "run_test_suite", mock.Mock(side_effect=_run_test_suite)) \
+            as run_test_suite_mock:
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        optimizer.find_optimal_configuration(max_kept_results=3, checkpoint_file=checkpoint_file)
+        assert run_test_suite_mock.call_args.kwargs["release_memory"] is True
+        assert len(optimizer.results_table) == optimizer.total_nb_runs == 21
+        # only the best results are kept
+        assert optimizer.run_results == run_results[-3:]
+        assert len(optimizer.run_configurations) == len(optimizer.result_rows) == 3
+        # every evaluators configuration is ranked, including the ones which results were not kept
+        assert len(optimizer.sorted_results_through_all_time_frame) == \
+            strategy_optimizer.get_subsets_count(optimizer.all_TAs)
+
+        resumed_optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                                 test_utils_config.load_test_tentacles_config(),
+                                                                 strategy_name)
+        resumed_optimizer.find_optimal_configuration(max_kept_results=3, checkpoint_file=checkpoint_file,
+                                                     resume=True)
+        # every run has been restored from the checkpoint, including the ones which full result was not kept
+        assert run_test_suite_mock.call_count == optimizer.total_nb_runs
+        assert len(resumed_optimizer.results_table) == optimizer.total_nb_runs
+        assert resumed_optimizer.run_configurations == optimizer.run_configurations
+        assert resumed_optimizer.errors == optimizer.errors
+
+
+def test_find_optimal_configuration_resume(tmp_path):
+    checkpoint_file = os.path.join(tmp_path, "optimizer.checkpoint")
+    run_result = StrategyTestSuiteMock().get_test_suite_result()
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    with mock.patch.object(builtins, "print", mock.Mock()):
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        # interrupted after 10 runs
+        with mock.patch.object(strategy_optimizer, "run_test_suite",
+                               mock.Mock(side_effect=[(run_result, {"error"})] * 10 + [RuntimeError()])):
+            with pytest.raises(RuntimeError):
+                optimizer.find_optimal_configuration(checkpoint_file=checkpoint_file)
+        assert os.path.isfile(checkpoint_file)
+        assert len(optimizer.run_results) == 10
+
+        with mock.patch.object(strategy_optimizer, "run_test_suite",
+                               mock.Mock(return_value=(run_result, set()))) as run_test_suite_mock:
+            optimizer.find_optimal_configuration(checkpoint_file=checkpoint_file, resume=True)
+            assert run_test_suite_mock.call_count == optimizer.total_nb_runs - 10
+        assert len(optimizer.run_results) == optimizer.total_nb_runs
+        assert set(optimizer.run_configurations) == \
+            set(strategy_optimizer.iterate_run_configurations(optimizer.risks, optimizer.all_TAs,
+                                                              optimizer.all_time_frames))
+        assert optimizer.errors == {"error"}
+        assert optimizer.run_id == optimizer.total_nb_runs + 1
+
+        # a checkpoint can't be used on another search space and is kept as is
+        with open(checkpoint_file, "rb") as file:
+            checkpoint_content = file.read()
+        with pytest.raises(RuntimeError):
+            optimizer.find_optimal_configuration(risks=[0.5], checkpoint_file=checkpoint_file, resume=True)
+        with open(checkpoint_file, "rb") as file:
+            assert file.read() == checkpoint_content
+
+
+class PreScreeningBacktesterMock:
+    def __init__(self, *_, **__):
+        pass
+
+    def select(self, run_configs, ratio):
+        # reject configurations using a risk of 0.5
+        return [run_config for run_config in run_configs if run_config.risk != 0.5], \
+            {run_config: -1 for run_config in run_configs if run_config.risk == 0.5}
+
+
+def test_find_optimal_configuration_resume_pre_screened(tmp_path):
+    checkpoint_file = os.path.join(tmp_path, "optimizer.checkpoint")
+    run_result = StrategyTestSuiteMock().get_test_suite_result()
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    with mock.patch.object(builtins, "print", mock.Mock()), \
+         mock.patch.object(strategy_optimizer, "PreScreeningBacktester", PreScreeningBacktesterMock):
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        # interrupted after 5 runs
+        with mock.patch.object(strategy_optimizer, "run_test_suite",
+                               mock.Mock(side_effect=[(run_result, set())] * 5 + [RuntimeError()])):
+            with pytest.raises(RuntimeError):
+                optimizer.find_optimal_configuration(risks=[0.5, 1], checkpoint_file=checkpoint_file,
+                                                     pre_screening_ratio=0.5)
+        assert optimizer.pre_screened_out_runs_count > 0
+
+        with mock.patch.object(strategy_optimizer, "run_test_suite",
+                               mock.Mock(return_value=(run_result, set()))) as run_test_suite_mock:
+            optimizer.find_optimal_configuration(risks=[0.5, 1], checkpoint_file=checkpoint_file, resume=True,
+                                                 pre_screening_ratio=0.5)
+            assert run_test_suite_mock.call_count == optimizer.total_nb_runs - 5
+        assert len(optimizer.run_results) == optimizer.total_nb_runs
+        assert all(run_config.risk == 1 for run_config in optimizer.run_configurations)
+
+
+def test_find_optimal_configuration_resume_with_new_data_files(tmp_path):
+    checkpoint_file = os.path.join(tmp_path, "optimizer.checkpoint")
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    scores = {"file_1": 2, "file_2": 4}
+    scenarios_data_files = [["file_1"]]
+
+    def _run_test_suite(config, _, __, evaluators, skipped_data_files=None, **___):
+        data_files = [data_file
+                      for data_files in scenarios_data_files
+                      for data_file in data_files
+                      if data_file not in (skipped_data_files or [])]
+        return strategy_optimizer.TestSuiteResult(
+            [(scores[data_file], 0) for data_file in data_files], [1] * len(data_files),
+            config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK],
+            config[evaluator_constants.CONFIG_FORCED_TIME_FRAME], list(evaluators), strategy_name,
+            data_files=data_files), set()
+
+    with mock.patch.object(builtins, "print", mock.Mock()), \
+         mock.patch.object(strategy_optimizer, "get_scenarios_data_files",
+                           mock.Mock(return_value=scenarios_data_files)), \
+         mock.patch.object(strategy_optimizer, "run_test_suite", mock.Mock(side_effect=_run_test_suite)) \
+            as run_test_suite_mock:
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        optimizer.find_optimal_configuration(checkpoint_file=checkpoint_file)
+        assert run_test_suite_mock.call_count == optimizer.total_nb_runs
+        assert all(result.get_average_score() == 2 for result in optimizer.run_results)
+
+        # a data file is added: only run it on each restored configuration
+        scenarios_data_files.append(["file_2"])
+        run_test_suite_mock.reset_mock()
+        optimizer.find_optimal_configuration(checkpoint_file=checkpoint_file, resume=True)
+        assert run_test_suite_mock.call_count == optimizer.total_nb_runs
+        assert all(call.kwargs["skipped_data_files"] == ["file_1"] for call in run_test_suite_mock.call_args_list)
+        assert len(optimizer.results_table) == len(optimizer.run_results) == optimizer.total_nb_runs
+        assert all(optimizer.results_table.get_score(row) == 3 for row in range(len(optimizer.results_table)))
+        assert all(result.data_files == ["file_1", "file_2"] and result.get_average_score() == 3
+                   for result in optimizer.run_results)
+        assert all(score == 3 for score in optimizer.search_strategy.scores.values())
+
+        # every configuration already ran every data file
+        run_test_suite_mock.reset_mock()
+        optimizer.find_optimal_configuration(checkpoint_file=checkpoint_file, resume=True)
+        assert run_test_suite_mock.call_count == 0
+
+
+def test_find_optimal_configuration_run_result_listener():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+
+    def _run_test_suite(config, tentacles_setup_config, strategy_class, evaluators, **_):
+        risk = config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK]
+        time_frames = [commons_enums.TimeFrames(time_frame)
+                       for time_frame in config[evaluator_constants.CONFIG_FORCED_TIME_FRAME]]
+        return strategy_optimizer.TestSuiteResult([(risk * len(evaluators), 0)], [1], risk, time_frames,
+                                                  list(evaluators), strategy_name), set()
+
+    run_updates = []
+    with mock.patch.object(strategy_optimizer, "run_test_suite",
+                           mock.Mock(side_effect=_run_traders_test_suites(_run_test_suite))), \
+         mock.patch.object(builtins, "print", mock.Mock()):
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        optimizer.add_run_result_listener(run_updates.append)
+        # reports are read during the computation
+        reports = []
+        optimizer.add_run_result_listener(lambda run_update: reports.append(optimizer.get_report()))
+        optimizer.find_optimal_configuration(risks=[0.5, 1])
+    # last update notifies the end of the computation
+    assert run_updates[-1] is None
+    assert [run_update.run_id for run_update in run_updates[:-1]] == list(range(1, optimizer.total_nb_runs + 1))
+    assert all(run_update.total_runs == optimizer.total_nb_runs for run_update in run_updates[:-1])
+    assert optimizer.last_run_update is run_updates[-2]
+    assert optimizer.last_run_update.get_update_dict()["run_id"] == optimizer.total_nb_runs
+
+    # incrementally sorted results are equivalent to sorting every result
+    for time_frame, results in optimizer.sorted_results_by_time_frame.items():
+        assert results == optimizer._get_sorted_results(optimizer.run_results, commons_enums.TimeFrames(time_frame))
+    report = optimizer.get_report()
+    assert report
+    assert report[0]["risk"] == 1
+    # each run result is in the following report
+    assert len(reports[0]) == 1
+    assert [len(run_report) for run_report in reports] == sorted(len(run_report) for run_report in reports)
+    assert reports[-1] == report
+    # get_report only reads the report updated with each run result
+    with mock.patch.object(optimizer.results_table, "get_ranking", mock.Mock(side_effect=RuntimeError)):
+        assert optimizer.get_report() == report
+
+
+def test_find_optimal_configuration_grouped_risks():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+
+    def _run_test_suite(config, tentacles_setup_config, strategy_class, evaluators, **_):
+        risk = config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK]
+        return strategy_optimizer.TestSuiteResult([(risk * len(evaluators), 0)], [1], risk,
+                                                  config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+                                                  list(evaluators), strategy_name), set()
+
+    with mock.patch.object(strategy_optimizer, "run_test_suite",
+                           mock.Mock(side_effect=_run_traders_test_suites(_run_test_suite))) as run_test_suite_mock, \
+         mock.patch.object(builtins, "print", mock.Mock()):
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        optimizer.find_optimal_configuration(risks=[0.5, 1])
+        # each backtesting runs one trader per risk on the same evaluations
+        assert run_test_suite_mock.call_count == optimizer.total_nb_runs // 2
+        assert all(call.kwargs["traders_risks"] == [0.5, 1] for call in run_test_suite_mock.call_args_list)
+    assert len(optimizer.run_results) == optimizer.total_nb_runs == 42
+    assert set(optimizer.run_configurations) == \
+        set(strategy_optimizer.iterate_run_configurations(optimizer.risks, optimizer.all_TAs,
+                                                          optimizer.all_time_frames))
+    # each configuration is registered with the results of its own trader
+    for run_config, run_result in zip(optimizer.run_configurations, optimizer.run_results):
+        assert run_result.risk == run_config.risk
+        assert set(run_result.get_evaluators_without_strategy()) == set(run_config.evaluators)
+        assert run_result.run_profitabilities == [(run_config.risk * len(run_result.evaluators), 0)]
+    assert optimizer.get_report()[0]["risk"] == 1
+
+    with mock.patch.object(strategy_optimizer, "run_test_suite",
+                           mock.Mock(side_effect=_run_traders_test_suites(_run_test_suite))) as run_test_suite_mock, \
+         mock.patch.object(builtins, "print", mock.Mock()):
+        optimizer.find_optimal_configuration(risks=[0.5, 1], search_strategy="RandomSearchStrategy", budget=10)
+        # other search strategies don't suggest the risks of evaluators and time frames in a row
+        assert run_test_suite_mock.call_count == optimizer.total_nb_runs == 10
+        assert all(call.kwargs.get("traders_risks") is None for call in run_test_suite_mock.call_args_list)
+
+
+def test_find_optimal_configuration_racing():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+
+    def _run_test_suite(config, tentacles_setup_config, strategy_class, evaluators, scenarios=None, **_):
+        risk = config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK]
+        profitabilities = [(risk * len(evaluators) + scenario / 10, 0) for scenario in (scenarios or range(6))]
+        return strategy_optimizer.TestSuiteResult(profitabilities, [1] * len(profitabilities), risk,
+                                                  config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+                                                  list(evaluators), strategy_name), set()
+
+    with mock.patch.object(builtins, "print", mock.Mock()):
+        with mock.patch.object(strategy_optimizer, "run_test_suite",
+                               mock.Mock(side_effect=_run_test_suite)) as run_test_suite_mock:
+            optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                             test_utils_config.load_test_tentacles_config(),
+                                                             strategy_name)
+            optimizer.find_optimal_configuration(risks=[0.5, 1], racing=True)
+            # each call runs a single scenario
+            assert all(len(call.kwargs["scenarios"]) == 1 for call in run_test_suite_mock.call_args_list)
+            assert run_test_suite_mock.call_count < optimizer.total_nb_runs * 6
+        assert len(optimizer.run_results) == optimizer.total_nb_runs
+        assert set(optimizer.run_configurations) == \
+            set(strategy_optimizer.iterate_run_configurations(optimizer.risks, optimizer.all_TAs,
+                                                              optimizer.all_time_frames))
+
+        with mock.patch.object(strategy_optimizer, "run_test_suite",
+                               mock.Mock(side_effect=_run_traders_test_suites(_run_test_suite))):
+            full_optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                                  test_utils_config.load_test_tentacles_config(),
+                                                                  strategy_name)
+            full_optimizer.find_optimal_configuration(risks=[0.5, 1])
+    # the best configurations are run on every scenario
+    assert optimizer.get_report()[0] == full_optimizer.get_report()[0]
+    assert len(optimizer.sorted_results_through_all_time_frame[0][0].evaluators) == len(optimizer.all_TAs)
+
+
+def test_find_optimal_configuration_racing_misleading_scenarios():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    evaluators_weights = {"EvaluatorA": 1, "EvaluatorB": 2}
+
+    def _run_test_suite(config, tentacles_setup_config, strategy_class, evaluators, scenarios=None, **_):
+        risk = config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK]
+        score = sum(evaluators_weights.get(evaluator, 0) for evaluator in evaluators) + risk / 10
+        # first scenarios are easy for every configuration: partial scores are higher than complete ones
+        profitabilities = [(score if scenario < 3 else score - 100, 0) for scenario in (scenarios or range(6))]
+        return strategy_optimizer.TestSuiteResult(profitabilities, [1] * len(profitabilities), risk,
+                                                  config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+                                                  list(evaluators), strategy_name), set()
+
+    optimizer_kwargs = {"TAs": list(evaluators_weights), "time_frames": [commons_enums.TimeFrames.ONE_HOUR],
+                        "risks": [0.5, 1]}
+    with mock.patch.object(builtins, "print", mock.Mock()):
+        with mock.patch.object(strategy_optimizer, "run_test_suite",
+                               mock.Mock(side_effect=_run_test_suite)) as run_test_suite_mock:
+            optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                             test_utils_config.load_test_tentacles_config(),
+                                                             strategy_name)
+            optimizer.find_optimal_configuration(racing=True, **optimizer_kwargs)
+            surviving_configurations_count = len([call for call in run_test_suite_mock.call_args_list
+                                                  if call.kwargs["scenarios"] == [5]])
+        with mock.patch.object(strategy_optimizer, "run_test_suite",
+                               mock.Mock(side_effect=_run_traders_test_suites(_run_test_suite))):
+            full_optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                                  test_utils_config.load_test_tentacles_config(),
+                                                                  strategy_name)
+            full_optimizer.find_optimal_configuration(**optimizer_kwargs)
+    assert 0 < surviving_configurations_count < optimizer.total_nb_runs
+    # eliminated configurations partial scores are never ranked before the configurations which ran every scenario
+    assert optimizer.get_report()[:surviving_configurations_count] == \
+        full_optimizer.get_report()[:surviving_configurations_count]
+
+def test_find_optimal_configuration_monte_carlo():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+
+    def _run_test_suite(config, tentacles_setup_config, strategy_class, evaluators, synthetic_market_path=None, **_):
+        risk = config[commons_constants.CONFIG_TRADING][commons_constants.CONFIG_TRADER_RISK]
+        score = risk if synthetic_market_path is None else synthetic_market_path.index - risk
+        return strategy_optimizer.TestSuiteResult([(score, 0)], [1], risk,
+                                                  config[evaluator_constants.CONFIG_FORCED_TIME_FRAME],
+                                                  list(evaluators), strategy_name), set()
+
+    with mock.patch.object(concurrent.futures, "ProcessPoolExecutor", ThreadPoolExecutorMock), \
+         mock.patch.object(strategy_optimizer, "run_test_suite",
+                           mock.Mock(side_effect=_run_traders_test_suites(_run_test_suite))) \
+            as run_test_suite_mock, \
+         mock.patch.object(builtins, "print", mock.Mock()):
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        optimizer.find_optimal_configuration(risks=[0.5, 1], workers=2, monte_carlo_paths=3)
+        synthetic_paths_calls = [call for call in run_test_suite_mock.call_args_list
+                                 if call.kwargs["synthetic_market_path"] is not None]
+        assert len(synthetic_paths_calls) == constants.OPTIMIZER_MONTE_CARLO_CONFIGURATIONS_COUNT * 3
+        assert sorted(set(call.kwargs["synthetic_market_path"].index for call in synthetic_paths_calls)) == [0, 1, 2]
+    report = optimizer.monte_carlo_simulator.get_report()
+    assert len(report) == constants.OPTIMIZER_MONTE_CARLO_CONFIGURATIONS_COUNT
+    # configurations are ranked by their mean score on the synthetic paths
+    assert report[0][0].risk == 0.5
+    assert report[0][1]["mean"] == 0.5
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="processes can't be forked on Windows")
+def test_find_optimal_configuration_fork_server():
+    strategy_name = tentacles_strategies.SimpleStrategyEvaluator.get_name()
+    with mock.patch.object(strategy_optimizer, "run_test_suite",
+                           mock.Mock(return_value=(StrategyTestSuiteMock().get_test_suite_result(), {"error"}))) \
+            as run_test_suite_mock, \
+         mock.patch.object(builtins, "print", mock.Mock()):
+        optimizer = strategy_optimizer.StrategyOptimizer(test_config.load_test_config(),
+                                                         test_utils_config.load_test_tentacles_config(),
+                                                         strategy_name)
+        optimizer.find_optimal_configuration(workers=2, fork_server=True)
+        assert len(optimizer.run_results) == optimizer.total_nb_runs
+        assert optimizer.errors == {"error"}
+        # only the first run is executed in this process, the other ones are executed in forked processes
+        run_test_suite_mock.assert_called_once()
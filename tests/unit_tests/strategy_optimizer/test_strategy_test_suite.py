@@ -13,11 +13,18 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import os
 import mock
 import builtins
 import pytest
 
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+import octobot_evaluators.constants as evaluator_constants
+import octobot_trading.api as trading_api
+import octobot.api.backtesting as octobot_backtesting_api
 import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.strategy_test_suite as strategy_test_suite
 
 # All test coroutines will be treated as marked.
 pytestmark = pytest.mark.asyncio
@@ -27,6 +34,8 @@ class StrategyTestSuiteMock(strategy_optimizer.StrategyTestSuite, mock.Mock):
     def __init__(self, *args, **kwargs):
         super(strategy_optimizer.StrategyTestSuite, self).__init__(*args, **kwargs)
         super(mock.Mock, self).__init__(*args, **kwargs)
+        # initialize the test suite state instead of using mock attributes
+        strategy_optimizer.StrategyTestSuite.__init__(self)
         self.logger = mock.Mock()
         self.test_slow_downtrend = mock.AsyncMock()
         self.test_sharp_downtrend = mock.AsyncMock()
@@ -53,3 +62,109 @@ async def test_run_test_suite():
         test_suite.logger.exception.assert_called_once()
         # once for each call and one for the beginning and the end
         assert print_mock.call_count == len(calls) + 2
+
+
+async def test_run_test_suite_scenarios():
+    test_suite = StrategyTestSuiteMock()
+    with mock.patch.object(builtins, "print", mock.Mock()):
+        assert await test_suite.run_test_suite(mock.Mock(), scenarios=[1, 3]) is True
+    test_suite.test_sharp_downtrend.assert_called_once()
+    test_suite.test_slow_uptrend.assert_called_once()
+    for call in (test_suite.test_slow_downtrend, test_suite.test_flat_markets, test_suite.test_sharp_uptrend,
+                 test_suite.test_up_then_down):
+        call.assert_not_called()
+    assert test_suite.current_progress == 100
+
+async def test_run_and_handle_results_with_results_cache(tmp_path):
+    test_suite = StrategyTestSuiteMock()
+    test_suite.results_cache = strategy_optimizer.OptimizerResultsCache(os.path.join(tmp_path, "cache"))
+    data_file = os.path.join(tmp_path, "scenario.data")
+    with open(data_file, "w") as file:
+        file.write("data")
+
+    def _handle_results(*_):
+        test_suite._profitability_results.append((5, 2))
+        test_suite._trades_counts.append(3)
+
+    with mock.patch.object(test_suite, "_get_run_fingerprint", mock.Mock(return_value="fingerprint")), \
+         mock.patch.object(test_suite, "_run_backtesting_with_current_config",
+                           mock.AsyncMock(return_value=None)) as run_backtesting_mock, \
+         mock.patch.object(test_suite, "_handle_results", mock.Mock(side_effect=_handle_results)):
+        await test_suite._run_and_handle_results(data_file, None)
+        run_backtesting_mock.assert_called_once()
+        # cache hit: backtesting is skipped
+        await test_suite._run_and_handle_results(data_file, None)
+        run_backtesting_mock.assert_called_once()
+        assert test_suite._profitability_results == [(5, 2), (5, 2)]
+        assert test_suite._trades_counts == [3, 3]
+
+
+async def test_run_batched_data_files():
+    test_suite = StrategyTestSuiteMock()
+    test_suite.batch_data_files = True
+    exchange_names = {"a.data": "binance", "b.data": "binance", "c.data": "bittrex"}
+    with mock.patch.object(test_suite, "_get_exchange_name", mock.AsyncMock(side_effect=exchange_names.get)), \
+         mock.patch.object(test_suite, "_run_and_handle_batched_results",
+                           mock.AsyncMock(return_value=True)) as run_batched_mock, \
+         mock.patch.object(test_suite, "_run_or_get_cached_results", mock.AsyncMock()) as run_mock:
+        for data_file in exchange_names:
+            await test_suite._run_and_handle_results(data_file, None)
+        # data files are only run once every scenario data file is known
+        run_batched_mock.assert_not_called()
+        run_mock.assert_not_called()
+        await test_suite._run_batched_data_files()
+        run_batched_mock.assert_called_once_with(["a.data", "c.data"], [None, None])
+        # single data file batch
+        run_mock.assert_called_once_with("b.data", None)
+        assert test_suite.current_progress == 100
+        run_mock.reset_mock()
+        # not started batch: data files are run one by one
+        run_batched_mock.return_value = False
+        await test_suite._run_batched_data_files()
+        assert run_mock.call_args_list == [mock.call("a.data", None), mock.call("c.data", None),
+                                           mock.call("b.data", None)]
+
+
+def test_get_data_files_batches():
+    assert strategy_test_suite.get_data_files_batches(
+        ["a", "b", "c", "d", "e"], ["binance", "binance", "bittrex", None, "bittrex"]
+    ) == [["a", "c"], ["b", "e"], ["d"]]
+    # data files of a same exchange never share a backtesting
+    assert strategy_test_suite.get_data_files_batches(
+        ["a", "b", "c", "d"], ["binance", "binance", "binance", "bittrex"]
+    ) == [["a", "d"], ["b"], ["c"]]
+    assert strategy_test_suite.get_data_files_batches([], []) == []
+
+
+def test_handle_results_with_traders_risks():
+    test_suite = StrategyTestSuiteMock()
+    test_suite.config = {
+        commons_constants.CONFIG_TRADING: {commons_constants.CONFIG_TRADER_RISK: 0.5},
+        evaluator_constants.CONFIG_FORCED_TIME_FRAME: [commons_enums.TimeFrames.ONE_HOUR]
+    }
+    test_suite.strategy_evaluator_class = mock.Mock(get_name=mock.Mock(return_value="Strategy"))
+    test_suite.evaluators = ["Strategy", "Evaluator"]
+    test_suite.traders_risks = [0.5, 1]
+    test_suite._other_traders_results = [([], [])]
+    # each trader has its own exchange manager on the shared backtesting
+    profitabilities = {"trader_1": 2, "trader_2": 5}
+    trades = {"trader_1": [1], "trader_2": [1, 2, 3]}
+    with mock.patch.object(octobot_backtesting_api, "get_independent_backtesting_traders_exchange_manager_ids",
+                           mock.Mock(return_value=[["trader_1"], ["trader_2"]])), \
+         mock.patch.object(octobot_backtesting_api, "get_independent_backtesting_abort_reason",
+                           mock.Mock(return_value=None)), \
+         mock.patch.object(trading_api, "get_exchange_managers_from_exchange_ids", mock.Mock(side_effect=list)), \
+         mock.patch.object(trading_api, "get_profitability_stats",
+                           mock.Mock(side_effect=lambda trader: (0, profitabilities[trader], 0, 1, 0))), \
+         mock.patch.object(trading_api, "get_trade_history", mock.Mock(side_effect=trades.get)):
+        test_suite._handle_results(mock.Mock(), None)
+        test_suite._handle_results(mock.Mock(), None)
+    first_trader_result, second_trader_result = test_suite.get_traders_test_suite_results()
+    assert first_trader_result.risk == 0.5
+    assert first_trader_result.run_profitabilities == [(2, 1), (2, 1)]
+    assert first_trader_result.trades_counts == [1, 1]
+    assert second_trader_result.risk == 1
+    assert second_trader_result.run_profitabilities == [(5, 1), (5, 1)]
+    assert second_trader_result.trades_counts == [3, 3]
+    assert second_trader_result.evaluators == first_trader_result.evaluators
+    assert second_trader_result.time_frames == first_trader_result.time_frames
@@ -0,0 +1,51 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import os
+
+import octobot_tentacles_manager.configuration as tentacles_manager_configuration
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+
+def test_get_tentacles_settings_setup_config(tmp_path):
+    specific_config_folder = os.path.join(tmp_path, "user", "specific_config")
+    os.makedirs(specific_config_folder)
+    rsi_config_file = os.path.join(specific_config_folder, "RSIMomentumEvaluator.json")
+    with open(rsi_config_file, "w") as config_file:
+        json.dump({"period_length": 14, "long_threshold": 30}, config_file)
+    tentacles_setup_config = tentacles_manager_configuration.TentaclesSetupConfiguration(
+        config_path=os.path.join(tmp_path, "user", "tentacles_config.json"))
+    settings_folder = os.path.join(tmp_path, "settings")
+
+    settings_setup_config = strategy_optimizer.get_tentacles_settings_setup_config(
+        tentacles_setup_config, {"RSIMomentumEvaluator": {"period_length": 21}}, settings_folder)
+    assert settings_setup_config is not tentacles_setup_config
+    assert settings_setup_config.get_config_folder() != tentacles_setup_config.get_config_folder()
+    with open(os.path.join(settings_setup_config.get_config_folder(), "specific_config",
+                           "RSIMomentumEvaluator.json")) as config_file:
+        assert json.load(config_file) == {"period_length": 21, "long_threshold": 30}
+    # tentacles configuration files are never modified
+    with open(rsi_config_file) as config_file:
+        assert json.load(config_file) == {"period_length": 14, "long_threshold": 30}
+    # identical settings share their folder
+    assert strategy_optimizer.get_tentacles_settings_setup_config(
+        tentacles_setup_config, {"RSIMomentumEvaluator": {"period_length": 21}}, settings_folder
+    ).config_path == settings_setup_config.config_path
+    assert len(os.listdir(settings_folder)) == 1
+    strategy_optimizer.get_tentacles_settings_setup_config(
+        tentacles_setup_config, {"RSIMomentumEvaluator": {"period_length": 28}}, settings_folder)
+    assert len(os.listdir(settings_folder)) == 2
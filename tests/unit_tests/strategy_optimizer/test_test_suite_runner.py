@@ -0,0 +1,55 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import mock
+
+import octobot.strategy_optimizer as strategy_optimizer
+
+
+class StrategyTestSuiteMock(mock.Mock):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.exceptions = []
+        self.loops = []
+        self.pending_tasks = []
+
+    async def run_test_suite(self, _, scenarios=None):
+        self.loops.append(asyncio.get_event_loop())
+        # simulate a task left behind by the run
+        self.pending_tasks.append(asyncio.create_task(asyncio.sleep(10)))
+        return True
+
+    def get_test_suite_result(self):
+        return strategy_optimizer.TestSuiteResult([(1, 0)], [1], 1, [], ["strategy"], "strategy")
+
+
+def test_run_test_suite_reuses_event_loop():
+    test_suite = StrategyTestSuiteMock()
+    try:
+        for _ in range(2):
+            result, errors = strategy_optimizer.run_test_suite({}, None, None, ["strategy"], test_suite=test_suite)
+            assert errors == set()
+            assert result.overhead_time >= 0
+        assert len(test_suite.loops) == 2
+        assert test_suite.loops[0] is test_suite.loops[1]
+        assert test_suite.loops[0] is strategy_optimizer.get_event_loop()
+        # tasks left by each run are cleaned after the run
+        assert all(task.cancelled() for task in test_suite.pending_tasks)
+    finally:
+        strategy_optimizer.close_event_loop()
+    assert test_suite.loops[0].is_closed()
+    assert strategy_optimizer.get_event_loop() is not test_suite.loops[0]
+    strategy_optimizer.close_event_loop()
@@ -0,0 +1,98 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot.strategy_optimizer as strategy_optimizer
+import octobot.strategy_optimizer.walk_forward_optimizer as walk_forward_optimizer
+
+STRATEGY = "Strategy"
+
+
+def _result(run_config, score):
+    return strategy_optimizer.TestSuiteResult([(score, 0)], [1], run_config.risk, run_config.get_time_frames_config(),
+                                              list(run_config.evaluators) + [STRATEGY], STRATEGY)
+
+
+def test_get_walk_forward_windows():
+    windows = strategy_optimizer.get_walk_forward_windows(4)
+    assert [window.get_time_range(0, 100) for window in windows] == [(0, 25), (25, 50), (50, 75), (75, 100)]
+    windows = strategy_optimizer.get_walk_forward_windows(2, start_timestamp=1000, end_timestamp=2000)
+    assert [window.get_time_range(0, 5000) for window in windows] == [(1000, 1500), (1500, 2000)]
+    with pytest.raises(RuntimeError):
+        strategy_optimizer.get_walk_forward_windows(1)
+
+
+def test_get_report():
+    one_hour = commons_enums.TimeFrames.ONE_HOUR
+    run_configs = [strategy_optimizer.RunConfiguration(1, [f"TA{i}"], [one_hour]) for i in range(3)]
+    optimizer = strategy_optimizer.WalkForwardOptimizer({}, None, STRATEGY, windows_count=3)
+    optimizer.windows_results = [
+        {run_config: _result(run_config, index) for index, run_config in enumerate(run_configs)},
+        {run_config: _result(run_config, -index) for index, run_config in enumerate(run_configs)},
+    ]
+    # only the selected configurations ran on the next window
+    optimizer.out_of_sample_results = [
+        {run_config: _result(run_config, -index) for index, run_config in enumerate(run_configs[1:], 1)},
+        {run_config: _result(run_config, 10 * index) for index, run_config in enumerate(run_configs[:2])},
+    ]
+    report = optimizer.get_report()
+    assert len(report) == 2
+    assert [result[strategy_optimizer.TestSuiteResult.EVALUATORS] for result in report[0]] == \
+        [["TA2"], ["TA1"], ["TA0"]]
+    assert [(result[walk_forward_optimizer.IN_SAMPLE_SCORE], result[walk_forward_optimizer.OUT_OF_SAMPLE_SCORE])
+            for result in report[0]] == [(2, -2), (1, -1), (0, None)]
+    assert [(result[walk_forward_optimizer.IN_SAMPLE_SCORE], result[walk_forward_optimizer.OUT_OF_SAMPLE_SCORE])
+            for result in report[1]] == [(0, 0), (-1, 10), (-2, None)]
+    assert all(result[walk_forward_optimizer.STEP] == 1 for result in report[1])
+
+
+def test_run():
+    one_hour = commons_enums.TimeFrames.ONE_HOUR
+    run_configs = [strategy_optimizer.RunConfiguration(1, [f"TA{i}"], [one_hour]) for i in range(4)]
+    windows = strategy_optimizer.get_walk_forward_windows(3)
+
+    def _optimize_window(config, tentacles_setup_config, strategy_name, backtesting_window, optimizer_kwargs):
+        # best in-sample configurations change with each window
+        offset = windows.index(backtesting_window)
+        return {run_config: _result(run_config, (index + offset) % len(run_configs))
+                for index, run_config in enumerate(run_configs)}
+
+    def _backtest_window_configurations(config, tentacles_setup_config, strategy_name, backtesting_window,
+                                        selected_run_configs):
+        return {run_config: _result(run_config, -windows.index(backtesting_window))
+                for run_config in selected_run_configs}
+
+    optimizer = strategy_optimizer.WalkForwardOptimizer({}, None, STRATEGY, windows=windows,
+                                                        selected_configurations_count=2)
+    with mock.patch.object(walk_forward_optimizer, "optimize_window",
+                           mock.Mock(side_effect=_optimize_window)) as optimize_window_mock, \
+            mock.patch.object(walk_forward_optimizer, "backtest_window_configurations",
+                              mock.Mock(side_effect=_backtest_window_configurations)) as backtest_mock:
+        optimizer.run(workers=1, racing=True)
+    # the last window is only used out-of-sample
+    assert [call.args[3] for call in optimize_window_mock.call_args_list] == windows[:2]
+    assert all(call.args[4] == {"racing": True} for call in optimize_window_mock.call_args_list)
+    # the best configurations of each window are explicitly backtested on the next window
+    assert [(call.args[3], call.args[4]) for call in backtest_mock.call_args_list] == [
+        (windows[1], [run_configs[3], run_configs[2]]),
+        (windows[2], [run_configs[2], run_configs[1]]),
+    ]
+    report = optimizer.get_report()
+    assert [[result[walk_forward_optimizer.OUT_OF_SAMPLE_SCORE] for result in step_report]
+            for step_report in report] == [[-1, -1, None, None], [-2, -2, None, None]]